@@ -1,19 +1,36 @@
-from .exceptions import DjangoTestcontainersError, MissingDependencyError
+from typing import Any
+
+from .async_manager import AsyncContainerManager
+from .exceptions import DjangoTestcontainersError, ImageUnavailableError, MissingDependencyError
+from .fixtures import FixtureSnapshotMixin, load_fixtures
 from .manager import ContainerManager
-from .providers import ContainerProvider, PostgresProvider
+from .providers import ContainerProvider
 from .runner import TestcontainersRunner
 
 __version__ = "0.1.1"
 
 __all__ = [
+    "AsyncContainerManager",
     "ContainerManager",
     "ContainerProvider",
+    "FixtureSnapshotMixin",
     "PostgresProvider",
     "TestcontainersRunner",
     "DjangoTestcontainersError",
     "MissingDependencyError",
+    "ImageUnavailableError",
+    "load_fixtures",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    if name == "PostgresProvider":
+        from .providers import PostgresProvider
+
+        return PostgresProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # try:
 #     from .providers import MySQLProvider
 #
@@ -0,0 +1,102 @@
+import asyncio
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any, TypeVar
+
+from testcontainers.core.generic import DockerContainer
+
+from .manager import ContainerManager
+
+T = TypeVar("T")
+
+
+class AsyncContainerManager:
+    """Asyncio API for :class:`ContainerManager`.
+
+    Docker and database calls block, so each operation runs the synchronous
+    manager in a worker thread and the event loop stays free for other setup
+    work meanwhile. Within an operation containers are still started
+    concurrently, as with the ``parallel`` option. Operations on one manager
+    run one at a time.
+
+    Cancelling an awaiting task does not stop the worker thread; containers it
+    starts are still stopped by :meth:`stop_containers`.
+
+    Usage:
+        async with AsyncContainerManager(settings) as manager:
+            ...
+    """
+
+    def __init__(self, settings: Any = None, manager: ContainerManager | None = None):
+        """Initialize the manager.
+
+        Args:
+            settings: Django settings module, ignored if ``manager`` is given
+            manager: Synchronous manager to drive, one is created for
+                ``settings`` if None
+        """
+        self.manager = manager if manager is not None else ContainerManager(settings)
+        self._lock = asyncio.Lock()
+
+    @property
+    def active_containers(self) -> dict[str, DockerContainer]:
+        """Running containers, keyed by container name."""
+        return self.manager.active_containers
+
+    @property
+    def settings_updates(self) -> dict[str, Any]:
+        """Settings updates of every container started so far."""
+        return self.manager.settings_updates
+
+    async def start_containers(self, lazy: bool | None = None) -> dict[str, Any]:
+        """Start all needed containers without blocking the event loop.
+
+        Args:
+            lazy: Override the ``lazy`` option
+
+        Returns:
+            Dict of settings updates to apply
+        """
+        return await self._run(self.manager.start_containers, lazy)
+
+    async def start_lazy(self, resource: str) -> dict[str, Any]:
+        """Start the containers deferred until ``resource`` is first used.
+
+        Args:
+            resource: Lazy resource name, such as ``"databases"`` or ``"caches"``
+
+        Returns:
+            Dict of settings updates for the started containers
+        """
+        return await self._run(self.manager.start_lazy, resource)
+
+    async def reset_between_tests(self) -> None:
+        """Clear container state between tests, such as flushing Redis databases."""
+        await self._run(self.manager.reset_between_tests)
+
+    async def stop_containers(self, wait: bool | None = None) -> None:
+        """Stop all active containers without blocking the event loop.
+
+        Args:
+            wait: Override the ``background_teardown`` option
+        """
+        await self._run(self.manager.stop_containers, wait)
+
+    async def __aenter__(self) -> "AsyncContainerManager":
+        """Start the containers; their settings updates are in ``settings_updates``."""
+        await self.start_containers()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop the containers."""
+        await self.stop_containers()
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking manager method in a worker thread, one at a time."""
+        async with self._lock:
+            return await asyncio.to_thread(func, *args)
@@ -0,0 +1,114 @@
+import hashlib
+from typing import TYPE_CHECKING, Any
+
+import docker
+
+from .fingerprint import database_fingerprint
+from .providers import ContainerProvider
+from .reuse import config_hash
+from .templates import get_fixtures, template_key
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+BAKE_REPOSITORY = "django-testcontainers-plus"
+
+
+def bake_tag(provider: ContainerProvider, config: dict[str, Any], fingerprint: str) -> str:
+    """Build the image tag for a baked provider image.
+
+    Args:
+        provider: Provider the image is baked for
+        config: Effective provider configuration, with the base image
+        fingerprint: Hash of the migration and fixture files
+
+    Returns:
+        Local image reference such as ``django-testcontainers-plus/postgres:<hash>``
+    """
+    payload = f"{fingerprint}:{config_hash(provider.name, config)}"
+    digest = hashlib.sha256(payload.encode()).hexdigest()
+    return f"{BAKE_REPOSITORY}/{provider.name}:{digest[:16]}"
+
+
+def baked_image_exists(client: docker.DockerClient, tag: str) -> bool:
+    """Check whether a baked image is available locally.
+
+    Args:
+        client: Docker client
+        tag: Tag from :func:`bake_tag`
+
+    Returns:
+        True if the image exists
+    """
+    try:
+        client.images.get(tag)
+    except docker.errors.ImageNotFound:
+        return False
+    return True
+
+
+def bake_images(manager: "ContainerManager", verbosity: int = 1) -> dict[str, str]:
+    """Bake migrated (and optionally fixture-loaded) images for providers with ``bake`` set.
+
+    For each provider, a container is started with its data directory inside
+    the container filesystem. Every alias it serves is migrated, the
+    configured fixtures are loaded and the result is saved as a template
+    database. The server is then stopped cleanly and committed to a local
+    image tagged with :func:`bake_tag`.
+
+    Django settings are pointed at the baking containers, so this is meant to
+    run in a dedicated process such as ``django-testcontainers bake``.
+
+    Args:
+        manager: Manager for the Django settings to bake
+        verbosity: Verbosity passed on to Django's database creation
+
+    Returns:
+        Dict of provider name to the baked image tag
+    """
+    from django.core.management import call_command
+    from django.db import connections
+
+    baked: dict[str, str] = {}
+
+    for provider in manager.detect_needed_containers():
+        config = manager.get_provider_config(provider)
+        if not config.get("bake"):
+            continue
+
+        fixtures = get_fixtures(config)
+        fingerprint = database_fingerprint(fixtures)
+        tag = bake_tag(provider, config, fingerprint)
+
+        container = provider.get_container(config)
+        provider.prepare_for_commit(container, config)
+        container.start()
+
+        try:
+            updates = provider.update_settings(container, manager.settings, config)
+            databases = updates.get("DATABASES", {})
+            manager.settings.DATABASES = {**manager.settings.DATABASES, **databases}
+
+            for alias in databases:
+                connection = connections[alias]
+                connection.creation.create_test_db(
+                    verbosity=verbosity, autoclobber=True, keepdb=False
+                )
+                if fixtures:
+                    call_command("loaddata", *fixtures, database=alias, verbosity=verbosity)
+                provider.save_template_database(
+                    connection, config, template_key(provider, config, alias, fingerprint)
+                )
+                connection.close()
+
+            # Stop the server cleanly so the committed data directory is consistent
+            wrapped = container.get_wrapped_container()
+            wrapped.stop(timeout=60)
+            repository, tag_name = tag.rsplit(":", 1)
+            wrapped.commit(repository=repository, tag=tag_name)
+        finally:
+            container.stop()
+
+        baked[provider.name] = tag
+
+    return baked
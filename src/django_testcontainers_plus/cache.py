@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+CACHE_DIR_ENV = "DJANGO_TESTCONTAINERS_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    """Get the directory used for state kept between test sessions.
+
+    Uses ``$DJANGO_TESTCONTAINERS_CACHE_DIR`` when set, otherwise
+    ``$XDG_CACHE_HOME/django-testcontainers-plus`` (``~/.cache`` by default).
+
+    Returns:
+        Path to the cache directory, created if missing
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        path = Path(override)
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        path = Path(base) / "django-testcontainers-plus"
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def read_json(name: str) -> dict[str, Any]:
+    """Read a JSON state file from the cache directory.
+
+    Args:
+        name: File name inside the cache directory
+
+    Returns:
+        Parsed contents, empty if the file is missing or unreadable
+    """
+    try:
+        data = json.loads((get_cache_dir() / name).read_text())
+    except (OSError, ValueError):
+        return {}
+
+    return data if isinstance(data, dict) else {}
+
+
+def write_json(name: str, data: dict[str, Any]) -> None:
+    """Atomically write a JSON state file to the cache directory.
+
+    Args:
+        name: File name inside the cache directory
+        data: JSON-serialisable contents
+    """
+    cache_dir = get_cache_dir()
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f".{name}.")
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, cache_dir / name)
@@ -0,0 +1,269 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections.abc import Sequence
+
+from testcontainers.core.docker_client import DockerClient
+
+from .exceptions import DjangoTestcontainersError
+from .reuse import ReusableContainer, list_reusable_containers, prune_reusable_containers
+
+
+def _format_age(timestamp: float | None) -> str:
+    """Format the time since a timestamp as a short human readable string."""
+    if timestamp is None:
+        return "-"
+
+    seconds = int(time.time() - timestamp)
+    for unit, size in (("d", 86400), ("h", 3600), ("m", 60)):
+        if seconds >= size:
+            return f"{seconds // size}{unit}"
+    return f"{seconds}s"
+
+
+def _print_containers(containers: list[ReusableContainer]) -> None:
+    """Print reusable containers as a table."""
+    rows = [("ID", "PROVIDER", "IMAGE", "STATUS", "CREATED", "LAST USED")]
+    rows.extend(
+        (
+            c.id[:12],
+            c.provider,
+            c.image,
+            c.status,
+            _format_age(c.created),
+            _format_age(c.last_used),
+        )
+        for c in containers
+    )
+
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print(
+            "  ".join(value.ljust(width) for value, width in zip(row, widths, strict=True)).rstrip()
+        )
+
+
+def cmd_list(args: argparse.Namespace) -> int:
+    """List reusable containers."""
+    _print_containers(list_reusable_containers(DockerClient().client))
+    return 0
+
+
+def cmd_prune(args: argparse.Namespace) -> int:
+    """Remove stopped, expired or all reusable containers."""
+    removed = prune_reusable_containers(
+        DockerClient().client,
+        ttl=args.ttl,
+        idle_timeout=args.idle,
+        prune_all=args.all,
+    )
+    for container in removed:
+        print(f"Removed {container.provider} container {container.id[:12]}")
+    print(f"{len(removed)} container(s) removed")
+    return 0
+
+
+def _setup_django(args: argparse.Namespace) -> None:
+    """Configure Django from ``--settings`` or ``DJANGO_SETTINGS_MODULE``."""
+    import django
+
+    if args.settings:
+        os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    django.setup()
+
+
+def cmd_bake(args: argparse.Namespace) -> int:
+    """Bake migrated database images for providers with ``bake`` configured."""
+    _setup_django(args)
+
+    from django.conf import settings
+
+    from .bake import bake_images
+    from .manager import ContainerManager
+
+    baked = bake_images(ContainerManager(settings), verbosity=args.verbosity)
+    if not baked:
+        print("No providers have 'bake' configured in TESTCONTAINERS")
+    for provider_name, tag in baked.items():
+        print(f"Baked {provider_name} image {tag}")
+    return 0
+
+
+def cmd_prefetch(args: argparse.Namespace) -> int:
+    """Pull the images needed by the Django settings, concurrently."""
+    _setup_django(args)
+
+    from django.conf import settings
+
+    from .images import needed_images, prefetch_images
+    from .manager import ContainerManager
+
+    images = [*needed_images(ContainerManager(settings)).values(), *args.images]
+    if not images:
+        print("No container images are needed by these settings")
+        return 0
+
+    resolved = prefetch_images(
+        DockerClient().client, images, refresh=args.refresh, image_dir=args.image_dir
+    )
+    for info in resolved.values():
+        if info.source == "registry":
+            print(f"Pulled {info.image} ({info.id[:19]}) in {info.seconds:.1f}s")
+        elif info.source == "tarball":
+            print(f"Loaded {info.image} ({info.id[:19]}) in {info.seconds:.1f}s")
+        else:
+            print(f"Cached {info.image} ({info.id[:19]})")
+    return 0
+
+
+def cmd_save(args: argparse.Namespace) -> int:
+    """Save the images needed by the Django settings as tarballs for offline runs."""
+    _setup_django(args)
+
+    from django.conf import settings
+    from testcontainers.core.config import testcontainers_config
+
+    from .images import needed_images, prefetch_images, save_images
+    from .manager import ContainerManager
+
+    images = [
+        *needed_images(ContainerManager(settings)).values(),
+        testcontainers_config.ryuk_image,
+        *args.images,
+    ]
+    client = DockerClient().client
+    prefetch_images(client, images)
+
+    for image, path in save_images(client, images, args.output).items():
+        print(f"Saved {image} to {path}")
+    return 0
+
+
+def cmd_remove(args: argparse.Namespace) -> int:
+    """Remove containers by id, as the background teardown process does."""
+    from .teardown import log_to_file, remove_containers
+
+    if args.log:
+        log_to_file()
+    failed = remove_containers(args.ids)
+    for container_id in failed:
+        print(f"Could not remove container {container_id[:12]}")
+    return 1 if failed else 0
+
+
+def cmd_plan(args: argparse.Namespace) -> int:
+    """Print the startup plan for the Django settings."""
+    _setup_django(args)
+
+    from django.conf import settings
+
+    from .manager import ContainerManager
+
+    plan = ContainerManager(settings).get_plan()
+    if args.json:
+        print(json.dumps(plan.as_dict(), indent=2, sort_keys=True, default=repr))
+        return 0
+
+    source = "cached" if plan.cached else "built from settings"
+    print(f"Plan {plan.key[:12] if plan.key else '(not cacheable)'}, {source}")
+    print(plan.format_table())
+    for name, container in plan.containers.items():
+        print(f"Reuses {name} container {container.id[:12]}, settings updates:")
+        print(json.dumps(container.updates, indent=2, sort_keys=True, default=repr))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        prog="django-testcontainers",
+        description="Manage containers created by django-testcontainers-plus.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="List reusable containers")
+    list_parser.set_defaults(func=cmd_list)
+
+    prune_parser = subparsers.add_parser(
+        "prune", help="Remove stopped, expired or all reusable containers"
+    )
+    prune_parser.add_argument("--all", action="store_true", help="Remove every reusable container")
+    prune_parser.add_argument(
+        "--ttl",
+        type=float,
+        help="Remove containers created more than SECONDS ago",
+        metavar="SECONDS",
+    )
+    prune_parser.add_argument(
+        "--idle", type=float, help="Remove containers not used for SECONDS", metavar="SECONDS"
+    )
+    prune_parser.set_defaults(func=cmd_prune)
+
+    bake_parser = subparsers.add_parser(
+        "bake", help="Bake migrated database images for providers with 'bake' configured"
+    )
+    bake_parser.add_argument("--settings", help="Django settings module to use")
+    bake_parser.add_argument(
+        "-v", "--verbosity", type=int, default=1, help="Django verbosity level (default: 1)"
+    )
+    bake_parser.set_defaults(func=cmd_bake)
+
+    prefetch_parser = subparsers.add_parser(
+        "prefetch", help="Pull the container images needed by the Django settings"
+    )
+    prefetch_parser.add_argument("--settings", help="Django settings module to use")
+    prefetch_parser.add_argument(
+        "--refresh", action="store_true", help="Pull images even if present locally"
+    )
+    prefetch_parser.add_argument(
+        "--image-dir", help="Load missing images from 'docker save' tarballs in this directory"
+    )
+    prefetch_parser.add_argument("images", nargs="*", help="Additional images to pull")
+    prefetch_parser.set_defaults(func=cmd_prefetch)
+
+    save_parser = subparsers.add_parser(
+        "save", help="Save the container images needed by the Django settings as tarballs"
+    )
+    save_parser.add_argument("--settings", help="Django settings module to use")
+    save_parser.add_argument(
+        "--output", required=True, help="Directory to write the tarballs to", metavar="DIR"
+    )
+    save_parser.add_argument("images", nargs="*", help="Additional images to save")
+    save_parser.set_defaults(func=cmd_save)
+
+    plan_parser = subparsers.add_parser(
+        "plan", help="Show which containers the Django settings will start, and how"
+    )
+    plan_parser.add_argument("--settings", help="Django settings module to use")
+    plan_parser.add_argument("--json", action="store_true", help="Print the plan as JSON")
+    plan_parser.set_defaults(func=cmd_plan)
+
+    remove_parser = subparsers.add_parser(
+        "remove", help="Remove containers and their volumes by id, concurrently"
+    )
+    remove_parser.add_argument(
+        "--log", action="store_true", help="Log to teardown.log in the cache directory"
+    )
+    remove_parser.add_argument("ids", nargs="+", help="Container ids")
+    remove_parser.set_defaults(func=cmd_remove)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface.
+
+    Args:
+        argv: Arguments to parse, defaults to ``sys.argv[1:]``
+
+    Returns:
+        Process exit code
+    """
+    args = build_parser().parse_args(argv)
+    try:
+        return int(args.func(args))
+    except DjangoTestcontainersError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
@@ -0,0 +1,303 @@
+import inspect
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+
+@dataclass
+class PlannedDatabase:
+    """A test database created ahead of Django's own, serial setup."""
+
+    # Alias Django would create the database through
+    alias: str
+    # All aliases sharing the database
+    aliases: list[str]
+    # Aliases whose databases must exist first (``TEST['DEPENDENCIES']``)
+    dependencies: set[str]
+    # (HOST, PORT) of the server the database lives on
+    server: tuple[str, str]
+
+
+def plan_concurrent_databases(
+    manager: "ContainerManager", aliases: set[str] | None = None
+) -> list[PlannedDatabase]:
+    """Find the test databases that can be created concurrently.
+
+    Only databases served by a running container are planned, and only when
+    every database they depend on is planned too. Dependencies follow
+    Django's rules: ``TEST['DEPENDENCIES']`` if set, otherwise every database
+    other than ``default`` depends on ``default``.
+
+    Args:
+        manager: Manager with running containers
+        aliases: Aliases Django was asked to set up, all if None
+
+    Returns:
+        Planned databases in dependency order
+    """
+    from django.db import DEFAULT_DB_ALIAS, connections
+    from django.test.utils import get_unique_databases_and_mirrors
+
+    test_databases, _ = get_unique_databases_and_mirrors(aliases)
+    container_aliases = set(manager.get_database_providers())
+    default_signature = connections[DEFAULT_DB_ALIAS].creation.test_db_signature()
+
+    planned: list[PlannedDatabase] = []
+    covered: set[str] = set()
+
+    for signature, (_, group) in test_databases.items():
+        dependencies: set[str] = set()
+        for alias in group:
+            test_settings = connections[alias].settings_dict["TEST"]
+            if "DEPENDENCIES" in test_settings:
+                dependencies.update(test_settings["DEPENDENCIES"])
+            elif alias != DEFAULT_DB_ALIAS and signature != default_signature:
+                dependencies.add(DEFAULT_DB_ALIAS)
+
+        if group[0] not in container_aliases or not dependencies <= covered:
+            continue
+
+        settings_dict = connections[group[0]].settings_dict
+        planned.append(
+            PlannedDatabase(
+                group[0],
+                list(group),
+                dependencies,
+                (str(settings_dict.get("HOST", "")), str(settings_dict.get("PORT", ""))),
+            )
+        )
+        covered.update(group)
+
+    return planned
+
+
+def create_databases_concurrently(
+    planned: list[PlannedDatabase], verbosity: int, interactive: bool, keepdb: bool
+) -> dict[str, str]:
+    """Create and migrate test databases in a thread pool.
+
+    A database starts once the databases it depends on exist. Databases on
+    the same server are created one at a time, since ``CREATE DATABASE``
+    copies a template that must not be in use.
+
+    Each database is created through the calling thread's connection, so
+    wrappers installed on its ``create_test_db`` (templates, timings) apply.
+
+    Args:
+        planned: Databases from :func:`plan_concurrent_databases`
+        verbosity: Django verbosity
+        interactive: Whether Django may prompt before clobbering a database
+        keepdb: Keep existing test databases
+
+    Returns:
+        Dict of alias to test database name, for each planned database
+
+    Raises:
+        Exception: The first error raised while creating a database
+    """
+    from django.db import connections
+    from django.db.backends.base.creation import BaseDatabaseCreation
+
+    kwargs: dict[str, Any] = {
+        "verbosity": verbosity,
+        "autoclobber": not interactive,
+        "keepdb": keepdb,
+    }
+    serialize = inspect.signature(BaseDatabaseCreation.create_test_db).parameters["serialize"]
+    if serialize.default is not None:
+        # Older Django serializes inside create_test_db; that is left to
+        # the serial setup_databases, see _precreated()
+        kwargs["serialize"] = False
+
+    wrappers = {database.alias: connections[database.alias] for database in planned}
+    locks = {database.server: threading.Lock() for database in planned}
+    futures: dict[str, Future[str]] = {}
+
+    def create(database: PlannedDatabase) -> str:
+        for dependency in database.dependencies:
+            futures[dependency].result()
+
+        connection = wrappers[database.alias]
+        with locks[database.server]:
+            connection.inc_thread_sharing()
+            try:
+                return str(connection.creation.create_test_db(**kwargs))
+            finally:
+                connection.close()
+                connection.dec_thread_sharing()
+                # Connections migrate opened in this thread
+                connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=len(planned), thread_name_prefix="create-db") as executor:
+        for database in planned:
+            future = executor.submit(create, database)
+            for alias in database.aliases:
+                futures[alias] = future
+
+    return {database.alias: futures[database.alias].result() for database in planned}
+
+
+@contextmanager
+def concurrent_database_setup(manager: "ContainerManager") -> Iterator[None]:
+    """Create independent container-backed test databases concurrently while active.
+
+    Replaces Django's ``setup_databases``, as called by pytest-django and by
+    Django's test runner. The databases from
+    :func:`plan_concurrent_databases` are created first, concurrently;
+    Django's own setup then only sets up the rest. Clones for ``--parallel``
+    are created with :func:`clone_test_databases`. Disabled with the
+    ``concurrent_databases`` option.
+
+    Args:
+        manager: Manager with running containers
+    """
+    import django.test.runner
+    import django.test.utils
+
+    if not manager.get_options()["concurrent_databases"]:
+        yield
+        return
+
+    original = django.test.utils.setup_databases
+    wrapper = _concurrent_setup_databases(original, manager)
+    django.test.utils.setup_databases = wrapper
+    django.test.runner._setup_databases = wrapper  # type: ignore[attr-defined]
+
+    try:
+        yield
+    finally:
+        django.test.utils.setup_databases = original
+        django.test.runner._setup_databases = original  # type: ignore[attr-defined]
+
+
+def clone_test_databases(
+    manager: "ContainerManager",
+    aliases: list[str],
+    parallel: int,
+    verbosity: int,
+    keepdb: bool,
+) -> None:
+    """Create the clones used by Django's parallel test runner.
+
+    Providers that implement
+    :meth:`~django_testcontainers_plus.providers.base.ContainerProvider.clone_test_databases`
+    create all clones of a database at once; other databases are cloned by
+    Django, one clone after another.
+
+    Args:
+        manager: Manager with running containers
+        aliases: Alias of each test database to clone
+        parallel: Number of clones per database
+        verbosity: Django verbosity
+        keepdb: Keep existing clones
+    """
+    from django.db import connections
+
+    providers = manager.get_database_providers()
+    suffixes = [str(index + 1) for index in range(parallel)]
+
+    for alias in aliases:
+        connection = connections[alias]
+        provider = providers.get(alias)
+
+        if provider is not None:
+            with manager.timings.record(provider.name, f"clone_db[{alias}]"):
+                if provider.clone_test_databases(
+                    manager.get_database_container(alias),
+                    connection,
+                    manager.provider_configs[provider.name],
+                    suffixes,
+                    verbosity,
+                    keepdb,
+                ):
+                    continue
+
+        for suffix in suffixes:
+            connection.creation.clone_test_db(suffix=suffix, verbosity=verbosity, keepdb=keepdb)
+
+
+def _concurrent_setup_databases(
+    setup_databases: Callable[..., Any], manager: "ContainerManager"
+) -> Callable[..., Any]:
+    """Wrap Django's ``setup_databases`` to create planned databases concurrently first.
+
+    Clones for the parallel runner are made after Django's setup, by
+    :func:`clone_test_databases`.
+    """
+
+    def wrapper(
+        verbosity: int,
+        interactive: bool,
+        *args: Any,
+        keepdb: bool = False,
+        aliases: set[str] | None = None,
+        parallel: int = 0,
+        **kwargs: Any,
+    ) -> Any:
+        from django.test.utils import get_unique_databases_and_mirrors
+
+        planned = plan_concurrent_databases(manager, aliases)
+        test_databases, _ = get_unique_databases_and_mirrors(aliases)
+
+        with ExitStack() as stack:
+            if len(planned) > 1:
+                names = create_databases_concurrently(planned, verbosity, interactive, keepdb)
+                stack.enter_context(_precreated(names))
+            old_names = setup_databases(
+                verbosity, interactive, *args, keepdb=keepdb, aliases=aliases, **kwargs
+            )
+
+        if parallel > 1:
+            clone_test_databases(
+                manager,
+                [group[0] for _, group in test_databases.values()],
+                parallel,
+                verbosity,
+                keepdb,
+            )
+
+        return old_names
+
+    return wrapper
+
+
+@contextmanager
+def _precreated(names: dict[str, str]) -> Iterator[None]:
+    """Make ``create_test_db`` return already created databases."""
+    from django.db import connections
+
+    originals: dict[str, Any] = {}
+
+    for alias, name in names.items():
+        connection = connections[alias]
+        originals[alias] = connection.creation.__dict__.get("create_test_db")
+        connection.creation.create_test_db = _created(  # type: ignore[method-assign]
+            connection, name
+        )
+
+    try:
+        yield
+    finally:
+        for alias, original in originals.items():
+            creation = connections[alias].creation
+            if original is None:
+                del creation.create_test_db
+            else:
+                creation.create_test_db = original  # type: ignore[method-assign]
+
+
+def _created(connection: Any, name: str) -> Callable[..., str]:
+    """Stand-in ``create_test_db`` for a database that already exists."""
+
+    def create_test_db(*args: Any, serialize: bool | None = None, **kwargs: Any) -> str:
+        if serialize:
+            connection._test_serialized_contents = connection.creation.serialize_db_to_string()
+        return name
+
+    return create_test_db
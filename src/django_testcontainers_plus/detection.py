@@ -0,0 +1,135 @@
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class DetectionRule:
+    """Rule marking settings entries as needing a kind of service."""
+
+    # Service kind, the name of the provider serving it
+    kind: str
+    # Setting to look in, e.g. ``DATABASES`` or ``CELERY_BROKER_URL``
+    setting: str
+    # Key within each entry of a dict setting (``ENGINE``), None for plain settings
+    field: str | None
+    # Lowercase substrings, any of which marks the value as a match
+    patterns: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SettingMatch:
+    """A settings entry matched by a :class:`DetectionRule`."""
+
+    kind: str
+    setting: str
+    # Entry key within a dict setting (alias or cache name), None for plain settings
+    alias: str | None
+    # The entry's dict for dict settings, the setting's value otherwise
+    config: Any
+    # Where the match was found, e.g. ``DATABASES['default']['ENGINE']``
+    path: str
+
+
+POSTGRES_RULES = (DetectionRule("postgres", "DATABASES", "ENGINE", ("postgresql", "psycopg")),)
+
+MYSQL_RULES = (DetectionRule("mysql", "DATABASES", "ENGINE", ("mysql", "mariadb")),)
+
+REDIS_RULES = (
+    DetectionRule("redis", "CACHES", "BACKEND", ("redis",)),
+    DetectionRule("redis", "CELERY_BROKER_URL", None, ("redis://",)),
+    DetectionRule("redis", "SESSION_ENGINE", None, ("redis",)),
+)
+
+
+class SettingsIndex:
+    """Index of the settings entries that need a service, by service kind.
+
+    Built in one pass: every setting named by a rule is read once, and each
+    entry's value is lowercased once and checked against all rules for it.
+    """
+
+    def __init__(self, settings: Any, rules: Iterable[DetectionRule]):
+        """Build the index.
+
+        Args:
+            settings: Django settings module
+            rules: Rules of every provider to index for
+        """
+        self.settings = settings
+        self._matches: dict[str, list[SettingMatch]] = {}
+
+        grouped: dict[str, dict[str | None, list[DetectionRule]]] = {}
+        for rule in rules:
+            fields = grouped.setdefault(rule.setting, {})
+            if rule not in fields.setdefault(rule.field, []):
+                fields[rule.field].append(rule)
+
+        for setting, fields in grouped.items():
+            value = getattr(settings, setting, None)
+            if not value:
+                continue
+
+            if None in fields and isinstance(value, str):
+                self._add(fields[None], value.lower(), setting, None, value, setting)
+
+            if not isinstance(value, dict):
+                continue
+
+            for alias, entry in value.items():
+                if not isinstance(entry, dict):
+                    continue
+                for field, field_rules in fields.items():
+                    if field is None:
+                        continue
+                    path = f"{setting}['{alias}']['{field}']"
+                    text = str(entry.get(field, "")).lower()
+                    self._add(field_rules, text, setting, alias, entry, path)
+
+    def _add(
+        self,
+        rules: list[DetectionRule],
+        text: str,
+        setting: str,
+        alias: str | None,
+        config: Any,
+        path: str,
+    ) -> None:
+        """Record a match for every rule whose patterns occur in a value."""
+        for rule in rules:
+            if any(pattern in text for pattern in rule.patterns):
+                self._matches.setdefault(rule.kind, []).append(
+                    SettingMatch(rule.kind, setting, alias, config, path)
+                )
+
+    def matches(self, kind: str, setting: str | None = None) -> list[SettingMatch]:
+        """Get the matches for a service kind.
+
+        Args:
+            kind: Service kind
+            setting: Only matches within this setting, all if None
+
+        Returns:
+            Matches in rule order, then settings order
+        """
+        return [
+            match
+            for match in self._matches.get(kind, [])
+            if setting is None or match.setting == setting
+        ]
+
+    def aliases(self, kind: str, setting: str) -> dict[str, Any]:
+        """Get the matched entries of a dict setting.
+
+        Args:
+            kind: Service kind
+            setting: Dict setting, e.g. ``DATABASES``
+
+        Returns:
+            Dict of entry key to entry, in settings order
+        """
+        return {
+            match.alias: match.config
+            for match in self.matches(kind, setting)
+            if match.alias is not None
+        }
@@ -69,3 +69,47 @@ class MissingDependencyError(DjangoTestcontainersError):
         )
 
         return "\n".join(lines)
+
+
+class ImageUnavailableError(DjangoTestcontainersError):
+    def __init__(self, images: list[str], image_dir: str | None = None):
+        """Initialize the error with the images that cannot be used offline.
+
+        Args:
+            images: Image references that are neither local nor in the image directory
+            image_dir: Directory searched for ``docker save`` tarballs
+        """
+        self.images = images
+        self.image_dir = image_dir
+
+        message = self._build_message()
+        super().__init__(message)
+
+    def _build_message(self) -> str:
+        """Build an error message explaining how to provide the images."""
+        lines = [
+            f"\n{'=' * 70}",
+            "Container Images Not Available Offline",
+            "=" * 70,
+            "\nOffline mode is enabled, but these images are not available locally:",
+            *(f"  → {image}" for image in self.images),
+        ]
+
+        if self.image_dir:
+            lines.extend(
+                [
+                    f"\nNo matching tarball was found in {self.image_dir}.",
+                    "Save the images there with:",
+                    f"  django-testcontainers save --output {self.image_dir}",
+                ]
+            )
+        else:
+            lines.extend(
+                [
+                    "\nLoad them with 'docker load', or set 'image_dir' in",
+                    "TESTCONTAINERS_OPTIONS to a directory of 'docker save' tarballs.",
+                ]
+            )
+
+        lines.append("=" * 70)
+        return "\n".join(lines)
@@ -0,0 +1,73 @@
+import hashlib
+import importlib.util
+from collections.abc import Iterable
+from pathlib import Path
+
+
+def files_fingerprint(paths: Iterable[str | Path]) -> str:
+    """Hash the contents of files and of all files below directories.
+
+    Args:
+        paths: Files or directories to hash
+
+    Returns:
+        Hex digest of the file names and contents, in a stable order
+    """
+    digest = hashlib.sha256()
+
+    for root in sorted(Path(p) for p in paths):
+        files = sorted(f for f in root.rglob("*") if f.is_file()) if root.is_dir() else [root]
+        for file in files:
+            digest.update(str(file.relative_to(root.parent)).encode())
+            digest.update(file.read_bytes())
+
+    return digest.hexdigest()
+
+
+def migrations_fingerprint() -> str:
+    """Hash the migration files of every installed Django app.
+
+    Returns:
+        Hex digest that changes whenever any migration is added, removed or edited
+    """
+    from django.apps import apps
+    from django.db.migrations.loader import MigrationLoader
+
+    digest = hashlib.sha256()
+
+    for app_config in sorted(apps.get_app_configs(), key=lambda a: a.label):
+        module_name, _ = MigrationLoader.migrations_module(app_config.label)
+        if module_name is None:
+            continue
+
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except ModuleNotFoundError:
+            continue
+        if spec is None or not spec.submodule_search_locations:
+            continue
+
+        digest.update(app_config.label.encode())
+        for location in spec.submodule_search_locations:
+            for path in sorted(Path(location).rglob("*.py")):
+                digest.update(str(path.relative_to(location)).encode())
+                digest.update(path.read_bytes())
+
+    return digest.hexdigest()
+
+
+def database_fingerprint(fixtures: Iterable[str | Path] = ()) -> str:
+    """Hash everything that determines the contents of a freshly built test database.
+
+    Args:
+        fixtures: Fixture files loaded after migrating
+
+    Returns:
+        Hex digest of the migration files and fixture files
+    """
+    fixtures = list(fixtures)
+    if not fixtures:
+        return migrations_fingerprint()
+
+    payload = f"{migrations_fingerprint()}:{files_fingerprint(fixtures)}"
+    return hashlib.sha256(payload.encode()).hexdigest()
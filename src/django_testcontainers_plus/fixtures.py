@@ -0,0 +1,215 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import django
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+    from .providers import ContainerProvider
+
+# Snapshots of the manager whose fixture_snapshots() context is active
+_active: "FixtureSnapshots | None" = None
+
+
+@dataclass
+class FixtureSnapshot:
+    """Database state after a fixture set was loaded."""
+
+    # Models loaddata saved objects of
+    models: list[Any]
+    # Tables of those models and of their auto-created many-to-many tables
+    tables: list[str]
+    # Provider-specific table data, see ContainerProvider.dump_table_data()
+    data: Any
+
+
+class FixtureSnapshots:
+    """Cache of loaded fixture sets, restored instead of loading them again.
+
+    The first time a fixture set is loaded into a container-backed database
+    it is loaded with ``loaddata``, and the rows of every table it touched are
+    snapshotted through the provider. Later loads of the same set into the
+    same database replace those tables with the snapshot, skipping fixture
+    parsing and per-object saves.
+
+    A snapshot is only valid for the database state it was taken in, so
+    fixture sets should be loaded into a clean test database, as Django's
+    ``TestCase`` does.
+    """
+
+    def __init__(self, manager: "ContainerManager"):
+        """Initialize the cache.
+
+        Args:
+            manager: Manager with running containers
+        """
+        self.manager = manager
+        self.snapshots: dict[tuple[str, str, tuple[str, ...]], FixtureSnapshot] = {}
+
+    def load(self, labels: tuple[str, ...], database: str) -> None:
+        """Load a fixture set, from its snapshot when there is one.
+
+        Args:
+            labels: Fixture labels, as passed to ``loaddata``
+            database: DATABASES alias to load into
+        """
+        from django.core.management import call_command
+        from django.core.management.commands import loaddata
+        from django.db import connections
+
+        provider = self.manager.get_database_providers().get(database)
+        if provider is None:
+            call_command("loaddata", *labels, verbosity=0, database=database)
+            return
+
+        connection = connections[database]
+        key = (database, str(connection.settings_dict["NAME"]), labels)
+        snapshot = self.snapshots.get(key)
+
+        if snapshot is not None:
+            _restore(provider, connection, snapshot)
+            return
+
+        command = loaddata.Command()
+        call_command(command, *labels, verbosity=0, database=database)
+        models = sorted(command.models, key=lambda model: model._meta.label)
+        tables = _fixture_tables(models)
+        self.snapshots[key] = FixtureSnapshot(
+            models, tables, provider.dump_table_data(connection, tables)
+        )
+
+
+def load_fixtures(*labels: str, database: str = "default") -> None:
+    """Load fixtures, restoring them from a snapshot when loaded before.
+
+    Falls back to plain ``loaddata`` when no containers are managed, or the
+    database is not served by a container.
+
+    Args:
+        *labels: Fixture labels, as passed to ``loaddata``
+        database: DATABASES alias to load into
+    """
+    from django.core.management import call_command
+
+    if _active is None:
+        call_command("loaddata", *labels, verbosity=0, database=database)
+    else:
+        _active.load(labels, database)
+
+
+@contextmanager
+def fixture_snapshots(manager: "ContainerManager") -> Iterator[None]:
+    """Keep fixture snapshots for the manager's databases while active.
+
+    Entered for the whole test session by the test runner and the pytest
+    plugin. Snapshots are used by :func:`load_fixtures`,
+    :class:`FixtureSnapshotMixin` and the ``testcontainers_fixtures`` pytest
+    fixture.
+
+    Args:
+        manager: Manager with running containers
+    """
+    global _active
+
+    previous, _active = _active, FixtureSnapshots(manager)
+    try:
+        yield
+    finally:
+        _active = previous
+
+
+class FixtureSnapshotMixin:
+    """``TestCase`` mixin that loads ``fixtures`` from session-wide snapshots.
+
+    Usage:
+        class ArticleTests(FixtureSnapshotMixin, TestCase):
+            fixtures = ['authors.json', 'articles.json']
+
+    Test classes declaring the same ``fixtures`` share one snapshot, so the
+    fixture files are only parsed and saved by the first of them. Works with
+    ``TransactionTestCase`` as well.
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with _loaddata_from_snapshots():
+            super().setUpClass()  # type: ignore[misc]
+
+    # Django 5.2 made _fixture_setup a classmethod, so match the binding of
+    # the installed version
+    if django.VERSION >= (5, 2):
+
+        @classmethod
+        def _fixture_setup(cls) -> None:
+            with _loaddata_from_snapshots():
+                super()._fixture_setup()  # type: ignore[misc]
+
+    else:
+
+        def _fixture_setup(self) -> None:  # type: ignore[misc]
+            with _loaddata_from_snapshots():
+                super()._fixture_setup()  # type: ignore[misc]
+
+
+@contextmanager
+def _loaddata_from_snapshots() -> Iterator[None]:
+    """Route the ``loaddata`` calls of Django's test cases to :func:`load_fixtures`."""
+    import django.test.testcases
+
+    original = django.test.testcases.call_command  # type: ignore[attr-defined]
+    django.test.testcases.call_command = _snapshot_call_command(  # type: ignore[attr-defined]
+        original
+    )
+    try:
+        yield
+    finally:
+        django.test.testcases.call_command = original  # type: ignore[attr-defined]
+
+
+def _snapshot_call_command(call_command: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap ``call_command`` so plain ``loaddata`` calls go through snapshots."""
+
+    def wrapper(name: Any, *args: Any, **options: Any) -> Any:
+        if name != "loaddata" or set(options) - {"verbosity", "database"}:
+            return call_command(name, *args, **options)
+        return load_fixtures(*args, database=options.get("database", "default"))
+
+    return wrapper
+
+
+def _fixture_tables(models: list[Any]) -> list[str]:
+    """Tables loaddata writes for the models, including auto-created many-to-many tables."""
+    tables = []
+    for model in models:
+        tables.append(model._meta.db_table)
+        for field in model._meta.local_many_to_many:
+            through = field.remote_field.through
+            if through._meta.auto_created:
+                tables.append(through._meta.db_table)
+    return list(dict.fromkeys(tables))
+
+
+def _restore(provider: "ContainerProvider", connection: Any, snapshot: FixtureSnapshot) -> None:
+    """Replace the snapshotted tables' rows the way ``loaddata`` saves them."""
+    from django.core.management.color import no_style
+    from django.db import transaction
+
+    tables = snapshot.tables
+    quote = connection.ops.quote_name
+
+    with transaction.atomic(using=connection.alias):
+        with connection.constraint_checks_disabled():
+            with connection.cursor() as cursor:
+                for table in tables:
+                    cursor.execute(f"DELETE FROM {quote(table)}")
+            provider.load_table_data(connection, snapshot.data)
+
+        connection.check_constraints(table_names=tables)
+
+        sequence_sql = connection.ops.sequence_reset_sql(no_style(), snapshot.models)
+        if sequence_sql:
+            with connection.cursor() as cursor:
+                for line in sequence_sql:
+                    cursor.execute(line)
@@ -0,0 +1,208 @@
+import re
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import docker
+
+from .exceptions import ImageUnavailableError
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+TARBALL_SUFFIXES = (".tar", ".tar.gz")
+
+
+@dataclass
+class ImageInfo:
+    """A local image resolved by :func:`prefetch_images`."""
+
+    image: str
+    id: str
+    digests: list[str] = field(default_factory=list)
+    # "local", "registry" or "tarball"
+    source: str = "local"
+    seconds: float = 0.0
+
+    @property
+    def pulled(self) -> bool:
+        """Whether the image had to be fetched from a registry or tarball."""
+        return self.source != "local"
+
+
+def needed_images(manager: "ContainerManager") -> dict[str, str]:
+    """Resolve the image of every provider needed by the Django settings.
+
+    Args:
+        manager: Manager for the Django settings
+
+    Returns:
+        Dict of provider name to image, for providers that configure one
+    """
+    images: dict[str, str] = {}
+
+    for provider in manager.detect_needed_containers():
+        image = manager.get_provider_config(provider).get("image")
+        if image:
+            images[provider.name] = image
+
+    return images
+
+
+def image_tarball_name(image: str) -> str:
+    """Name of the ``docker save`` tarball for an image in an image directory.
+
+    Args:
+        image: Image reference such as ``postgres:16``
+
+    Returns:
+        File name such as ``postgres_16.tar``
+    """
+    return re.sub(r"[/:@]", "_", image) + ".tar"
+
+
+def find_image_tarball(image_dir: str | Path, image: str) -> Path | None:
+    """Find the tarball of an image in an image directory.
+
+    Args:
+        image_dir: Directory of ``docker save`` tarballs
+        image: Image reference
+
+    Returns:
+        Path to the tarball (``.tar`` or ``.tar.gz``), None if there is none
+    """
+    stem = image_tarball_name(image).removesuffix(".tar")
+    for suffix in TARBALL_SUFFIXES:
+        path = Path(image_dir) / f"{stem}{suffix}"
+        if path.is_file():
+            return path
+    return None
+
+
+def check_offline_images(
+    client: docker.DockerClient, images: Iterable[str], image_dir: str | Path | None = None
+) -> None:
+    """Fail fast when images cannot be used without a registry.
+
+    Only local lookups are made, so this returns (or raises) in milliseconds
+    instead of letting ``container.start()`` hang on a pull.
+
+    Args:
+        client: Docker client
+        images: Image references that will be needed
+        image_dir: Directory of ``docker save`` tarballs
+
+    Raises:
+        ImageUnavailableError: If any image is neither local nor in ``image_dir``
+    """
+    missing = []
+
+    for image in dict.fromkeys(images):
+        if image_dir is not None and find_image_tarball(image_dir, image) is not None:
+            continue
+        try:
+            client.images.get(image)
+        except docker.errors.ImageNotFound:
+            missing.append(image)
+
+    if missing:
+        raise ImageUnavailableError(missing, str(image_dir) if image_dir is not None else None)
+
+
+def prefetch_images(
+    client: docker.DockerClient,
+    images: Iterable[str],
+    refresh: bool = False,
+    image_dir: str | Path | None = None,
+    offline: bool = False,
+) -> dict[str, ImageInfo]:
+    """Make sure images are available locally, fetching missing ones concurrently.
+
+    Images already present are used without contacting the registry. Missing
+    images are loaded from a tarball in ``image_dir`` when there is one, and
+    pulled otherwise.
+
+    Args:
+        client: Docker client
+        images: Image references such as ``postgres:16``
+        refresh: Pull images even when they are present locally
+        image_dir: Directory of ``docker save`` tarballs
+        offline: Never pull, failing fast if an image is unavailable
+
+    Returns:
+        Dict of image reference to its local image, in the given order
+
+    Raises:
+        ImageUnavailableError: In offline mode, if an image is unavailable
+    """
+    images = list(dict.fromkeys(images))
+    if not images:
+        return {}
+
+    if offline:
+        check_offline_images(client, images, image_dir)
+
+    def fetch(image: str) -> ImageInfo:
+        if not refresh or offline:
+            try:
+                local = client.images.get(image)
+            except docker.errors.ImageNotFound:
+                pass
+            else:
+                return ImageInfo(image, local.id, local.attrs.get("RepoDigests", []))
+
+        started = time.perf_counter()
+        tarball = find_image_tarball(image_dir, image) if image_dir is not None else None
+        if tarball is not None:
+            loaded, source = _load_tarball(client, tarball, image), "tarball"
+        else:
+            loaded, source = client.images.pull(image), "registry"
+        return ImageInfo(
+            image,
+            loaded.id,
+            loaded.attrs.get("RepoDigests", []),
+            source=source,
+            seconds=time.perf_counter() - started,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(images), thread_name_prefix="pull") as executor:
+        return dict(zip(images, executor.map(fetch, images), strict=True))
+
+
+def save_images(
+    client: docker.DockerClient, images: Iterable[str], output_dir: str | Path
+) -> dict[str, Path]:
+    """Write ``docker save`` tarballs for images, named for :func:`find_image_tarball`.
+
+    Args:
+        client: Docker client
+        images: Image references, which must be present locally
+        output_dir: Directory to write the tarballs to
+
+    Returns:
+        Dict of image reference to the written tarball
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    saved: dict[str, Path] = {}
+
+    for image in dict.fromkeys(images):
+        path = output_dir / image_tarball_name(image)
+        tmp_path = path.with_name(f".{path.name}.partial")
+        with tmp_path.open("wb") as f:
+            for chunk in client.images.get(image).save(named=True):
+                f.write(chunk)
+        tmp_path.replace(path)
+        saved[image] = path
+
+    return saved
+
+
+def _load_tarball(client: docker.DockerClient, tarball: Path, image: str) -> Any:
+    """Stream a ``docker save`` tarball into the Docker daemon."""
+    with tarball.open("rb") as f:
+        client.images.load(f)
+    return client.images.get(image)
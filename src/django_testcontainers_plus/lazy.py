@@ -0,0 +1,63 @@
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+
+def refresh_connection_handler(handler: Any, aliases: Iterable[str] = ()) -> None:
+    """Make a Django connection handler re-read its settings.
+
+    ``django.db.connections`` and ``django.core.cache.caches`` cache their
+    settings on first use, so settings applied afterwards would be ignored.
+
+    Args:
+        handler: Connection handler such as ``connections`` or ``caches``
+        aliases: Aliases whose already open connections are closed and dropped
+    """
+    handler.__dict__.pop("settings", None)
+    handler._settings = None
+
+    for alias in aliases:
+        if hasattr(handler._connections, alias):
+            connection = handler[alias]
+            if hasattr(connection, "close"):
+                connection.close()
+            del handler[alias]
+
+
+@contextmanager
+def lazy_caches(
+    manager: "ContainerManager", apply_updates: Callable[[dict[str, Any]], None]
+) -> Iterator[None]:
+    """Start the containers waiting for ``"caches"`` on the first cache connection.
+
+    Args:
+        manager: Manager with pending providers
+        apply_updates: Applies settings updates, as done after eager startup
+    """
+    from django.core.cache import caches
+
+    if "caches" not in manager.pending_providers:
+        yield
+        return
+
+    create_connection = caches.create_connection
+    lock = threading.Lock()
+
+    def wrapper(alias: str) -> Any:
+        with lock:
+            if "caches" in manager.pending_providers:
+                updates = manager.start_lazy("caches")
+                apply_updates(updates)
+                refresh_connection_handler(caches, updates.get("CACHES", {}))
+        return create_connection(alias)
+
+    caches.create_connection = wrapper  # type: ignore[method-assign]
+
+    try:
+        yield
+    finally:
+        caches.__dict__.pop("create_connection", None)
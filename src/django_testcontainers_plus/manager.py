@@ -1,9 +1,81 @@
-from typing import Any
-
+import bisect
+import copy
+import hashlib
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, NoReturn
+
+from testcontainers.core.config import testcontainers_config
+from testcontainers.core.container import Reaper
+from testcontainers.core.docker_client import DockerClient
 from testcontainers.core.generic import DockerContainer
 
-from .exceptions import MissingDependencyError
-from .providers import PROVIDER_REGISTRY, UNAVAILABLE_PROVIDERS, ContainerProvider
+from .bake import bake_tag, baked_image_exists
+from .detection import SettingsIndex
+from .exceptions import DjangoTestcontainersError, MissingDependencyError
+from .fingerprint import database_fingerprint
+from .images import prefetch_images
+from .plan import ContainerPlan, ProviderPlan, StartupPlan, load_plan, plan_key, save_plan
+from .providers import PROVIDER_REGISTRY, ContainerProvider, ProviderRegistry, ProviderSpec
+from .readiness import ProbeWaitStrategy
+from .reuse import (
+    attach_container,
+    config_hash,
+    find_reusable_container,
+    label_container,
+    mark_used,
+    prune_reusable_containers,
+)
+from .teardown import remove_in_background, stop_concurrently
+from .templates import get_fixtures
+from .timing import StartupTimings
+
+logger = logging.getLogger(__name__)
+
+# Points per pool member on the consistent hash ring
+HASH_RING_REPLICAS = 64
+
+DEFAULT_OPTIONS: dict[str, Any] = {
+    "parallel": True,
+    "reuse": False,
+    "reuse_ttl": None,
+    "reuse_idle_timeout": 24 * 60 * 60,
+    "timings_file": None,
+    "lazy": False,
+    "offline": False,
+    "image_dir": None,
+    "concurrent_databases": True,
+    "plan_cache": False,
+    "background_teardown": False,
+}
+
+
+def consistent_hash(key: str, size: int) -> int:
+    """Map a key to one of ``size`` buckets using a consistent hash ring.
+
+    Growing the pool only moves the keys that land on the new member.
+
+    Args:
+        key: Key to place, such as an xdist worker index
+        size: Number of buckets
+
+    Returns:
+        Bucket index in ``range(size)``
+    """
+
+    def point(value: str) -> int:
+        return int.from_bytes(hashlib.sha256(value.encode()).digest()[:8], "big")
+
+    ring = sorted(
+        (point(f"{bucket}:{replica}"), bucket)
+        for bucket in range(size)
+        for replica in range(HASH_RING_REPLICAS)
+    )
+    index = bisect.bisect(ring, (point(key), size))
+    return ring[index % len(ring)][1]
 
 
 class ContainerManager:
@@ -16,9 +88,23 @@ class ContainerManager:
             settings: Django settings module
         """
         self.settings = settings
-        self.providers: list[ContainerProvider] = PROVIDER_REGISTRY
+        self.registry: ProviderRegistry = PROVIDER_REGISTRY
+        # Fixed providers to use instead of the registry, see the providers property
+        self._providers: list[ContainerProvider] | None = None
         self.active_containers: dict[str, DockerContainer] = {}
+        self.reused_containers: set[str] = set()
+        self.provider_configs: dict[str, dict[str, Any]] = {}
+        self.provider_updates: dict[str, dict[str, Any]] = {}
+        self.pool_updates: dict[str, list[dict[str, Any]]] = {}
+        # DATABASES alias to the name of the container serving it
+        self.database_containers: dict[str, str] = {}
         self.settings_updates: dict[str, Any] = {}
+        # Settings updates of each running container, by container name
+        self.container_updates: dict[str, dict[str, Any]] = {}
+        self.pending_providers: dict[str, list[ContainerProvider]] = {}
+        # Startup plan of the current session, see get_plan
+        self.plan: StartupPlan | None = None
+        self.timings = StartupTimings()
 
     def get_testcontainers_config(self) -> dict[str, Any]:
         """Get TESTCONTAINERS configuration from settings.
@@ -28,9 +114,102 @@ class ContainerManager:
         """
         return getattr(self.settings, "TESTCONTAINERS", {})
 
+    def get_options(self) -> dict[str, Any]:
+        """Get TESTCONTAINERS_OPTIONS from settings merged over the defaults.
+
+        Returns:
+            Options dict controlling how the manager runs containers
+        """
+        return {**DEFAULT_OPTIONS, **getattr(self.settings, "TESTCONTAINERS_OPTIONS", {})}
+
+    def get_provider_config(self, provider: ContainerProvider) -> dict[str, Any]:
+        """Get the effective configuration for a provider.
+
+        Args:
+            provider: Provider to build the configuration for
+
+        Returns:
+            Provider defaults overridden by its TESTCONTAINERS entry
+
+        Raises:
+            DjangoTestcontainersError: If the configuration enables ``bake`` for
+                a provider that cannot be baked
+        """
+        config = {
+            **provider.get_default_config(),
+            **self.get_testcontainers_config().get(provider.name, {}),
+        }
+        if config.get("bake") and not provider.SUPPORTS_BAKE:
+            raise DjangoTestcontainersError(
+                f"The {provider.name} provider does not support 'bake', "
+                f"remove it from TESTCONTAINERS['{provider.name}']"
+            )
+        return config
+
+    @property
+    def providers(self) -> list[ContainerProvider]:
+        """Providers this manager has loaded, or the list it was given.
+
+        Returns:
+            Provider instances
+        """
+        if self._providers is not None:
+            return self._providers
+        return self.registry.loaded()
+
+    @providers.setter
+    def providers(self, providers: list[ContainerProvider]) -> None:
+        """Use a fixed list of providers instead of the registry."""
+        self._providers = providers
+
+    def get_provider(self, name: str) -> ContainerProvider | None:
+        """Get a provider by name, importing it on first use.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Provider instance, None if no provider has this name
+
+        Raises:
+            ImportError: If the provider's dependencies are missing
+        """
+        if self._providers is not None:
+            return next((p for p in self._providers if p.name == name), None)
+        return self.registry.get(name)
+
+    def get_provider_specs(self) -> list[ProviderSpec]:
+        """List every provider this manager can start, without importing them.
+
+        Returns:
+            Provider specs, in provider order
+        """
+        if self._providers is not None:
+            return [
+                ProviderSpec(
+                    p.name, f"{type(p).__module__}:{type(p).__qualname__}", p.DETECTION_RULES
+                )
+                for p in self._providers
+            ]
+        return self.registry.specs()
+
+    def _started_provider(self, name: str) -> ContainerProvider:
+        """Get the provider of a started (or shared) container.
+
+        Raises:
+            KeyError: If no provider has this name
+        """
+        provider = self.get_provider(name)
+        if provider is None:
+            raise KeyError(name)
+        return provider
+
     def detect_needed_containers(self) -> list[ContainerProvider]:
         """Detect which containers are needed based on settings.
 
+        Detection uses each provider's rules, so only the providers found to
+        be needed are imported.
+
         Returns:
             List of providers that should be started
 
@@ -38,160 +217,771 @@ class ContainerManager:
             MissingDependencyError: If a needed provider is unavailable
         """
         config = self.get_testcontainers_config()
-        needed_providers = []
+        specs = self.get_provider_specs()
+        index = self.build_settings_index(specs)
+        # Provider name to where the need for it was found
+        needed: dict[str, str] = {}
 
-        for provider in self.providers:
-            provider_config = config.get(provider.name, {})
+        for spec in specs:
+            provider_config = config.get(spec.name, {})
 
             if "enabled" in provider_config:
                 if provider_config["enabled"]:
-                    needed_providers.append(provider)
+                    needed[spec.name] = f"TESTCONTAINERS['{spec.name}']"
                 continue
 
             if provider_config.get("auto", True) is False:
                 continue
 
-            if provider.can_auto_detect(self.settings):
-                needed_providers.append(provider)
+            detected_in = self._detect(spec, index)
+            if detected_in is not None:
+                needed[spec.name] = detected_in
+
+        names = {spec.name for spec in specs}
+        for provider_name, provider_config in config.items():
+            if provider_config.get("enabled", True) and provider_name in names:
+                needed.setdefault(provider_name, f"TESTCONTAINERS['{provider_name}']")
+
+        specs_by_name = {spec.name: spec for spec in specs}
+        return [self._load_provider(specs_by_name[name], where) for name, where in needed.items()]
+
+    def build_settings_index(self, specs: list[ProviderSpec] | None = None) -> SettingsIndex:
+        """Index the settings entries that need a service, in one pass.
+
+        Args:
+            specs: Providers to index for, all if None
+
+        Returns:
+            Index of the current settings
+        """
+        if specs is None:
+            specs = self.get_provider_specs()
+        return SettingsIndex(
+            self.settings, [rule for spec in specs for rule in spec.detection_rules]
+        )
+
+    def _detect(self, spec: ProviderSpec, index: SettingsIndex) -> str | None:
+        """Check whether a provider is needed.
 
-        for provider_name in config.keys():
-            provider_config = config[provider_name]
-            if provider_config.get("enabled", True):
-                found_provider: ContainerProvider | None = next(
-                    (p for p in self.providers if p.name == provider_name), None
+        Providers without detection rules are imported to ask them.
+
+        Args:
+            spec: Provider to check
+            index: Index from :meth:`build_settings_index`
+
+        Returns:
+            Where the need was found, None if the provider is not needed
+        """
+        if spec.detection_rules:
+            for kind in dict.fromkeys(rule.kind for rule in spec.detection_rules):
+                matches = index.matches(kind)
+                if matches:
+                    return matches[0].path
+            return None
+
+        provider = self._load_provider(spec, None)
+        return "settings" if provider.detect(index) else None
+
+    def _load_provider(self, spec: ProviderSpec, detected_in: str | None) -> ContainerProvider:
+        """Import a needed provider.
+
+        Args:
+            spec: Provider to import
+            detected_in: Where the need for it was found, for the error message
+
+        Returns:
+            Provider instance
+
+        Raises:
+            MissingDependencyError: If the provider's optional dependencies are missing
+        """
+        try:
+            provider = self.get_provider(spec.name)
+        except ImportError as e:
+            if spec.extra is None:
+                raise
+            self._raise_missing_dependency_error(spec.name, spec.extra, e, detected_in)
+        if provider is None:
+            raise ValueError(f"Unknown provider {spec.name!r}")
+        return provider
+
+    def build_plan(self) -> StartupPlan:
+        """Work out which providers to start and how, from the settings.
+
+        Returns:
+            Startup plan with every needed provider, its image, effective
+            configuration and lazy resource
+        """
+        providers = []
+        for provider in self.detect_needed_containers():
+            config = self.get_provider_config(provider)
+            providers.append(
+                ProviderPlan(
+                    provider.name,
+                    config.get("image"),
+                    config,
+                    provider.get_lazy_resource(self.settings),
                 )
-                if found_provider is not None and found_provider not in needed_providers:
-                    needed_providers.append(found_provider)
+            )
+        return StartupPlan(plan_key(self), providers)
 
-        self._check_unavailable_providers()
+    def get_plan(self) -> StartupPlan:
+        """Get the startup plan, from the cache when the ``plan_cache`` option is set.
 
-        return needed_providers
+        The cached plan is keyed by a hash of the settings providers are
+        detected from and the installed package versions, so changing either
+        builds a new plan.
 
-    def start_containers(self) -> dict[str, Any]:
+        Returns:
+            Cached plan if there is one for the current settings, a new one otherwise
+        """
+        if self.get_options()["plan_cache"]:
+            key = plan_key(self)
+            cached = load_plan(key) if key is not None else None
+            if cached is not None:
+                return cached
+        return self.build_plan()
+
+    def _plan_provider(self, provider_plan: ProviderPlan) -> ContainerProvider:
+        """Import the provider of a planned provider.
+
+        Raises:
+            MissingDependencyError: If the provider's optional dependencies are missing
+        """
+        spec = next(
+            (spec for spec in self.get_provider_specs() if spec.name == provider_plan.name),
+            ProviderSpec(provider_plan.name, ""),
+        )
+        return self._load_provider(spec, "the startup plan")
+
+    def start_containers(self, lazy: bool | None = None) -> dict[str, Any]:
         """Start all needed containers.
 
+        Containers are started concurrently unless the ``parallel`` option is
+        disabled. Settings updates are always merged in provider order, so the
+        result does not depend on which container became ready first.
+
+        Providers in reuse mode attach to a matching running container when
+        one exists instead of starting a new one.
+
+        Which providers to start and their configurations come from
+        :meth:`get_plan`, so with the ``plan_cache`` option a repeat run skips
+        detection, and reused containers skip looking up their ports.
+
+        In lazy mode, providers that name a lazy resource are not started
+        here but by :meth:`start_lazy` once that resource is first used.
+
+        Args:
+            lazy: Override the ``lazy`` option
+
         Returns:
             Dict of settings updates to apply
         """
-        needed_providers = self.detect_needed_containers()
-        config = self.get_testcontainers_config()
+        self.plan = self.get_plan()
+        needed_providers = [self._plan_provider(provider) for provider in self.plan.providers]
+
+        if any(self._reuse_enabled(provider.config) for provider in self.plan.providers):
+            # Decided before anything starts: once Ryuk runs, it removes every
+            # container of the session at exit, reusable or not
+            testcontainers_config.ryuk_disabled = True
+
+        if self.get_options()["lazy"] if lazy is None else lazy:
+            eager = []
+            for provider, provider_plan in zip(needed_providers, self.plan.providers, strict=True):
+                if provider_plan.lazy_resource is None:
+                    eager.append(provider)
+                else:
+                    self.pending_providers.setdefault(provider_plan.lazy_resource, []).append(
+                        provider
+                    )
+            needed_providers = eager
+
+        return self._start_providers(needed_providers)
+
+    def start_lazy(self, resource: str) -> dict[str, Any]:
+        """Start the containers deferred until ``resource`` is first used.
+
+        Args:
+            resource: Lazy resource name, such as ``"databases"`` or ``"caches"``
+
+        Returns:
+            Dict of settings updates for the started containers, empty if
+            nothing was waiting for the resource
+        """
+        providers = self.pending_providers.pop(resource, [])
+        if not providers:
+            return {}
+        return self._start_providers(providers)
+
+    def _start_providers(self, needed_providers: list[ContainerProvider]) -> dict[str, Any]:
+        """Start the containers of the given providers.
+
+        Args:
+            needed_providers: Providers to start, in order
+
+        Returns:
+            Dict of settings updates for these providers
+        """
+        if not needed_providers:
+            return {}
+
+        # Copied so runtime changes, such as enabling templates for a baked
+        # image, stay out of the plan that is cached
+        planned = {p.name: p.config for p in self.plan.providers} if self.plan else {}
+        configs = {
+            provider.name: copy.deepcopy(planned.get(provider.name, {}))
+            or self.get_provider_config(provider)
+            for provider in needed_providers
+        }
+
+        # Container names of each provider part: the main part ("") may be a
+        # pool, every other part is a single container named <provider>-<part>
+        parts: dict[str, dict[str, list[str]]] = {}
+        containers: dict[str, DockerContainer] = {}
+        member_configs: dict[str, dict[str, Any]] = {}
+        for provider in needed_providers:
+            parts[provider.name] = {}
+            part_configs = provider.get_container_configs(self.settings, configs[provider.name])
+            for part, part_config in part_configs.items():
+                if part:
+                    names = [f"{provider.name}-{part}"]
+                    container_config = part_config
+                else:
+                    names = self._pool_member_names(provider.name, part_config)
+                    container_config = self._resolve_baked_image(provider, part_config)
+                parts[provider.name][part] = names
+                for member in names:
+                    containers[member] = provider.get_container(container_config)
+                    member_configs[member] = part_config
+
+        reuse_names = [
+            name for name, config in member_configs.items() if self._reuse_enabled(config)
+        ]
+        if reuse_names:
+            self._prepare_reuse({name: containers[name] for name in reuse_names}, member_configs)
+
+        to_start = {
+            name: container
+            for name, container in containers.items()
+            if name not in self.active_containers
+        }
+
+        self._prefetch_images(to_start)
+
+        if self.get_options()["parallel"] and len(to_start) > 1:
+            self._start_parallel(to_start)
+        else:
+            self._start_serial(to_start)
+
+        for name in self.reused_containers.intersection(reuse_names):
+            mark_used(self.active_containers[name].get_container_id())
+
         all_updates: dict[str, Any] = {}
 
         for provider in needed_providers:
-            provider_config = {
-                **provider.get_default_config(),
-                **config.get(provider.name, {}),
-            }
+            config = configs[provider.name]
+            part_updates: dict[str, Any] = {}
+            for part, names in parts[provider.name].items():
+                if part:
+                    part_updates = self._merge_updates_copy(
+                        part_updates, self._update_settings(provider, names[0], member_configs)
+                    )
 
-            container = provider.get_container(provider_config)
-            container.start()
+            member_updates = [
+                self._merge_updates_copy(
+                    self._update_settings(provider, member, member_configs), part_updates
+                )
+                for member in parts[provider.name][""]
+            ]
+
+            self.provider_configs[provider.name] = config
+            self.provider_updates[provider.name] = member_updates[0]
+            if len(member_updates) > 1:
+                self.pool_updates[provider.name] = member_updates
+            # Copy so merging other providers never changes this provider's updates
+            self._merge_updates(all_updates, copy.deepcopy(member_updates[0]))
+
+        self._merge_updates(self.settings_updates, copy.deepcopy(all_updates))
+        self._save_plan()
+        return all_updates
+
+    def _save_plan(self) -> None:
+        """Cache the startup plan with the settings updates of reused containers.
+
+        Only reused containers are recorded, as the ports of the others
+        change every run. Nothing is cached unless the ``plan_cache`` option
+        is set.
+        """
+        if self.plan is None or self.plan.key is None or not self.get_options()["plan_cache"]:
+            return
+
+        for name in self.reused_containers & self.container_updates.keys():
+            self.plan.containers[name] = ContainerPlan(
+                self.active_containers[name].get_container_id(), self.container_updates[name]
+            )
+        save_plan(self.plan)
+
+    def _update_settings(
+        self,
+        provider: ContainerProvider,
+        name: str,
+        member_configs: dict[str, dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Build the settings updates for one running container, timed.
+
+        Args:
+            provider: Provider of the container
+            name: Container name
+            member_configs: Configuration each container was created with
+
+        Returns:
+            Settings updates from the provider
+        """
+        container = self.active_containers[name]
+        recorded = self.plan.containers.get(name) if self.plan else None
+        if (
+            recorded is not None
+            and name in self.reused_containers
+            and recorded.id == container.get_container_id()
+        ):
+            # Same reused container as the cached plan, so the same ports
+            updates = copy.deepcopy(recorded.updates)
+        else:
+            with self.timings.record(name, "update_settings"):
+                updates = provider.update_settings(container, self.settings, member_configs[name])
+        self.container_updates[name] = updates
+
+        for alias in updates.get("DATABASES", {}):
+            # Pool members other than the first only serve xdist workers
+            self.database_containers.setdefault(alias, name)
+
+        return updates
+
+    def _merge_updates_copy(
+        self, target: dict[str, Any], updates: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Deep merge settings updates into a copy of ``target``.
+
+        Args:
+            target: Updates to merge into, left unchanged
+            updates: Updates to merge, left unchanged
+
+        Returns:
+            The merged updates
+        """
+        merged = copy.deepcopy(target)
+        self._merge_updates(merged, copy.deepcopy(updates))
+        return merged
+
+    def export_state(self) -> dict[str, Any]:
+        """Export what other processes need to use the running containers.
+
+        Returns:
+            Plain-data dict for :meth:`attach_shared_containers`
+        """
+        return {
+            "configs": self.provider_configs,
+            "updates": self.provider_updates,
+            "pools": self.pool_updates,
+        }
+
+    def attach_shared_containers(self, state: dict[str, Any], worker_index: int) -> dict[str, Any]:
+        """Use containers started by another process, such as the xdist controller.
+
+        No containers are started or stopped by this manager. Providers with a
+        container pool assign the worker to one pool member by consistent
+        hashing of its index. Each provider then adjusts the settings updates
+        for the worker, for example to give it its own Redis database.
+
+        Args:
+            state: Dict from :meth:`export_state` of the owning manager
+            worker_index: Zero-based index of this worker
 
-            self.active_containers[provider.name] = container
+        Returns:
+            Dict of settings updates to apply
+        """
+        all_updates: dict[str, Any] = {}
 
-            updates = provider.update_settings(container, self.settings, provider_config)
+        for name, updates in state["updates"].items():
+            config = state["configs"][name]
+            pool = state.get("pools", {}).get(name)
+            if pool:
+                updates = pool[consistent_hash(str(worker_index), len(pool))]
+            updates = self._started_provider(name).get_worker_updates(updates, config, worker_index)
 
-            self._merge_updates(all_updates, updates)
+            self.provider_configs[name] = config
+            self.provider_updates[name] = updates
+            self._merge_updates(all_updates, copy.deepcopy(updates))
 
-        self.settings_updates = all_updates
+        self.settings_updates = copy.deepcopy(all_updates)
         return all_updates
 
-    def stop_containers(self) -> None:
-        """Stop and remove all active containers."""
-        for container in self.active_containers.values():
+    def reset_between_tests(self) -> None:
+        """Let each provider clear the state the last test left in its container."""
+        for name, updates in self.provider_updates.items():
+            self._started_provider(name).reset_between_tests(updates, self.provider_configs[name])
+
+    def get_database_providers(self) -> dict[str, ContainerProvider]:
+        """Map each database alias served by a running container to its provider.
+
+        Returns:
+            Dict of DATABASES alias to provider, in provider order
+        """
+        aliases: dict[str, ContainerProvider] = {}
+
+        for name, updates in self.provider_updates.items():
+            for alias in updates.get("DATABASES", {}):
+                aliases[alias] = self._started_provider(name)
+
+        return aliases
+
+    def get_database_container(self, alias: str) -> DockerContainer | None:
+        """Get the running container serving a database alias.
+
+        Args:
+            alias: DATABASES alias
+
+        Returns:
+            The container, or None if this manager did not start it (for
+            example in an xdist worker)
+        """
+        name = self.database_containers.get(alias)
+        return self.active_containers.get(name) if name is not None else None
+
+    def _pool_member_names(self, provider_name: str, config: dict[str, Any]) -> list[str]:
+        """Name the containers started for a provider.
+
+        Args:
+            provider_name: Name of the provider
+            config: Effective provider configuration
+
+        Returns:
+            The provider name, followed by ``<name>-1`` ... for extra pool members
+        """
+        pool_size = max(int(config.get("pool_size", 1)), 1)
+        return [provider_name] + [f"{provider_name}-{i}" for i in range(1, pool_size)]
+
+    def _resolve_baked_image(
+        self, provider: ContainerProvider, config: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Swap in a baked image for providers with ``bake`` set, when one exists.
+
+        Template databases are enabled for the provider, so tests start from
+        the template baked into the image instead of migrating. The returned
+        configuration has ``baked`` set for the provider's container setup.
+
+        Args:
+            provider: Provider about to be started
+            config: Effective provider configuration, updated in place
+
+        Returns:
+            Configuration to create the container with
+        """
+        if not config.get("bake"):
+            return config
+
+        tag = bake_tag(provider, config, database_fingerprint(get_fixtures(config)))
+        if not baked_image_exists(DockerClient().client, tag):
+            logger.info(
+                "No baked image %s for %s, run 'django-testcontainers bake' to create it",
+                tag,
+                provider.name,
+            )
+            return config
+
+        config["template"] = True
+        return {**config, "image": tag, "baked": True}
+
+    def _reuse_enabled(self, config: dict[str, Any]) -> bool:
+        """Check whether a provider runs in reuse mode.
+
+        Args:
+            config: Effective provider configuration
+
+        Returns:
+            The provider's ``reuse`` setting, falling back to the global option
+        """
+        return bool(config.get("reuse", self.get_options()["reuse"]))
+
+    def _prepare_reuse(
+        self, containers: dict[str, DockerContainer], configs: dict[str, dict[str, Any]]
+    ) -> None:
+        """Attach to running reusable containers and label the ones still to start.
+
+        Expired reusable containers are pruned first. Reused containers must
+        outlive the session, so the Ryuk reaper is disabled for it; containers
+        that are not reused are still removed by :meth:`stop_containers`.
+
+        If Ryuk is already running in this process, it would remove any
+        container created now when the session ends, so running reusable
+        containers are still attached to but new ones are started as ordinary
+        containers, with a warning.
+
+        Args:
+            containers: Containers in reuse mode, keyed by container name
+            configs: Effective provider configurations, keyed by container name
+        """
+        options = self.get_options()
+        testcontainers_config.ryuk_disabled = True
+        reaper_running = Reaper._instance is not None
+
+        client = next(iter(containers.values())).get_docker_client().client
+        prune_reusable_containers(
+            client, ttl=options["reuse_ttl"], idle_timeout=options["reuse_idle_timeout"]
+        )
+
+        for name, container in containers.items():
+            digest = config_hash(name, configs[name])
+
+            existing = find_reusable_container(client, digest)
+            if existing is not None:
+                attach_container(container, existing)
+                self.active_containers[name] = container
+                self.reused_containers.add(name)
+            elif reaper_running:
+                logger.warning(
+                    "Not reusing the %s container: the Ryuk reaper is already running in this "
+                    "process and would remove it when the session ends",
+                    name,
+                )
+            else:
+                label_container(container, name, digest)
+                self.reused_containers.add(name)
+
+    def _start_serial(self, containers: dict[str, DockerContainer]) -> None:
+        """Start containers one after another.
+
+        Args:
+            containers: Containers to start, keyed by provider name
+        """
+        for name, container in containers.items():
             try:
-                container.stop()
+                self._start_container(name, container)
             except Exception:
-                ...
+                self._abort_start(containers)
+                raise
 
-        self.active_containers.clear()
+            self.active_containers[name] = container
 
-    def _merge_updates(self, target: dict[str, Any], updates: dict[str, Any]) -> None:
-        """Deep merge settings updates.
+    def _start_parallel(self, containers: dict[str, DockerContainer]) -> None:
+        """Start containers concurrently and wait for all of them to be ready.
+
+        If any container fails to start, the ones that did start, and those
+        created but never ready, are stopped and the first error is re-raised.
 
         Args:
-            target: Target dict to merge into
-            updates: Updates to merge
+            containers: Containers to start, keyed by provider name
         """
-        for key, value in updates.items():
-            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-                self._merge_updates(target[key], value)
-            else:
-                target[key] = value
+        self._ensure_reaper(containers.values())
 
-    def _check_unavailable_providers(self) -> None:
-        """Check if any unavailable providers would have been auto-detected.
+        errors: list[Exception] = []
 
-        Raises:
-            MissingDependencyError: If a provider is needed but unavailable
+        with ThreadPoolExecutor(
+            max_workers=len(containers), thread_name_prefix="testcontainers"
+        ) as executor:
+            futures = {
+                name: executor.submit(self._start_container, name, container)
+                for name, container in containers.items()
+            }
+
+            for name, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+                else:
+                    self.active_containers[name] = containers[name]
+
+        if errors:
+            self._abort_start(containers)
+            raise errors[0]
+
+    def _abort_start(self, containers: dict[str, DockerContainer]) -> None:
+        """Stop every container after one of them failed to start.
+
+        Containers whose ``start()`` failed after Docker created them, for
+        example on a readiness timeout, are not active but still exist. They
+        are removed too, even in reuse mode, so they neither leak when Ryuk is
+        disabled nor get attached to by a later session.
+
+        Args:
+            containers: Containers that were being started, keyed by name
+        """
+        failed = {
+            name: container
+            for name, container in containers.items()
+            if name not in self.active_containers
+            and getattr(container, "_container", None) is not None
+        }
+        stop_concurrently(failed)
+        self.stop_containers(wait=True)
+
+    def _start_container(self, name: str, container: DockerContainer) -> None:
+        """Start a container, recording how long it took.
+
+        When the provider's readiness probe was used, the time spent waiting
+        for it is recorded as a separate ``ready`` phase.
+
+        Args:
+            name: Container name
+            container: Container to start
         """
-        if not UNAVAILABLE_PROVIDERS:
+        started = time.perf_counter()
+        try:
+            container.start()
+        finally:
+            elapsed = time.perf_counter() - started
+            strategy = getattr(container, "_wait_strategy", None)
+            waited = strategy.waited if isinstance(strategy, ProbeWaitStrategy) else None
+            self.timings.add(name, "start", elapsed - (waited or 0.0))
+            if waited is not None:
+                self.timings.add(name, "ready", waited)
+
+    def _prefetch_images(self, containers: dict[str, DockerContainer]) -> None:
+        """Pull the images of containers about to start, all at once.
+
+        Without this, each container would pull its image inside ``start()``,
+        one after another when starting serially. With the ``offline`` option,
+        images are only loaded from ``image_dir`` and a missing image fails
+        here before anything is started.
+
+        Args:
+            containers: Containers to start, keyed by container name
+        """
+        images = {
+            name: container.image
+            for name, container in containers.items()
+            if isinstance(container, DockerContainer)
+        }
+        if not images:
             return
 
-        config = self.get_testcontainers_config()
+        options = self.get_options()
+        extra = []
+        if options["offline"] and not testcontainers_config.ryuk_disabled:
+            # The reaper is started on demand and would try to pull its image too
+            extra.append(testcontainers_config.ryuk_image)
+
+        client = next(iter(containers.values())).get_docker_client().client
+        resolved = prefetch_images(
+            client,
+            [*images.values(), *extra],
+            image_dir=options["image_dir"],
+            offline=options["offline"],
+        )
 
-        for provider_name, (
-            extra_name,
-            original_error,
-        ) in UNAVAILABLE_PROVIDERS.items():
-            provider_config = config.get(provider_name, {})
-
-            if provider_config.get("enabled", False):
-                self._raise_missing_dependency_error(
-                    provider_name,
-                    extra_name,
-                    original_error,
-                    f"TESTCONTAINERS['{provider_name}']",
-                )
+        for name, image in images.items():
+            if resolved[image].pulled:
+                self.timings.add(name, "pull", resolved[image].seconds)
 
-            if provider_config.get("auto", True) is not False:
-                detected_location = self._would_be_auto_detected(provider_name)
-                if detected_location:
-                    self._raise_missing_dependency_error(
-                        provider_name, extra_name, original_error, detected_location
-                    )
+    def save_timings(self, suffix: str = "") -> None:
+        """Write the startup timings to the ``timings_file`` option, if set.
 
-    def _would_be_auto_detected(self, provider_name: str) -> str | None:
-        """Check if a provider would be auto-detected from settings.
+        Args:
+            suffix: Added to the file name before its extension, for example
+                to give each xdist worker its own file
+        """
+        timings_file = self.get_options()["timings_file"]
+        if not timings_file:
+            return
+
+        path = Path(timings_file)
+        self.timings.write_json(path.with_name(f"{path.stem}{suffix}{path.suffix}"))
+
+    def _ensure_reaper(self, containers: Iterable[DockerContainer]) -> None:
+        """Create the Ryuk reaper before starting containers from several threads.
+
+        testcontainers creates the reaper lazily inside ``start()``, and two
+        threads doing so at once would both try to create it.
 
         Args:
-            provider_name: Name of the provider to check
+            containers: Containers about to be started
+        """
+        if testcontainers_config.ryuk_disabled:
+            return
+
+        if any(isinstance(container, DockerContainer) for container in containers):
+            Reaper.get_instance()
+
+    def memory_usage(self) -> dict[str, int]:
+        """Read the current memory use of each active container.
+
+        The figure includes data kept on tmpfs mounts.
 
         Returns:
-            String describing where it was detected, or None if not detected
+            Dict of container name to bytes in use, skipping containers
+            whose stats could not be read
+        """
+        usage: dict[str, int] = {}
+
+        for name, container in self.active_containers.items():
+            try:
+                stats = container.get_wrapped_container().stats(stream=False, one_shot=True)
+                usage[name] = int(stats["memory_stats"]["usage"])
+            except Exception as e:
+                logger.debug("Could not read memory stats for %s: %s", name, e)
+
+        return usage
+
+    def memory_report(self) -> list[str]:
+        """Describe the memory cost of each active container.
+
+        Returns:
+            One line per container, such as ``postgres: 212.5 MiB``
+        """
+        return [f"{name}: {used / 2**20:.1f} MiB" for name, used in self.memory_usage().items()]
+
+    def stop_containers(self, wait: bool | None = None) -> None:
+        """Stop and remove all active containers.
+
+        Containers are stopped concurrently. With the ``background_teardown``
+        option, they are instead handed to a detached process that removes
+        them, and this returns right away. Failures are logged.
+
+        Containers in reuse mode are left running for the next session.
+
+        Args:
+            wait: Override the ``background_teardown`` option, True to wait
+                for the containers to be removed
         """
-        if provider_name == "mysql":
-            databases = getattr(self.settings, "DATABASES", {})
-            for db_name, db_config in databases.items():
-                if isinstance(db_config, dict):
-                    engine = db_config.get("ENGINE", "")
-                    if "mysql" in engine.lower() or "mariadb" in engine.lower():
-                        return f"DATABASES['{db_name}']['ENGINE']"
+        to_stop = {
+            name: container
+            for name, container in self.active_containers.items()
+            if name not in self.reused_containers
+        }
+        background = self.get_options()["background_teardown"] if wait is None else not wait
 
-        elif provider_name == "redis":
-            caches = getattr(self.settings, "CACHES", {})
-            for cache_name, cache_config in caches.items():
-                if isinstance(cache_config, dict):
-                    backend = cache_config.get("BACKEND", "")
-                    if "redis" in backend.lower():
-                        return f"CACHES['{cache_name}']['BACKEND']"
+        if not (background and remove_in_background(to_stop)):
+            stop_concurrently(to_stop)
 
-            celery_broker = getattr(self.settings, "CELERY_BROKER_URL", "")
-            if "redis://" in celery_broker.lower():
-                return "CELERY_BROKER_URL"
+        self.active_containers.clear()
+        self.reused_containers.clear()
+        self.provider_configs.clear()
+        self.provider_updates.clear()
+        self.pool_updates.clear()
+        self.database_containers.clear()
+        self.pending_providers.clear()
 
-            session_engine = getattr(self.settings, "SESSION_ENGINE", "")
-            if "redis" in session_engine.lower():
-                return "SESSION_ENGINE"
+    def _merge_updates(self, target: dict[str, Any], updates: dict[str, Any]) -> None:
+        """Deep merge settings updates.
 
-        return None
+        Args:
+            target: Target dict to merge into
+            updates: Updates to merge
+        """
+        for key, value in updates.items():
+            if key in target and isinstance(target[key], dict) and isinstance(value, dict):
+                self._merge_updates(target[key], value)
+            else:
+                target[key] = value
 
     def _raise_missing_dependency_error(
         self,
         provider_name: str,
         extra_name: str,
         original_error: Exception,
-        detected_in: str,
-    ) -> None:
+        detected_in: str | None,
+    ) -> NoReturn:
         """Raise a helpful MissingDependencyError.
 
         Args:
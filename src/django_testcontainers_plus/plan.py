@@ -0,0 +1,194 @@
+import hashlib
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
+
+from .cache import read_json, write_json
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+PLAN_FILE = "plans.json"
+
+# Most plans kept in the cache file, the oldest are dropped first
+MAX_CACHED_PLANS = 20
+
+# Distributions whose versions are part of the plan key
+PLAN_PACKAGES = ("django-testcontainers-plus", "testcontainers", "django")
+
+# Settings always part of the plan key, besides those named by detection rules
+PLAN_SETTINGS = ("TESTCONTAINERS", "TESTCONTAINERS_OPTIONS")
+
+
+@dataclass
+class ProviderPlan:
+    """What the manager will start for one provider."""
+
+    name: str
+    image: str | None
+    # Effective provider configuration
+    config: dict[str, Any]
+    # Resource the provider waits for in lazy mode, None if started eagerly
+    lazy_resource: str | None
+
+
+@dataclass
+class ContainerPlan:
+    """A reused container and the settings updates it gave last time."""
+
+    id: str
+    updates: dict[str, Any]
+
+
+@dataclass
+class StartupPlan:
+    """Which providers to start and how, derived from the Django settings.
+
+    Serialisable, so it can be cached between runs by :func:`save_plan`.
+    """
+
+    # Cache key from plan_key, None if the plan cannot be cached
+    key: str | None
+    providers: list[ProviderPlan]
+    # Reused containers by container name, filled in once they are running
+    containers: dict[str, ContainerPlan] = field(default_factory=dict)
+    created: float = field(default_factory=time.time)
+    # Whether the plan was read from the cache rather than built this run
+    cached: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the plan to plain data.
+
+        Returns:
+            JSON-serialisable dict, read back by :meth:`from_dict`
+        """
+        data = asdict(self)
+        del data["cached"]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "StartupPlan":
+        """Build a plan from :meth:`as_dict` output.
+
+        Args:
+            data: Plain data of a plan
+
+        Returns:
+            The plan, marked as cached
+        """
+        return cls(
+            key=data["key"],
+            providers=[ProviderPlan(**provider) for provider in data["providers"]],
+            containers={
+                name: ContainerPlan(**container)
+                for name, container in data.get("containers", {}).items()
+            },
+            created=data.get("created", 0.0),
+            cached=True,
+        )
+
+    def format_table(self) -> str:
+        """Format the plan as a text table.
+
+        Returns:
+            One row per provider, or a note that nothing will be started
+        """
+        if not self.providers:
+            return "No containers are needed by these settings"
+
+        rows = [("PROVIDER", "IMAGE", "START")]
+        rows.extend(
+            (
+                provider.name,
+                provider.image or "-",
+                f"on first use of {provider.lazy_resource}" if provider.lazy_resource else "eager",
+            )
+            for provider in self.providers
+        )
+        widths = [max(len(row[i]) for row in rows) for i in range(3)]
+        return "\n".join(
+            "  ".join(value.ljust(width) for value, width in zip(row, widths, strict=True)).rstrip()
+            for row in rows
+        )
+
+
+def plan_key(manager: "ContainerManager") -> str | None:
+    """Hash everything a startup plan is derived from.
+
+    That is every setting named by a provider's detection rules, the
+    ``TESTCONTAINERS`` settings, the installed versions of this package,
+    testcontainers and Django, and the known providers.
+
+    Args:
+        manager: Manager for the Django settings
+
+    Returns:
+        Hex digest, None if a provider detects itself without rules, since
+        the settings it reads are then unknown
+    """
+    specs = manager.get_provider_specs()
+    if any(not spec.detection_rules for spec in specs):
+        return None
+
+    names = sorted(
+        {rule.setting for spec in specs for rule in spec.detection_rules} | set(PLAN_SETTINGS)
+    )
+    payload = json.dumps(
+        {
+            "settings": {name: getattr(manager.settings, name, None) for name in names},
+            "packages": {name: _version(name) for name in PLAN_PACKAGES},
+            "providers": [spec.target for spec in specs],
+        },
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def load_plan(key: str) -> StartupPlan | None:
+    """Read a cached startup plan.
+
+    Args:
+        key: Plan key from :func:`plan_key`
+
+    Returns:
+        The cached plan, None if there is none or it cannot be read
+    """
+    data = read_json(PLAN_FILE).get(key)
+    if not isinstance(data, dict):
+        return None
+    try:
+        return StartupPlan.from_dict(data)
+    except (KeyError, TypeError):
+        return None
+
+
+def save_plan(plan: StartupPlan) -> None:
+    """Cache a startup plan, replacing the one with the same key.
+
+    Plans without a key, and plans whose configuration does not survive a
+    JSON round trip (for example because it holds a callable), are not cached.
+
+    Args:
+        plan: Plan to cache
+    """
+    data = plan.as_dict()
+    if plan.key is None or json.loads(json.dumps(data, default=repr)) != data:
+        return
+
+    plans = read_json(PLAN_FILE)
+    plans[plan.key] = data
+    oldest_first = sorted(plans, key=lambda key: plans[key].get("created", 0.0))
+    for key in oldest_first[: max(0, len(plans) - MAX_CACHED_PLANS)]:
+        del plans[key]
+    write_json(PLAN_FILE, plans)
+
+
+def _version(distribution: str) -> str | None:
+    """Installed version of a distribution, None if it is not installed."""
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return None
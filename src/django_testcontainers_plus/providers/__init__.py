@@ -1,31 +1,40 @@
+from typing import Any
+
+from ..detection import MYSQL_RULES, POSTGRES_RULES, REDIS_RULES
 from .base import ContainerProvider
-from .postgres import PostgresProvider
+from .registry import ENTRY_POINT_GROUP, ProviderRegistry, ProviderSpec
 
 __all__ = [
     "ContainerProvider",
     "PostgresProvider",
+    "MySQLProvider",
+    "RedisProvider",
+    "ProviderRegistry",
+    "ProviderSpec",
+    "ENTRY_POINT_GROUP",
+    "BUILTIN_PROVIDERS",
     "PROVIDER_REGISTRY",
-    "UNAVAILABLE_PROVIDERS",
 ]
 
-PROVIDER_REGISTRY: list[ContainerProvider] = [
-    PostgresProvider(),
+BUILTIN_PROVIDERS = [
+    ProviderSpec("postgres", f"{__name__}.postgres:PostgresProvider", POSTGRES_RULES),
+    ProviderSpec("mysql", f"{__name__}.mysql:MySQLProvider", MYSQL_RULES, extra="mysql"),
+    ProviderSpec("redis", f"{__name__}.redis:RedisProvider", REDIS_RULES, extra="redis"),
 ]
 
-UNAVAILABLE_PROVIDERS: dict[str, tuple[str, Exception]] = {}
+PROVIDER_REGISTRY = ProviderRegistry(BUILTIN_PROVIDERS)
 
-try:
-    from .mysql import MySQLProvider
+# Provider classes, imported from their modules on first access
+_PROVIDER_CLASSES = {
+    "PostgresProvider": ".postgres",
+    "MySQLProvider": ".mysql",
+    "RedisProvider": ".redis",
+}
 
-    PROVIDER_REGISTRY.append(MySQLProvider())
-    __all__.append("MySQLProvider")
-except ImportError as e:
-    UNAVAILABLE_PROVIDERS["mysql"] = ("mysql", e)
 
-try:
-    from .redis import RedisProvider
+def __getattr__(name: str) -> Any:
+    if name in _PROVIDER_CLASSES:
+        import importlib
 
-    PROVIDER_REGISTRY.append(RedisProvider())
-    __all__.append("RedisProvider")
-except ImportError as e:
-    UNAVAILABLE_PROVIDERS["redis"] = ("redis", e)
+        return getattr(importlib.import_module(_PROVIDER_CLASSES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
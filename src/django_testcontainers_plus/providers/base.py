@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 from testcontainers.core.generic import DockerContainer
 
+from ..detection import DetectionRule, SettingsIndex
+from ..readiness import ProbeWaitStrategy, tcp_probe
+
 
 class ContainerProvider(ABC):
     """Base class for all container providers.
@@ -13,23 +16,59 @@ class ContainerProvider(ABC):
     3. Providing settings updates with container connection info
     """
 
+    # Server arguments for each named ``profile``
+    PROFILES: ClassVar[dict[str, list[str]]] = {}
+
+    # Directory the server keeps its data in, for providers with a data directory
+    DATA_DIR: ClassVar[str | None] = None
+
+    # Container port the service listens on, probed for readiness
+    PORT: ClassVar[int | None] = None
+
+    # Seconds to wait for a started container to become ready
+    READY_TIMEOUT: ClassVar[float] = 60.0
+
+    # Settings entries that need this service, see :meth:`detect`
+    DETECTION_RULES: ClassVar[tuple[DetectionRule, ...]] = ()
+
+    # Whether ``bake`` can be set, see :meth:`prepare_for_commit`
+    SUPPORTS_BAKE: ClassVar[bool] = False
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Unique identifier for this provider."""
         ...
 
-    @abstractmethod
     def can_auto_detect(self, settings: Any) -> bool:
         """Check if this service is needed based on Django settings.
 
+        The default implementation checks :attr:`DETECTION_RULES`.
+
         Args:
             settings: Django settings module
 
         Returns:
             True if this service should be automatically started
         """
-        ...
+        return self.detect(SettingsIndex(settings, self.DETECTION_RULES))
+
+    def detect(self, index: SettingsIndex) -> bool:
+        """Check if this service is needed, using a prebuilt settings index.
+
+        Used by the manager, which indexes the settings once for all
+        providers. Providers without :attr:`DETECTION_RULES` fall back to
+        :meth:`can_auto_detect`.
+
+        Args:
+            index: Index built with the rules of every provider
+
+        Returns:
+            True if this service should be automatically started
+        """
+        if not self.DETECTION_RULES:
+            return self.can_auto_detect(index.settings)
+        return any(index.matches(kind) for kind in {rule.kind for rule in self.DETECTION_RULES})
 
     @abstractmethod
     def get_container(self, config: dict[str, Any]) -> DockerContainer:
@@ -66,3 +105,341 @@ class ContainerProvider(ABC):
             Default configuration dict
         """
         return {}
+
+    def get_container_configs(
+        self, settings: Any, config: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """Split the provider into several containers.
+
+        Each part gets its own container, created by :meth:`get_container`
+        and passed to :meth:`update_settings` with the part's configuration.
+        The settings updates of all parts are merged.
+
+        Args:
+            settings: Django settings module
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            Dict of part name to its configuration. The main part is named
+            ``""`` and must be ``config`` itself; only it is pooled with
+            ``pool_size``. By default there is only the main part.
+        """
+        return {"": config}
+
+    def configure_container(
+        self, container: DockerContainer, config: dict[str, Any]
+    ) -> DockerContainer:
+        """Apply the options every provider supports to a newly created container.
+
+        Args:
+            container: Unstarted container from :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            The configured container
+        """
+        container = self.apply_profile(container, config)
+        container = self.apply_tmpfs(container, config)
+        return self.apply_readiness_probe(container, config)
+
+    def apply_readiness_probe(
+        self, container: DockerContainer, config: dict[str, Any], port: int | None = None
+    ) -> DockerContainer:
+        """Wait for the container with :meth:`probe_ready` instead of testcontainers' waits.
+
+        testcontainers waits for databases by scraping logs or running a
+        client inside the container, with fixed sleeps in between. Probing
+        the port directly with a short backoff notices readiness sooner.
+        Disabled with ``readiness_probe: False``; ``ready_timeout`` sets the
+        deadline in seconds.
+
+        Args:
+            container: Unstarted container from :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+            port: Container port to probe, instead of :attr:`PORT`
+
+        Returns:
+            The configured container
+        """
+        port = port if port is not None else self.PORT
+        if port is None or not config.get("readiness_probe", True):
+            return container
+
+        strategy = ProbeWaitStrategy(self, config, port).with_startup_timeout(
+            config.get("ready_timeout", self.READY_TIMEOUT)
+        )
+        container.waiting_for(strategy)
+
+        if hasattr(container, "_connect"):
+            # Database containers wait again after start(); the probe already did
+            container._connect = _skip_connect
+
+        return container
+
+    def probe_ready(self, host: str, port: int, config: dict[str, Any]) -> bool:
+        """Check once whether the started service accepts connections.
+
+        Args:
+            host: Host the container port is published on
+            port: Published port
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            True if ready; False or a connection error if not yet
+        """
+        return tcp_probe(host, port)
+
+    def apply_profile(self, container: DockerContainer, config: dict[str, Any]) -> DockerContainer:
+        """Apply the server profile selected with ``profile`` in the config.
+
+        The ``fast`` profile trades durability for speed and also keeps the
+        data directory on tmpfs (see :meth:`apply_tmpfs`).
+
+        Args:
+            container: Unstarted container from :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            The configured container
+
+        Raises:
+            ValueError: If the provider has no such profile
+        """
+        command = self.profile_command(config)
+        if command is None:
+            return container
+
+        return container.with_command(command)
+
+    def profile_command(self, config: dict[str, Any]) -> list[str] | None:
+        """Look up the server arguments of the ``profile`` selected in the config.
+
+        Args:
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            The profile's server arguments, None if no profile is selected
+
+        Raises:
+            ValueError: If the provider has no such profile
+        """
+        profile = config.get("profile")
+        if profile is None:
+            return None
+
+        if profile not in self.PROFILES:
+            available = ", ".join(sorted(self.PROFILES)) or "none"
+            raise ValueError(
+                f"Unknown profile {profile!r} for {self.name} (available: {available})"
+            )
+
+        return self.PROFILES[profile]
+
+    def apply_tmpfs(self, container: DockerContainer, config: dict[str, Any]) -> DockerContainer:
+        """Mount the data directory in RAM when ``tmpfs`` is set in the config.
+
+        ``tmpfs`` may be True, or a size such as ``"512m"`` that caps the
+        memory the mount can use. It defaults to True with the ``fast``
+        profile.
+
+        Args:
+            container: Unstarted container from :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            The configured container
+
+        Raises:
+            ValueError: If ``tmpfs`` is set for a provider without a data directory
+        """
+        tmpfs = self.tmpfs_option(config)
+        if not tmpfs:
+            return container
+
+        data_dirs = self.data_dirs(config)
+        if not data_dirs:
+            if "tmpfs" in config:
+                raise ValueError(f"The {self.name} provider has no data directory for tmpfs")
+            return container
+
+        # testcontainers passes the value through as the mount options
+        options = "rw" if tmpfs is True else f"rw,size={tmpfs}"
+        for data_dir in data_dirs:
+            container = container.with_tmpfs_mount(data_dir, options)
+        return container
+
+    def tmpfs_option(self, config: dict[str, Any]) -> bool | str:
+        """Read the ``tmpfs`` option, which defaults to True with the ``fast`` profile.
+
+        Args:
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            True, False or a tmpfs size such as ``"512m"``
+        """
+        tmpfs: bool | str = config.get("tmpfs", config.get("profile") == "fast")
+        return tmpfs
+
+    def data_dirs(self, config: dict[str, Any]) -> list[str]:
+        """List the directories the container keeps its data in, for :meth:`apply_tmpfs`.
+
+        Args:
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            :attr:`DATA_DIR`, or nothing for providers without one
+        """
+        return [self.DATA_DIR] if self.DATA_DIR is not None else []
+
+    def get_lazy_resource(self, settings: Any) -> str | None:
+        """Name the resource whose first use starts this container in lazy mode.
+
+        Args:
+            settings: Django settings module
+
+        Returns:
+            ``"databases"`` or ``"caches"``, or None to start the container
+            up front even in lazy mode
+        """
+        return None
+
+    def get_worker_updates(
+        self, updates: dict[str, Any], config: dict[str, Any], worker_index: int
+    ) -> dict[str, Any]:
+        """Adjust settings updates for one of several workers sharing the container.
+
+        Args:
+            updates: Settings updates from :meth:`update_settings`
+            config: Configuration dict from TESTCONTAINERS setting
+            worker_index: Zero-based index of the worker
+
+        Returns:
+            Settings updates for this worker, unchanged by default
+        """
+        return updates
+
+    def reset_between_tests(self, updates: dict[str, Any], config: dict[str, Any]) -> None:
+        """Clear state a test left in the container before the next test runs.
+
+        Args:
+            updates: Settings updates in use by this process
+            config: Configuration dict from TESTCONTAINERS setting
+        """
+        return None
+
+    def prepare_for_commit(self, container: DockerContainer, config: dict[str, Any]) -> None:
+        """Configure an unstarted container so ``docker commit`` captures its data.
+
+        Official database images declare their data directory as a volume,
+        which ``docker commit`` skips. Providers that set ``SUPPORTS_BAKE``
+        move the data directory into the container's own filesystem.
+
+        Args:
+            container: Container returned by :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+        """
+        return None
+
+    def restore_template_database(self, connection: Any, config: dict[str, Any], key: str) -> bool:
+        """Create a test database from a previously saved template.
+
+        Called before Django creates the test database for an alias served
+        by this provider when ``template`` is enabled in its config.
+
+        Args:
+            connection: Django database connection for the alias
+            config: Configuration dict from TESTCONTAINERS setting
+            key: Hash of the migrations and configuration the template was built from
+
+        Returns:
+            True if the test database was restored and only needs its
+            (already applied) migrations checked, False if it must be built
+        """
+        return False
+
+    def clone_test_databases(
+        self,
+        container: DockerContainer | None,
+        connection: Any,
+        config: dict[str, Any],
+        suffixes: list[str],
+        verbosity: int,
+        keepdb: bool,
+    ) -> bool:
+        """Create the clones of a test database used by Django's ``--parallel`` runner.
+
+        Called once per test database with every clone suffix, so providers
+        can create all clones at once instead of one after another.
+
+        Args:
+            container: Container serving the database, None if not started
+                by this process
+            connection: Django database connection of the migrated test database
+            config: Configuration dict from TESTCONTAINERS setting
+            suffixes: Clone suffixes, as passed to ``get_test_db_clone_settings``
+            verbosity: Django verbosity
+            keepdb: Keep existing clones
+
+        Returns:
+            True if the clones were created, False to let Django clone serially
+        """
+        return False
+
+    def save_template_database(self, connection: Any, config: dict[str, Any], key: str) -> None:
+        """Save a freshly migrated test database as a template for later sessions.
+
+        Args:
+            connection: Django database connection for the alias
+            config: Configuration dict from TESTCONTAINERS setting
+            key: Hash of the migrations and configuration the template is built from
+        """
+        return None
+
+    def dump_table_data(self, connection: Any, tables: list[str]) -> Any:
+        """Snapshot the rows of tables that fixtures were just loaded into.
+
+        Runs on the test's own connection, inside its transaction, so
+        uncommitted fixture data is included. The default implementation
+        reads every row with ``SELECT``.
+
+        Args:
+            connection: Django database connection for the alias
+            tables: Names of the tables to snapshot
+
+        Returns:
+            Snapshot passed back to :meth:`load_table_data`
+        """
+        quote = connection.ops.quote_name
+        data: dict[str, tuple[list[str], list[tuple[Any, ...]]]] = {}
+
+        with connection.cursor() as cursor:
+            for table in tables:
+                cursor.execute(f"SELECT * FROM {quote(table)}")
+                columns = [column[0] for column in cursor.description]
+                data[table] = (columns, [tuple(row) for row in cursor.fetchall()])
+
+        return data
+
+    def load_table_data(self, connection: Any, data: Any) -> None:
+        """Insert the rows of a snapshot into its (emptied) tables.
+
+        The default implementation inserts with ``executemany``, which MySQL
+        drivers send as multi-row ``INSERT`` statements.
+
+        Args:
+            connection: Django database connection for the alias
+            data: Snapshot returned by :meth:`dump_table_data`
+        """
+        quote = connection.ops.quote_name
+
+        with connection.cursor() as cursor:
+            for table, (columns, rows) in data.items():
+                if not rows:
+                    continue
+                names = ", ".join(quote(column) for column in columns)
+                params = ", ".join(["%s"] * len(columns))
+                cursor.executemany(f"INSERT INTO {quote(table)} ({names}) VALUES ({params})", rows)
+
+
+def _skip_connect() -> None:
+    """Replacement for ``DbContainer._connect`` once a readiness probe is in place."""
@@ -3,25 +3,62 @@ from typing import Any
 from testcontainers.core.generic import DockerContainer
 from testcontainers.mysql import MySqlContainer
 
+from ..detection import MYSQL_RULES, SettingsIndex
+from ..readiness import mysql_probe
 from .base import ContainerProvider
 
+# Run inside the container with ``sh -c`` to create clones of a test database:
+# one dump, then every clone loaded at the same time. Arguments: source
+# database, CREATE DATABASE suffix, user to grant access to, keepdb (0/1),
+# then the clone names.
+CLONE_SCRIPT = """
+set -e
+client=$(command -v mysql || command -v mariadb)
+dump=$(command -v mysqldump || command -v mariadb-dump)
+export MYSQL_PWD="${MYSQL_ROOT_PASSWORD:-$MARIADB_ROOT_PASSWORD}"
+source=$1 suffix=$2 user=$3 keepdb=$4
+shift 4
+"$dump" -uroot --routines --events --single-transaction "$source" > /tmp/clone.sql
+pids=""
+for target in "$@"; do
+  (
+    exists=$("$client" -uroot -N -e \\
+      "SELECT 1 FROM information_schema.SCHEMATA WHERE SCHEMA_NAME = '$target'")
+    if [ "$keepdb" = 1 ] && [ -n "$exists" ]; then exit 0; fi
+    "$client" -uroot -e "DROP DATABASE IF EXISTS \\`$target\\`; \\
+      CREATE DATABASE \\`$target\\` $suffix; \\
+      GRANT ALL PRIVILEGES ON \\`$target\\`.* TO '$user'@'%'"
+    "$client" -uroot "$target" < /tmp/clone.sql
+  ) &
+  pids="$pids $!"
+done
+status=0
+for pid in $pids; do wait "$pid" || status=1; done
+rm -f /tmp/clone.sql
+exit $status
+"""
+
 
 class MySQLProvider(ContainerProvider):
     """Provider for MySQL/MariaDB containers."""
 
+    DATA_DIR = "/var/lib/mysql"
+    PORT = 3306
+
+    DETECTION_RULES = MYSQL_RULES
+
+    PROFILES = {
+        "fast": [
+            "--innodb-flush-log-at-trx-commit=0",
+            "--skip-log-bin",
+            "--innodb-doublewrite=0",
+        ],
+    }
+
     @property
     def name(self) -> str:
         return "mysql"
 
-    def can_auto_detect(self, settings: Any) -> bool:
-        """Detect MySQL/MariaDB database from DATABASES setting."""
-        databases = getattr(settings, "DATABASES", {})
-        return any(
-            "mysql" in db.get("ENGINE", "").lower() or "mariadb" in db.get("ENGINE", "").lower()
-            for db in databases.values()
-            if isinstance(db, dict)
-        )
-
     def get_container(self, config: dict[str, Any]) -> DockerContainer:
         """Create MySQL container with configuration."""
         image = config.get("image", "mysql:8")
@@ -40,38 +77,93 @@ class MySQLProvider(ContainerProvider):
         for key, value in env.items():
             container = container.with_env(key, value)
 
-        return container
+        return self.configure_container(container, config)
+
+    def get_lazy_resource(self, settings: Any) -> str | None:
+        """Start when the first test needs a database."""
+        return "databases"
+
+    def probe_ready(self, host: str, port: int, config: dict[str, Any]) -> bool:
+        """Expect a MySQL initial handshake packet."""
+        return mysql_probe(host, port)
 
     def update_settings(
         self, container: DockerContainer, settings: Any, config: dict[str, Any]
     ) -> dict[str, Any]:
         """Update DATABASES setting with container connection info."""
         host = container.get_container_host_ip()
-        port = container.get_exposed_port(3306)
+        port = container.get_exposed_port(self.PORT)
         username = config.get("username", "test")
         password = config.get("password", "test")
         dbname = config.get("dbname", "test")
 
-        databases = getattr(settings, "DATABASES", {})
+        databases = SettingsIndex(settings, self.DETECTION_RULES).aliases(self.name, "DATABASES")
         updates: dict[str, Any] = {}
 
         for db_name, db_config in databases.items():
-            if isinstance(db_config, dict):
-                engine = db_config.get("ENGINE", "")
-                if "mysql" in engine.lower() or "mariadb" in engine.lower():
-                    if "DATABASES" not in updates:
-                        updates["DATABASES"] = {}
-                    updates["DATABASES"][db_name] = {
-                        **db_config,
-                        "HOST": host,
-                        "PORT": port,
-                        "USER": username,
-                        "PASSWORD": password,
-                        "NAME": dbname,
-                    }
+            if "DATABASES" not in updates:
+                updates["DATABASES"] = {}
+            updates["DATABASES"][db_name] = {
+                **db_config,
+                "HOST": host,
+                "PORT": port,
+                "USER": username,
+                "PASSWORD": password,
+                "NAME": dbname,
+            }
 
         return updates
 
+    def clone_test_databases(
+        self,
+        container: DockerContainer | None,
+        connection: Any,
+        config: dict[str, Any],
+        suffixes: list[str],
+        verbosity: int,
+        keepdb: bool,
+    ) -> bool:
+        """Dump the test database once inside the container and load every clone in parallel.
+
+        Django pipes ``mysqldump`` into ``mysql`` over the network once per
+        clone. Running both inside the container avoids the round trips and
+        loads all clones at once.
+
+        Raises:
+            RuntimeError: If dumping or loading failed
+        """
+        if container is None:
+            return False
+
+        source = connection.settings_dict["NAME"]
+        targets = [
+            connection.creation.get_test_db_clone_settings(suffix)["NAME"] for suffix in suffixes
+        ]
+
+        if verbosity >= 1:
+            connection.creation.log(
+                f"Cloning test database {source} {len(suffixes)} times inside the container..."
+            )
+
+        result = container.exec(
+            [
+                "sh",
+                "-c",
+                CLONE_SCRIPT,
+                "sh",
+                source,
+                connection.creation.sql_table_creation_suffix(),
+                connection.settings_dict["USER"],
+                "1" if keepdb else "0",
+                *targets,
+            ]
+        )
+        if result.exit_code != 0:
+            output = result.output.decode(errors="replace") if result.output else ""
+            raise RuntimeError(f"Cloning test database {source} failed: {output}")
+
+        return True
+
     def get_default_config(self) -> dict[str, Any]:
         return {
             "image": "mysql:8",
@@ -1,28 +1,78 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from testcontainers.core.generic import DockerContainer
 from testcontainers.postgres import PostgresContainer
 
+from ..detection import POSTGRES_RULES, SettingsIndex
+from ..readiness import postgres_probe
 from .base import ContainerProvider
 
+# Run with ``sh -c`` when ``replicas`` is set, followed by the primary's server
+# command. The primary starts through the image's entrypoint; each replica is
+# then cloned from it with ``pg_basebackup -R`` and streams from it on the
+# next port, with the same server arguments. Replicas start one at a time, so
+# once the last one accepts connections all of them do.
+REPLICA_SCRIPT = """
+set -e
+run_as=$(command -v gosu || command -v su-exec)
+docker-entrypoint.sh "$@" &
+primary=$!
+trap 'kill -TERM $primary; exit 0' TERM INT
+until pg_isready -q -h 127.0.0.1 -p 5432; do sleep 0.1; done
+shift
+for i in $(seq 1 "$POSTGRES_REPLICAS"); do
+  port=$((5432 + i))
+  dir="$POSTGRES_REPLICA_DIR/replica-$i"
+  PGPASSWORD="$POSTGRES_PASSWORD" "$run_as" postgres pg_basebackup \\
+    -h 127.0.0.1 -p 5432 -U "$POSTGRES_USER" -D "$dir" -R -X stream
+  "$run_as" postgres postgres -D "$dir" -p "$port" "$@" &
+  until pg_isready -q -h 127.0.0.1 -p "$port"; do sleep 0.1; done
+done
+wait $primary
+"""
+
+# Wraps the server command of a baked image when ``tmpfs`` applies. The image
+# keeps its data in ``POSTGRES_BAKED_DATA_DIR``, outside the tmpfs mount, so
+# it is copied to the mounted ``PGDATA`` before the entrypoint starts.
+BAKED_TMPFS_SCRIPT = """
+set -e
+cp -a "$POSTGRES_BAKED_DATA_DIR/." "$PGDATA"
+exec docker-entrypoint.sh "$@"
+"""
+
 
 class PostgresProvider(ContainerProvider):
     """Provider for PostgreSQL containers."""
 
+    BAKED_DATA_DIR = "/pgdata"
+    DATA_DIR = "/var/lib/postgresql/data"
+    # Parent of the replicas' data directories
+    REPLICA_DIR = "/var/lib/postgresql/replicas"
+    PORT = 5432
+
+    DETECTION_RULES = POSTGRES_RULES
+    SUPPORTS_BAKE = True
+
+    PROFILES = {
+        "fast": [
+            "postgres",
+            "-c",
+            "fsync=off",
+            "-c",
+            "synchronous_commit=off",
+            "-c",
+            "full_page_writes=off",
+            "-c",
+            "shared_buffers=256MB",
+        ],
+    }
+
     @property
     def name(self) -> str:
         return "postgres"
 
-    def can_auto_detect(self, settings: Any) -> bool:
-        """Detect PostgreSQL database from DATABASES setting."""
-        databases = getattr(settings, "DATABASES", {})
-        return any(
-            "postgresql" in db.get("ENGINE", "").lower()
-            or "psycopg" in db.get("ENGINE", "").lower()
-            for db in databases.values()
-            if isinstance(db, dict)
-        )
-
     def get_container(self, config: dict[str, Any]) -> DockerContainer:
         """Create PostgreSQL container with configuration."""
         image = config.get("image", "postgres:16")
@@ -30,7 +80,7 @@ class PostgresProvider(ContainerProvider):
         password = config.get("password", "test")
         dbname = config.get("dbname", "test")
 
-        container = PostgresContainer(
+        container: DockerContainer = PostgresContainer(
             image=image,
             username=username,
             password=password,
@@ -41,38 +91,344 @@ class PostgresProvider(ContainerProvider):
         for key, value in env.items():
             container = container.with_env(key, value)
 
+        replicas = self._replica_count(config)
+        if replicas:
+            container = self._with_replicas(container, config, replicas)
+        else:
+            container = self.configure_container(container, config)
+
+        if config.get("baked") and self.tmpfs_option(config):
+            container = self._copy_baked_data(container, config)
         return container
 
+    def _with_replicas(
+        self, container: DockerContainer, config: dict[str, Any], replicas: int
+    ) -> DockerContainer:
+        """Run streaming replicas of the primary server in the same container.
+
+        Replica ``n`` listens on container port ``5432 + n``. The profile's
+        server arguments apply to the primary and every replica, and with
+        ``tmpfs`` the replicas' data directories are in RAM as well.
+
+        Args:
+            container: Unstarted container from :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+            replicas: Number of replicas to start
+
+        Returns:
+            The configured container
+        """
+        container.with_env("POSTGRES_REPLICAS", str(replicas))
+        container.with_env("POSTGRES_REPLICA_DIR", self.REPLICA_DIR)
+        container.with_exposed_ports(*self._replica_ports(replicas))
+        container.with_command(self._server_command(config))
+
+        container = self.apply_tmpfs(container, config)
+        return self.apply_readiness_probe(container, config, port=self.PORT + replicas)
+
+    def _copy_baked_data(
+        self, container: DockerContainer, config: dict[str, Any]
+    ) -> DockerContainer:
+        """Start a baked image from a copy of its data on the tmpfs mount.
+
+        Mounting tmpfs at :attr:`BAKED_DATA_DIR` would hide the baked data, so
+        ``PGDATA`` is pointed back at the mounted :attr:`DATA_DIR` and the
+        baked data is copied there on start.
+
+        Args:
+            container: Container configured by :meth:`get_container`
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            The configured container
+        """
+        container.with_env("PGDATA", self.DATA_DIR)
+        container.with_env("POSTGRES_BAKED_DATA_DIR", self.BAKED_DATA_DIR)
+        return container.with_command(
+            ["sh", "-c", BAKED_TMPFS_SCRIPT, "sh", *self._server_command(config)]
+        )
+
+    def _server_command(self, config: dict[str, Any]) -> list[str]:
+        """Build the arguments the image's entrypoint is started with."""
+        primary_command = self.profile_command(config) or ["postgres"]
+        if self._replica_count(config):
+            return ["sh", "-c", REPLICA_SCRIPT, "sh", *primary_command]
+        return primary_command
+
+    def data_dirs(self, config: dict[str, Any]) -> list[str]:
+        """The primary's data directory, and with ``replicas`` the replicas' as well."""
+        if self._replica_count(config):
+            return [self.DATA_DIR, self.REPLICA_DIR]
+        return [self.DATA_DIR]
+
+    def get_lazy_resource(self, settings: Any) -> str | None:
+        """Start when the first test needs a database."""
+        return "databases"
+
+    def probe_ready(self, host: str, port: int, config: dict[str, Any]) -> bool:
+        """Send a Postgres startup packet and expect an authentication request."""
+        return postgres_probe(
+            host, port, config.get("username", "test"), config.get("dbname", "test")
+        )
+
+    def get_container_configs(
+        self, settings: Any, config: dict[str, Any]
+    ) -> dict[str, dict[str, Any]]:
+        """Give each ``container`` named in the ``databases`` option its own part.
+
+        Extra containers take the provider's configuration without replicas,
+        which belong to the main container.
+        """
+        configs = {"": config}
+
+        for options in config.get("databases", {}).values():
+            container = options.get("container")
+            if container and container not in configs:
+                part_config = {**config, "container": container}
+                part_config.pop("replicas", None)
+                part_config.pop("replica_aliases", None)
+                configs[container] = part_config
+
+        return configs
+
     def update_settings(
         self, container: DockerContainer, settings: Any, config: dict[str, Any]
     ) -> dict[str, Any]:
-        """Update DATABASES setting with container connection info."""
+        """Update DATABASES setting with container connection info.
+
+        Only the aliases placed on this container by the ``databases`` option
+        are updated, each with its own ``dbname`` if one is set there.
+
+        With ``replicas``, aliases mapped to a replica (see
+        :meth:`get_replica_aliases`) point at that replica's port and mirror
+        a primary alias, so Django does not try to create a test database on
+        a read-only server.
+
+        Raises:
+            ValueError: If every alias is mapped to a replica, leaving none
+                on the primary to mirror
+        """
         host = container.get_container_host_ip()
-        port = container.get_exposed_port(5432)
+        port = container.get_exposed_port(self.PORT)
         username = config.get("username", "test")
         password = config.get("password", "test")
         dbname = config.get("dbname", "test")
 
-        databases = getattr(settings, "DATABASES", {})
+        placement = config.get("databases", {})
+        served = {
+            alias: db_config
+            for alias, db_config in self._postgres_databases(settings).items()
+            if placement.get(alias, {}).get("container") == config.get("container")
+        }
+        replica_aliases = self.get_replica_aliases(served, config)
+        primary_alias = next((alias for alias in served if alias not in replica_aliases), None)
+        if replica_aliases and primary_alias is None:
+            raise ValueError(
+                f"Every database alias on this container ({', '.join(served)}) is mapped to "
+                "a replica; leave at least one on the primary for the replicas to mirror"
+            )
         updates: dict[str, Any] = {}
 
-        for db_name, db_config in databases.items():
-            if isinstance(db_config, dict):
-                engine = db_config.get("ENGINE", "")
-                if "postgresql" in engine.lower() or "psycopg" in engine.lower():
-                    if "DATABASES" not in updates:
-                        updates["DATABASES"] = {}
-                    updates["DATABASES"][db_name] = {
-                        **db_config,
-                        "HOST": host,
-                        "PORT": port,
-                        "USER": username,
-                        "PASSWORD": password,
-                        "NAME": dbname,
+        for db_name, db_config in served.items():
+            if "DATABASES" not in updates:
+                updates["DATABASES"] = {}
+            updates["DATABASES"][db_name] = {
+                **db_config,
+                "HOST": host,
+                "PORT": port,
+                "USER": username,
+                "PASSWORD": password,
+                "NAME": placement.get(db_name, {}).get("dbname", dbname),
+            }
+
+            replica = replica_aliases.get(db_name)
+            if replica is not None:
+                test_config = db_config.get("TEST", {})
+                updates["DATABASES"][db_name].update(
+                    {
+                        "PORT": container.get_exposed_port(self.PORT + replica),
+                        "TEST": {"MIRROR": primary_alias, **test_config},
                     }
+                )
 
         return updates
 
+    def get_replica_aliases(
+        self, databases: dict[str, Any], config: dict[str, Any]
+    ) -> dict[str, int]:
+        """Map database aliases to the replica serving them.
+
+        Aliases listed in ``replica_aliases`` use the given replica. Other
+        aliases with ``TEST['MIRROR']`` set are spread over the replicas in
+        ``DATABASES`` order.
+
+        Args:
+            databases: DATABASES entries served by the container
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            Dict of alias to replica number, starting at 1
+
+        Raises:
+            ValueError: If an alias is mapped to a replica that is not started
+        """
+        replicas = self._replica_count(config)
+        explicit: dict[str, int] = {
+            alias: replica
+            for alias, replica in config.get("replica_aliases", {}).items()
+            if alias in databases
+        }
+
+        for alias, replica in explicit.items():
+            if not 1 <= replica <= replicas:
+                raise ValueError(
+                    f"Database alias {alias!r} is mapped to replica {replica}, "
+                    f"but only {replicas} replicas are configured"
+                )
+
+        aliases = dict(explicit)
+        if not replicas:
+            return aliases
+
+        mirrors = [
+            alias
+            for alias, db_config in databases.items()
+            if alias not in explicit and db_config.get("TEST", {}).get("MIRROR")
+        ]
+        for i, alias in enumerate(mirrors):
+            aliases[alias] = i % replicas + 1
+
+        return aliases
+
+    def _postgres_databases(self, settings: Any) -> dict[str, Any]:
+        """Find the PostgreSQL DATABASES entries, in DATABASES order."""
+        return SettingsIndex(settings, self.DETECTION_RULES).aliases(self.name, "DATABASES")
+
+    def _replica_count(self, config: dict[str, Any]) -> int:
+        """Read the ``replicas`` option."""
+        return int(config.get("replicas", 0))
+
+    def _replica_ports(self, replicas: int) -> list[int]:
+        """Container ports of the replicas."""
+        return [self.PORT + n for n in range(1, replicas + 1)]
+
+    def prepare_for_commit(self, container: DockerContainer, config: dict[str, Any]) -> None:
+        """Move PGDATA out of the image's declared volume."""
+        container.with_env("PGDATA", self.BAKED_DATA_DIR)
+
+    def restore_template_database(self, connection: Any, config: dict[str, Any], key: str) -> bool:
+        """Create the test database with ``CREATE DATABASE ... TEMPLATE``."""
+        test_name = connection.creation._get_test_db_name()
+        template = self._template_name(key)
+        quote = connection.ops.quote_name
+
+        with connection._nodb_cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pg_catalog.pg_database WHERE datname = %s", [template])
+            if cursor.fetchone() is None:
+                return False
+
+            cursor.execute(f"DROP DATABASE IF EXISTS {quote(test_name)}")
+            cursor.execute(f"CREATE DATABASE {quote(test_name)} TEMPLATE {quote(template)}")
+
+        return True
+
+    def save_template_database(self, connection: Any, config: dict[str, Any], key: str) -> None:
+        """Copy the migrated test database into a template database."""
+        test_name = connection.settings_dict["NAME"]
+        template = self._template_name(key)
+        quote = connection.ops.quote_name
+
+        # CREATE DATABASE ... TEMPLATE fails while the source has open connections
+        connection.close()
+
+        with connection._nodb_cursor() as cursor:
+            cursor.execute(f"DROP DATABASE IF EXISTS {quote(template)}")
+            cursor.execute(f"CREATE DATABASE {quote(template)} TEMPLATE {quote(test_name)}")
+
+    def clone_test_databases(
+        self,
+        container: DockerContainer | None,
+        connection: Any,
+        config: dict[str, Any],
+        suffixes: list[str],
+        verbosity: int,
+        keepdb: bool,
+    ) -> bool:
+        """Issue every ``CREATE DATABASE ... TEMPLATE`` at once.
+
+        The clones only take a shared lock on the source database, so the
+        server copies them concurrently.
+        """
+        source = connection.settings_dict["NAME"]
+        quote = connection.ops.quote_name
+
+        # CREATE DATABASE ... TEMPLATE fails while the source has open connections
+        connection.close()
+        if hasattr(connection, "close_pool"):
+            connection.close_pool()
+
+        if verbosity >= 1:
+            connection.creation.log(
+                f"Cloning test database {source} {len(suffixes)} times concurrently..."
+            )
+
+        def clone(suffix: str) -> None:
+            target = connection.creation.get_test_db_clone_settings(suffix)["NAME"]
+            with connection._nodb_cursor() as cursor:
+                if keepdb:
+                    cursor.execute(
+                        "SELECT 1 FROM pg_catalog.pg_database WHERE datname = %s", [target]
+                    )
+                    if cursor.fetchone() is not None:
+                        return
+                cursor.execute(f"DROP DATABASE IF EXISTS {quote(target)}")
+                cursor.execute(f"CREATE DATABASE {quote(target)} TEMPLATE {quote(source)}")
+
+        with ThreadPoolExecutor(
+            max_workers=len(suffixes), thread_name_prefix="clone-db"
+        ) as executor:
+            list(executor.map(clone, suffixes))
+
+        return True
+
+    def dump_table_data(self, connection: Any, tables: list[str]) -> Any:
+        """Snapshot each table with ``COPY ... TO STDOUT (FORMAT binary)``."""
+        quote = connection.ops.quote_name
+        data: dict[str, bytes] = {}
+
+        with connection.cursor() as cursor:
+            for table in tables:
+                sql = f"COPY {quote(table)} TO STDOUT (FORMAT binary)"
+                raw = cursor.cursor
+                if hasattr(raw, "copy"):
+                    # psycopg 3
+                    with raw.copy(sql) as copy:
+                        data[table] = b"".join(bytes(block) for block in copy)
+                else:
+                    buffer = io.BytesIO()
+                    raw.copy_expert(sql, buffer)
+                    data[table] = buffer.getvalue()
+
+        return data
+
+    def load_table_data(self, connection: Any, data: Any) -> None:
+        """Restore each table with ``COPY ... FROM STDIN (FORMAT binary)``."""
+        quote = connection.ops.quote_name
+
+        with connection.cursor() as cursor:
+            for table, snapshot in data.items():
+                sql = f"COPY {quote(table)} FROM STDIN (FORMAT binary)"
+                raw = cursor.cursor
+                if hasattr(raw, "copy"):
+                    with raw.copy(sql) as copy:
+                        copy.write(snapshot)
+                else:
+                    raw.copy_expert(sql, io.BytesIO(snapshot))
+
+    def _template_name(self, key: str) -> str:
+        """Name of the template database for a template key."""
+        return f"dtcp_template_{key[:32]}"
+
     def get_default_config(self) -> dict[str, Any]:
         return {
             "image": "postgres:16",
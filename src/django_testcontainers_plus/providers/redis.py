@@ -1,80 +1,499 @@
+import copy
+import logging
+import re
+import socket
+from collections.abc import Callable
 from typing import Any, cast
+from urllib.parse import urlsplit
 
+import redis
+from docker.errors import APIError
 from testcontainers.core.generic import DockerContainer
 from testcontainers.redis import RedisContainer
 
+from ..detection import REDIS_RULES, SettingsIndex
+from ..readiness import redis_cluster_probe, redis_probe, redis_sentinel_probe
 from .base import ContainerProvider
 
+logger = logging.getLogger(__name__)
+
+MODES = ("standalone", "cluster", "sentinel")
+
+# Attempts at publishing a topology's ports before giving up
+PORT_ATTEMPTS = 5
+
+# Cache backends that treat a list of locations as a primary and its read
+# replicas, without following Redis Cluster redirects
+SINGLE_NODE_BACKENDS = ("django.core.cache.backends.redis.RedisCache",)
+
+# django-redis backend, single node with any of its own client classes
+DJANGO_REDIS_BACKEND = "django_redis.cache.RedisCache"
+
+# django-redis options replaced in sentinel mode: default value, Sentinel value
+SENTINEL_OPTIONS = {
+    "CLIENT_CLASS": ("django_redis.client.DefaultClient", "django_redis.client.SentinelClient"),
+    "CONNECTION_FACTORY": (
+        "django_redis.pool.ConnectionFactory",
+        "django_redis.pool.SentinelConnectionFactory",
+    ),
+}
+
+# Run with ``sh -c`` in cluster mode. Each node listens on the same port inside
+# and outside the container and announces the Docker host's address, so the
+# node addresses in CLUSTER SLOTS and MOVED replies are reachable from tests.
+CLUSTER_SCRIPT = """
+set -e
+for node in $REDIS_NODE_PORTS; do
+  redis-server --port "${node%:*}" --cluster-port "${node#*:}" --cluster-enabled yes \\
+    --cluster-config-file "nodes-${node%:*}.conf" --cluster-announce-ip "$REDIS_ANNOUNCE_IP" \\
+    --save '' --appendonly no --daemonize yes
+done
+addresses=""
+for node in $REDIS_NODE_PORTS; do
+  until redis-cli -p "${node%:*}" ping >/dev/null 2>&1; do sleep 0.05; done
+  addresses="$addresses 127.0.0.1:${node%:*}"
+done
+redis-cli --cluster create $addresses --cluster-replicas 0 --cluster-yes
+trap 'exit 0' TERM INT
+tail -f /dev/null & wait
+"""
+
+# Run with ``sh -c`` in sentinel mode: a master and one Sentinel monitoring it
+SENTINEL_SCRIPT = """
+set -e
+redis-server --port "$REDIS_MASTER_PORT" --databases "$REDIS_DATABASES" \\
+  --save '' --appendonly no --daemonize yes
+until redis-cli -p "$REDIS_MASTER_PORT" ping >/dev/null 2>&1; do sleep 0.05; done
+printf 'port %s\\nsentinel announce-ip %s\\nsentinel monitor %s %s %s 1\\n' \\
+  "$REDIS_SENTINEL_PORT" "$REDIS_ANNOUNCE_IP" "$REDIS_SERVICE" \\
+  "$REDIS_ANNOUNCE_IP" "$REDIS_MASTER_PORT" > /tmp/sentinel.conf
+exec redis-sentinel /tmp/sentinel.conf
+"""
+
 
 class RedisProvider(ContainerProvider):
     """Provider for Redis containers."""
 
-    @property
-    def name(self) -> str:
-        return "redis"
+    DATABASE_COUNT = 16
+    PORT = 6379
 
-    def can_auto_detect(self, settings: Any) -> bool:
-        """Detect Redis from CACHES or Celery settings."""
-        caches = getattr(settings, "CACHES", {})
-        has_redis_cache = any(
-            "redis" in cache.get("BACKEND", "").lower()
-            for cache in caches.values()
-            if isinstance(cache, dict)
-        )
+    DETECTION_RULES = REDIS_RULES
 
-        celery_broker = getattr(settings, "CELERY_BROKER_URL", "")
-        has_celery_redis = "redis://" in celery_broker.lower()
+    # Masters started in cluster mode, the minimum Redis Cluster accepts
+    CLUSTER_NODES = 3
 
-        session_engine = getattr(settings, "SESSION_ENGINE", "")
-        has_redis_session = "redis" in session_engine.lower()
+    # Name the Sentinel monitors the master under in sentinel mode
+    SENTINEL_SERVICE = "mymaster"
 
-        return has_redis_cache or has_celery_redis or has_redis_session
+    @property
+    def name(self) -> str:
+        return "redis"
 
     def get_container(self, config: dict[str, Any]) -> DockerContainer:
         """Create Redis container with configuration."""
         image = config.get("image", "redis:7-alpine")
 
+        if self._mode(config) != "standalone":
+            return self._get_topology_container(image, config)
+
         container = RedisContainer(image=image)
+        databases = self._database_count(config)
+        if databases != self.DATABASE_COUNT:
+            container.with_command(["redis-server", "--databases", str(databases)])
 
         env = config.get("environment", {})
         for key, value in env.items():
             container = container.with_env(key, value)
 
+        return self.configure_container(container, config)
+
+    def _get_topology_container(self, image: str, config: dict[str, Any]) -> DockerContainer:
+        """Create a container running a Redis Cluster or a Sentinel deployment.
+
+        Every server runs in the one container. Its ports are published on
+        the same port numbers, picked each time the container is created (see
+        :class:`TopologyContainer`), and recorded in the container
+        environment so :meth:`update_settings` also finds them on a reused
+        container.
+
+        Args:
+            image: Redis image, version 7 or later
+            config: Configuration dict from TESTCONTAINERS setting
+
+        Returns:
+            Configured container
+
+        Raises:
+            ValueError: If fewer than three cluster nodes are configured
+        """
+        if self._mode(config) == "cluster":
+            nodes = config.get("cluster_nodes", self.CLUSTER_NODES)
+            if nodes < 3:
+                raise ValueError(f"Redis Cluster needs at least 3 nodes, got {nodes}")
+
+            def assign_ports(container: DockerContainer, ports: list[int]) -> None:
+                node_ports, bus_ports = ports[:nodes], ports[nodes:]
+                container.with_env(
+                    "REDIS_NODE_PORTS",
+                    " ".join(
+                        f"{port}:{bus}" for port, bus in zip(node_ports, bus_ports, strict=True)
+                    ),
+                )
+                self.apply_readiness_probe(container, config, port=node_ports[0])
+
+            container = TopologyContainer(image, 2 * nodes, assign_ports)
+            container.with_command(["sh", "-c", CLUSTER_SCRIPT])
+        else:
+
+            def assign_ports(container: DockerContainer, ports: list[int]) -> None:
+                container.with_env("REDIS_MASTER_PORT", str(ports[0]))
+                container.with_env("REDIS_SENTINEL_PORT", str(ports[1]))
+                self.apply_readiness_probe(container, config, port=ports[1])
+
+            container = TopologyContainer(image, 2, assign_ports)
+            container.with_env("REDIS_SERVICE", config.get("service", self.SENTINEL_SERVICE))
+            container.with_env("REDIS_DATABASES", str(self._database_count(config)))
+            container.with_command(["sh", "-c", SENTINEL_SCRIPT])
+
+        container.with_env(
+            "REDIS_ANNOUNCE_IP", socket.gethostbyname(container.get_docker_client().host())
+        )
+        for key, value in config.get("environment", {}).items():
+            container.with_env(key, value)
+
         return container
 
+    def probe_ready(self, host: str, port: int, config: dict[str, Any]) -> bool:
+        """Expect a reply to ``PING``, a healthy cluster or a Sentinel that knows its master."""
+        mode = self._mode(config)
+        if mode == "cluster":
+            return redis_cluster_probe(host, port)
+        if mode == "sentinel":
+            return redis_sentinel_probe(host, port, config.get("service", self.SENTINEL_SERVICE))
+        return redis_probe(host, port)
+
     def update_settings(
         self, container: DockerContainer, settings: Any, config: dict[str, Any]
     ) -> dict[str, Any]:
         """Update cache/Celery settings with container connection info."""
+        if "update_settings" in config:
+            return cast(dict[str, Any], config["update_settings"])
+
+        mode = self._mode(config)
+        if mode == "cluster":
+            return self._cluster_updates(container, settings)
+        if mode == "sentinel":
+            return self._sentinel_updates(container, settings)
+
         host = container.get_container_host_ip()
-        port = container.get_exposed_port(6379)
+        port = container.get_exposed_port(self.PORT)
         redis_url = f"redis://{host}:{port}/0"
 
         updates: dict[str, Any] = {}
 
-        if "update_settings" in config:
-            return cast(dict[str, Any], config["update_settings"])
+        for cache_name, cache_config in self._redis_caches(settings).items():
+            if "CACHES" not in updates:
+                updates["CACHES"] = {}
+            updates["CACHES"][cache_name] = {
+                **cache_config,
+                "LOCATION": redis_url,
+            }
 
-        caches = getattr(settings, "CACHES", {})
-        for cache_name, cache_config in caches.items():
-            if isinstance(cache_config, dict):
-                backend = cache_config.get("BACKEND", "")
-                if "redis" in backend.lower():
-                    if "CACHES" not in updates:
-                        updates["CACHES"] = {}
-                    updates["CACHES"][cache_name] = {
-                        **cache_config,
-                        "LOCATION": redis_url,
-                    }
-
-        celery_broker = getattr(settings, "CELERY_BROKER_URL", "")
-        if "redis://" in celery_broker.lower():
+        if self._uses_celery(settings):
             updates["CELERY_BROKER_URL"] = redis_url
             updates["CELERY_RESULT_BACKEND"] = redis_url
 
         return updates
 
+    def _cluster_updates(self, container: DockerContainer, settings: Any) -> dict[str, Any]:
+        """Point Redis caches at every node of the cluster.
+
+        ``LOCATION`` becomes the list of node URLs, for cluster-aware cache
+        backends. Celery has no Redis Cluster transport, so its settings are
+        left alone.
+
+        Raises:
+            ValueError: If a cache's backend cannot talk to a cluster
+        """
+        host = container.get_container_host_ip()
+        env = _container_env(container)
+        locations = [
+            f"redis://{host}:{node.split(':')[0]}" for node in env["REDIS_NODE_PORTS"].split()
+        ]
+
+        updates: dict[str, Any] = {}
+        for cache_name, cache_config in self._redis_caches(settings).items():
+            if not _supports_cluster(cache_config):
+                raise ValueError(
+                    f"Cache {cache_name!r} uses {cache_config['BACKEND']}, which does not "
+                    "follow Redis Cluster redirects; give it a cluster-aware BACKEND or "
+                    "CLIENT_CLASS, or run Redis in another mode"
+                )
+            updates.setdefault("CACHES", {})[cache_name] = {**cache_config, "LOCATION": locations}
+
+        if self._uses_celery(settings):
+            logger.warning("Celery cannot use Redis Cluster; CELERY_BROKER_URL is left unchanged")
+
+        return updates
+
+    def _sentinel_updates(self, container: DockerContainer, settings: Any) -> dict[str, Any]:
+        """Point Redis caches and Celery at the master through the Sentinel.
+
+        Caches get the ``redis://<service>/0`` ``LOCATION``, django-redis'
+        Sentinel client and connection factory, unless they already use
+        other ones, and the ``SENTINELS`` option. Celery gets a
+        ``sentinel://`` URL and the ``master_name`` transport option.
+
+        Raises:
+            ValueError: If a cache does not use django-redis, the only
+                backend that connects through a Sentinel
+        """
+        host = container.get_container_host_ip()
+        env = _container_env(container)
+        sentinel_port = int(env["REDIS_SENTINEL_PORT"])
+        service = env["REDIS_SERVICE"]
+
+        updates: dict[str, Any] = {}
+        for cache_name, cache_config in self._redis_caches(settings).items():
+            if cache_config.get("BACKEND") != DJANGO_REDIS_BACKEND:
+                raise ValueError(
+                    f"Cache {cache_name!r} uses {cache_config['BACKEND']}, which cannot "
+                    f"connect through a Redis Sentinel; use {DJANGO_REDIS_BACKEND} or run "
+                    "Redis in another mode"
+                )
+            options = {**cache_config.get("OPTIONS", {}), "SENTINELS": [(host, sentinel_port)]}
+            for key, (default, sentinel) in SENTINEL_OPTIONS.items():
+                if options.get(key, default) == default:
+                    options[key] = sentinel
+            updates.setdefault("CACHES", {})[cache_name] = {
+                **cache_config,
+                "LOCATION": f"redis://{service}/0",
+                "OPTIONS": options,
+            }
+
+        if self._uses_celery(settings):
+            sentinel_url = f"sentinel://{host}:{sentinel_port}/0"
+            updates["CELERY_BROKER_URL"] = sentinel_url
+            updates["CELERY_RESULT_BACKEND"] = sentinel_url
+            for key in (
+                "CELERY_BROKER_TRANSPORT_OPTIONS",
+                "CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS",
+            ):
+                updates[key] = {**getattr(settings, key, {}), "master_name": service}
+
+        return updates
+
+    def _redis_caches(self, settings: Any) -> dict[str, dict[str, Any]]:
+        """Find the caches with a Redis backend."""
+        return SettingsIndex(settings, self.DETECTION_RULES).aliases(self.name, "CACHES")
+
+    def _uses_celery(self, settings: Any) -> bool:
+        """Check whether Celery's broker is Redis."""
+        index = SettingsIndex(settings, self.DETECTION_RULES)
+        return bool(index.matches(self.name, "CELERY_BROKER_URL"))
+
+    def _mode(self, config: dict[str, Any]) -> str:
+        """Read the ``mode`` option.
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        mode = cast(str, config.get("mode", "standalone"))
+        if mode not in MODES:
+            raise ValueError(f"Unknown Redis mode {mode!r} (available: {', '.join(MODES)})")
+        return mode
+
+    def _database_count(self, config: dict[str, Any]) -> int:
+        """Read the ``databases`` option, the number of database indexes the server has."""
+        return int(config.get("databases", self.DATABASE_COUNT))
+
+    def get_lazy_resource(self, settings: Any) -> str | None:
+        """Start on first cache access, unless Celery needs Redis from the start."""
+        if self._uses_celery(settings):
+            return None
+        return "caches"
+
+    def get_worker_updates(
+        self, updates: dict[str, Any], config: dict[str, Any], worker_index: int
+    ) -> dict[str, Any]:
+        """Point each worker at its own Redis database index.
+
+        Redis Cluster only has database 0, so in cluster mode each worker
+        gets its own cache ``KEY_PREFIX`` instead.
+
+        Raises:
+            ValueError: If the server has no database index left for the worker
+        """
+        if "update_settings" in config:
+            return updates
+
+        worker_updates = copy.deepcopy(updates)
+
+        if self._mode(config) == "cluster":
+            for cache_config in worker_updates.get("CACHES", {}).values():
+                cache_config["KEY_PREFIX"] = f"{cache_config.get('KEY_PREFIX', '')}gw{worker_index}"
+            return worker_updates
+
+        databases = self._database_count(config)
+        if worker_index >= databases:
+            raise ValueError(
+                f"Redis has {databases} databases, too few for xdist worker gw{worker_index}; "
+                "set 'databases' for the redis provider to at least the number of workers"
+            )
+
+        for cache_config in worker_updates.get("CACHES", {}).values():
+            cache_config["LOCATION"] = self._with_db(cache_config["LOCATION"], worker_index)
+
+        for key in ("CELERY_BROKER_URL", "CELERY_RESULT_BACKEND"):
+            if key in worker_updates:
+                worker_updates[key] = self._with_db(worker_updates[key], worker_index)
+
+        return worker_updates
+
+    def reset_between_tests(self, updates: dict[str, Any], config: dict[str, Any]) -> None:
+        """Flush the database indexes this process uses when ``flush_between_tests`` is set.
+
+        Only this process's indexes are flushed (``FLUSHDB ASYNC``), so other
+        xdist workers sharing the server are not affected. All indexes on a
+        server are flushed in one pipelined round trip. Only standalone
+        servers are flushed.
+        """
+        if not config.get("flush_between_tests", False) or self._mode(config) != "standalone":
+            return
+
+        servers: dict[tuple[str, int], set[int]] = {}
+        for url in self._redis_urls(updates):
+            parts = urlsplit(url)
+            if parts.hostname is None or parts.port is None:
+                continue
+            db = int(parts.path.lstrip("/") or 0)
+            servers.setdefault((parts.hostname, parts.port), set()).add(db)
+
+        for (host, port), dbs in servers.items():
+            with redis.Redis(host=host, port=port) as client:
+                pipe = client.pipeline(transaction=False)
+                for db in sorted(dbs):
+                    pipe.execute_command("SELECT", db)
+                    pipe.flushdb(asynchronous=True)
+                pipe.execute()
+
+    def _redis_urls(self, updates: dict[str, Any]) -> list[str]:
+        """Collect the redis:// URLs from cache and Celery settings updates."""
+        urls = [
+            cache_config["LOCATION"]
+            for cache_config in updates.get("CACHES", {}).values()
+            if isinstance(cache_config.get("LOCATION"), str)
+        ]
+        urls.extend(
+            updates[key]
+            for key in ("CELERY_BROKER_URL", "CELERY_RESULT_BACKEND")
+            if isinstance(updates.get(key), str)
+        )
+        return [url for url in urls if url.startswith("redis://")]
+
+    def _with_db(self, url: str, db: int) -> str:
+        """Replace the database index at the end of a redis:// URL."""
+        return re.sub(r"/\d+$", f"/{db}", url)
+
     def get_default_config(self) -> dict[str, Any]:
         return {
             "image": "redis:7-alpine",
         }
+
+
+class TopologyContainer(DockerContainer):
+    """Container whose ports are published on the same port numbers on the Docker host.
+
+    Redis hands out the addresses of its servers, so each one must listen on
+    the port tests reach it on. The ports are picked among the free ports of
+    this machine each time the container is created, and can still be taken
+    on the Docker host: by a parallel session, or on another machine when
+    ``DOCKER_HOST`` is remote. Starting is then retried with new ports.
+    """
+
+    def __init__(
+        self,
+        image: str,
+        port_count: int,
+        assign_ports: Callable[[DockerContainer, list[int]], None],
+    ):
+        """Initialize the container.
+
+        Args:
+            image: Redis image
+            port_count: Number of ports to publish
+            assign_ports: Called with the container and its ports before
+                each creation attempt, to configure the servers for them
+        """
+        super().__init__(image)
+        self.port_count = port_count
+        self.assign_ports = assign_ports
+
+    def _configure(self) -> None:
+        ports = _free_ports(self.port_count)
+        self.ports.clear()
+        for port in ports:
+            self.with_bind_ports(port, port)
+        self.assign_ports(self, ports)
+
+    def start(self) -> "TopologyContainer":
+        for _ in range(PORT_ATTEMPTS - 1):
+            try:
+                return super().start()
+            except APIError as e:
+                if not _is_port_conflict(e):
+                    raise
+                logger.info("Port already in use on the Docker host, retrying: %s", e)
+                if self._container is not None:
+                    self._container.remove(force=True)
+                    self._container = None
+        return super().start()
+
+
+def _is_port_conflict(error: APIError) -> bool:
+    """Check whether Docker failed to publish a port because it is in use."""
+    message = str(error).lower()
+    return any(
+        reason in message
+        for reason in (
+            "port is already allocated",
+            "address already in use",
+            "ports are not available",
+        )
+    )
+
+
+def _supports_cluster(cache_config: dict[str, Any]) -> bool:
+    """Check whether a cache can be pointed at the nodes of a Redis Cluster.
+
+    Django's own Redis backend and django-redis' bundled clients use the
+    first location as the primary and the others as read replicas, so they
+    would fail on keys served by another node.
+    """
+    backend = cache_config.get("BACKEND")
+    if backend in SINGLE_NODE_BACKENDS:
+        return False
+    if backend == DJANGO_REDIS_BACKEND:
+        client = cache_config.get("OPTIONS", {}).get("CLIENT_CLASS", "django_redis.client.")
+        return not client.startswith("django_redis.client.")
+    return True
+
+
+def _free_ports(count: int) -> list[int]:
+    """Find distinct free TCP ports on this host to publish 1:1."""
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket()
+            sock.bind(("", 0))
+            sockets.append(sock)
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+
+def _container_env(container: DockerContainer) -> dict[str, str]:
+    """Read the environment of a started (or reused) container."""
+    env = container.get_wrapped_container().attrs["Config"]["Env"] or []
+    return dict(item.split("=", 1) for item in env)
@@ -0,0 +1,129 @@
+import importlib
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from importlib.metadata import entry_points
+
+from ..detection import DetectionRule
+from .base import ContainerProvider
+
+logger = logging.getLogger(__name__)
+
+# Entry point group other packages register providers under
+ENTRY_POINT_GROUP = "django_testcontainers_plus.providers"
+
+
+@dataclass(frozen=True)
+class ProviderSpec:
+    """Where a provider lives and how it is detected, known without importing it."""
+
+    name: str
+    # Provider class as ``"package.module:ClassName"``
+    target: str
+    # Rules matched against the settings index, see ContainerProvider.DETECTION_RULES
+    detection_rules: tuple[DetectionRule, ...] = ()
+    # pip extra installing the provider's dependencies
+    extra: str | None = None
+
+    def load(self) -> ContainerProvider:
+        """Import the provider's module and create the provider.
+
+        Returns:
+            Provider instance
+
+        Raises:
+            ImportError: If the module or one of its dependencies is missing
+        """
+        module_name, _, class_name = self.target.partition(":")
+        provider_class = getattr(importlib.import_module(module_name), class_name)
+        provider: ContainerProvider = provider_class()
+        return provider
+
+
+class ProviderRegistry:
+    """Known providers, imported only once they are needed.
+
+    Holds the built-in providers plus those registered by other packages
+    under the ``django_testcontainers_plus.providers`` entry point group. An
+    entry point names either a :class:`ProviderSpec`, which keeps detection
+    free of imports, or a provider class, whose module is then imported when
+    providers are listed.
+    """
+
+    def __init__(
+        self, specs: Iterable[ProviderSpec], entry_point_group: str | None = ENTRY_POINT_GROUP
+    ):
+        """Initialize the registry.
+
+        Args:
+            specs: Built-in provider specs
+            entry_point_group: Entry point group to discover more providers in,
+                None to only use ``specs``
+        """
+        self._specs: dict[str, ProviderSpec] = {spec.name: spec for spec in specs}
+        self._entry_point_group = entry_point_group
+        self._discovered = False
+        self._providers: dict[str, ContainerProvider] = {}
+
+    def specs(self) -> list[ProviderSpec]:
+        """List every known provider, built-in providers first.
+
+        Returns:
+            Provider specs in registration order
+        """
+        if self._entry_point_group is not None and not self._discovered:
+            self._discovered = True
+            self._discover(self._entry_point_group)
+        return list(self._specs.values())
+
+    def get(self, name: str) -> ContainerProvider | None:
+        """Get a provider, importing it on first use.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Provider instance, None if no provider has this name
+
+        Raises:
+            ImportError: If the provider's dependencies are missing
+        """
+        if name not in self._providers:
+            spec = next((spec for spec in self.specs() if spec.name == name), None)
+            if spec is None:
+                return None
+            self._providers[name] = spec.load()
+        return self._providers[name]
+
+    def loaded(self) -> list[ContainerProvider]:
+        """List the providers imported so far, in registration order.
+
+        Returns:
+            Provider instances
+        """
+        return [self._providers[name] for name in self._specs if name in self._providers]
+
+    def _discover(self, group: str) -> None:
+        """Add the providers registered under an entry point group."""
+        for entry_point in entry_points(group=group):
+            if entry_point.name in self._specs:
+                continue
+            try:
+                target = entry_point.load()
+            except Exception:
+                logger.warning("Could not load provider %r", entry_point.name, exc_info=True)
+                continue
+
+            if isinstance(target, ProviderSpec):
+                self._specs[target.name] = target
+            elif isinstance(target, type) and issubclass(target, ContainerProvider):
+                provider = target()
+                self._specs[provider.name] = ProviderSpec(
+                    provider.name, entry_point.value, provider.DETECTION_RULES
+                )
+                self._providers[provider.name] = provider
+            else:
+                logger.warning(
+                    "Provider entry point %r is neither a ProviderSpec nor a provider class",
+                    entry_point.name,
+                )
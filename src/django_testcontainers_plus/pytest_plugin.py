@@ -1,52 +1,200 @@
-from collections.abc import Generator
+from collections.abc import Callable, Generator
+from contextlib import ExitStack
 from typing import Any
 
 import pytest
 from django.conf import settings
 
+from .async_manager import AsyncContainerManager
+from .creation import concurrent_database_setup
+from .fixtures import fixture_snapshots, load_fixtures
+from .lazy import lazy_caches, refresh_connection_handler
 from .manager import ContainerManager
+from .templates import database_templates
+from .timing import database_creation_timings
 
 _container_manager: ContainerManager | None = None
 _original_settings: dict[str, Any] = {}
 
+# Contexts that live as long as the session fixture
+_session_stack: ExitStack | None = None
+
+# Containers started by the xdist controller and shared with all workers
+_shared_manager: ContainerManager | None = None
+
+WORKERINPUT_KEY = "django_testcontainers"
+
 
 @pytest.fixture(scope="session", autouse=True)
 def django_testcontainers_setup(
-    django_db_setup: Any,
+    request: pytest.FixtureRequest,
 ) -> Generator[ContainerManager, None, None]:
     """Automatically start and stop testcontainers for the test session.
 
     This fixture:
-    1. Runs before any tests
+    1. Runs before any tests and before pytest-django's ``django_db_setup``
     2. Detects needed containers from Django settings
     3. Starts the containers
     4. Updates Django settings with connection info
-    5. Cleans up containers after all tests complete
+    5. Builds test databases from template databases where enabled
+    6. Cleans up containers after all tests complete
+
+    Under pytest-xdist, the controller starts the containers once and each
+    worker only applies its own settings updates. pytest-django already gives
+    every worker its own test database name, and providers such as Redis
+    hand each worker a separate database index.
+
+    With the ``lazy`` option, database containers are started by
+    :func:`django_db_modify_db_settings` when the first test needs a database,
+    and cache containers on the first cache connection.
 
     Args:
-        django_db_setup: pytest-django fixture that sets up databases
+        request: pytest request, used to read xdist worker input
 
     Yields:
         ContainerManager instance with active containers
     """
-    global _container_manager, _original_settings
+    global _container_manager, _original_settings, _session_stack
 
     _container_manager = ContainerManager(settings)
 
-    settings_updates = _container_manager.start_containers()
+    workerinput = getattr(request.config, "workerinput", {})
+    shared_state = workerinput.get(WORKERINPUT_KEY)
+
+    if shared_state is not None:
+        worker_index = int(workerinput["workerid"].removeprefix("gw"))
+        settings_updates = _container_manager.attach_shared_containers(shared_state, worker_index)
+    else:
+        settings_updates = _container_manager.start_containers()
 
     _apply_settings_updates(settings_updates)
 
     for provider_name in _container_manager.active_containers.keys():
         print(f"Started {provider_name} container for testing")
 
-    yield _container_manager
+    with ExitStack() as _session_stack:
+        if "databases" not in _container_manager.pending_providers:
+            _enter_database_contexts(_session_stack, _container_manager)
+        _session_stack.enter_context(lazy_caches(_container_manager, _apply_settings_updates))
+        _session_stack.enter_context(fixture_snapshots(_container_manager))
+        yield _container_manager
+    _session_stack = None
 
     _restore_settings()
-    print("Stopping test containers...")
+    if request.config.get_verbosity() >= 1 and _container_manager.timings.phases:
+        print(_container_manager.timings.format_table())
+    _container_manager.save_timings(
+        f".{workerinput['workerid']}" if shared_state is not None else ""
+    )
+    if _container_manager.active_containers:
+        if request.config.get_verbosity() >= 1:
+            for line in _container_manager.memory_report():
+                print(f"Container memory: {line}")
+        print("Stopping test containers...")
     _container_manager.stop_containers()
 
 
+def _enter_database_contexts(stack: ExitStack, manager: ContainerManager) -> None:
+    """Set up template databases, creation timings and concurrent creation."""
+    stack.enter_context(database_templates(manager))
+    stack.enter_context(database_creation_timings(manager))
+    stack.enter_context(concurrent_database_setup(manager))
+
+
+def _start_lazy_databases() -> None:
+    """Start database containers deferred by the ``lazy`` option."""
+    from django.db import connections
+
+    if _container_manager is None or "databases" not in _container_manager.pending_providers:
+        return
+
+    running = set(_container_manager.active_containers)
+    updates = _container_manager.start_lazy("databases")
+    _apply_settings_updates(updates)
+    refresh_connection_handler(connections, updates.get("DATABASES", {}))
+
+    for provider_name in _container_manager.active_containers.keys() - running:
+        print(f"Started {provider_name} container for testing")
+
+    if _session_stack is not None:
+        _enter_database_contexts(_session_stack, _container_manager)
+
+
+def _is_xdist_controller(config: pytest.Config) -> bool:
+    """Check whether this process distributes tests to xdist workers."""
+    return config.pluginmanager.hasplugin("dsession")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Start shared containers in the xdist controller before workers are created."""
+    global _shared_manager
+
+    if not _is_xdist_controller(session.config):
+        return
+
+    # Workers cannot start containers on demand, so laziness does not apply here
+    _shared_manager = ContainerManager(settings)
+    _shared_manager.start_containers(lazy=False)
+
+    for provider_name in _shared_manager.active_containers.keys():
+        print(f"Started shared {provider_name} container for xdist workers")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node: Any) -> None:
+    """Hand the shared container state to each xdist worker."""
+    if _shared_manager is not None:
+        node.workerinput[WORKERINPUT_KEY] = _shared_manager.export_state()
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    """Stop the shared containers once all xdist workers are done."""
+    global _shared_manager
+
+    if _shared_manager is None:
+        return
+
+    _shared_manager.save_timings()
+    if session.config.get_verbosity() >= 1:
+        print(_shared_manager.timings.format_table())
+        for line in _shared_manager.memory_report():
+            print(f"Container memory: {line}")
+    print("Stopping shared test containers...")
+    _shared_manager.stop_containers()
+    _shared_manager = None
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(
+    django_db_modify_db_settings_parallel_suffix: None,
+    django_testcontainers_setup: ContainerManager,
+) -> None:
+    """Make sure containers are running before pytest-django creates test databases.
+
+    Only requested when a test needs a database, which is when lazily
+    started database containers are brought up.
+
+    Args:
+        django_db_modify_db_settings_parallel_suffix: pytest-django xdist suffix fixture
+        django_testcontainers_setup: Session fixture that starts the containers
+    """
+    _start_lazy_databases()
+
+
+@pytest.fixture(autouse=True)
+def django_testcontainers_reset(
+    django_testcontainers_setup: ContainerManager,
+) -> Generator[None, None, None]:
+    """Clear container state after each test, such as flushing this worker's Redis databases.
+
+    Args:
+        django_testcontainers_setup: Session fixture that starts the containers
+    """
+    yield
+    django_testcontainers_setup.reset_between_tests()
+
+
 @pytest.fixture(scope="session")
 def testcontainers_manager() -> ContainerManager | None:
     """Get the active container manager.
@@ -57,6 +205,44 @@ def testcontainers_manager() -> ContainerManager | None:
     return _container_manager
 
 
+@pytest.fixture
+async def async_testcontainers_manager(
+    django_testcontainers_setup: ContainerManager,
+) -> AsyncContainerManager:
+    """Get the active container manager with an asyncio API.
+
+    Needs an async test plugin, such as anyio or pytest-asyncio in auto mode.
+    The containers are started and stopped by the synchronous
+    :func:`django_testcontainers_setup`, so this only wraps its manager for
+    use from async tests; session startup does not run on the event loop.
+
+    Usage:
+        async def test_empty_cache(async_testcontainers_manager):
+            await async_testcontainers_manager.reset_between_tests()
+
+    Args:
+        django_testcontainers_setup: Session fixture that starts the containers
+
+    Returns:
+        AsyncContainerManager driving the session's containers
+    """
+    return AsyncContainerManager(manager=django_testcontainers_setup)
+
+
+@pytest.fixture
+def testcontainers_fixtures() -> Callable[..., None]:
+    """Load fixtures, restoring them from a session-wide snapshot when loaded before.
+
+    Usage:
+        def test_articles(db, testcontainers_fixtures):
+            testcontainers_fixtures("authors.json", "articles.json")
+
+    Returns:
+        :func:`~django_testcontainers_plus.fixtures.load_fixtures`
+    """
+    return load_fixtures
+
+
 def _apply_settings_updates(updates: dict[str, Any]) -> None:
     """Apply settings updates and save originals for restoration.
 
@@ -0,0 +1,200 @@
+import socket
+import struct
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from testcontainers.core.waiting_utils import WaitStrategy, WaitStrategyTarget
+
+if TYPE_CHECKING:
+    from .providers.base import ContainerProvider
+
+# Postgres protocol version 3.0
+POSTGRES_PROTOCOL = 196608
+
+# First payload byte of a MySQL initial handshake packet (protocol version 10)
+MYSQL_HANDSHAKE = 0x0A
+
+
+def wait_until_ready(
+    check: Callable[[], bool],
+    deadline: float,
+    initial_delay: float = 0.005,
+    max_delay: float = 0.25,
+) -> float:
+    """Poll a readiness check with exponential backoff.
+
+    Connection errors from the check count as "not ready yet".
+
+    Args:
+        check: Returns True once the service is ready
+        deadline: Seconds to keep trying for
+        initial_delay: Delay after the first failed check, doubled after each one
+        max_delay: Upper bound for the delay between checks
+
+    Returns:
+        Seconds spent waiting
+
+    Raises:
+        TimeoutError: If the check did not pass before the deadline
+    """
+    started = time.monotonic()
+    delay = initial_delay
+
+    while True:
+        try:
+            if check():
+                return time.monotonic() - started
+        except OSError:
+            pass
+
+        elapsed = time.monotonic() - started
+        if elapsed >= deadline:
+            raise TimeoutError(f"Service was not ready after {elapsed:.1f}s")
+
+        time.sleep(min(delay, deadline - elapsed))
+        delay = min(delay * 2, max_delay)
+
+
+def tcp_probe(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Check that a TCP port accepts connections.
+
+    Docker's port proxy accepts connections before the service listens, so
+    protocol probes should be preferred where one exists.
+
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        timeout: Socket timeout in seconds
+
+    Returns:
+        True if the connection was accepted
+    """
+    with socket.create_connection((host, port), timeout=timeout):
+        return True
+
+
+def postgres_probe(host: str, port: int, user: str, database: str, timeout: float = 1.0) -> bool:
+    """Check that Postgres accepts connections by sending a startup packet.
+
+    A ready server answers with an authentication request (``R``), a server
+    that is still starting or shutting down with an error (``E``).
+
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        user: User name for the startup packet
+        database: Database name for the startup packet
+        timeout: Socket timeout in seconds
+
+    Returns:
+        True if the server asked for authentication
+    """
+    params = f"user\0{user}\0database\0{database}\0\0".encode()
+    packet = struct.pack("!ii", len(params) + 8, POSTGRES_PROTOCOL) + params
+
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(packet)
+        return sock.recv(1) == b"R"
+
+
+def mysql_probe(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Check that MySQL accepts connections by reading its initial handshake.
+
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        timeout: Socket timeout in seconds
+
+    Returns:
+        True if the server sent a protocol 10 handshake packet
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        # 3-byte payload length and 1-byte sequence id, then the payload
+        header = sock.recv(5)
+        return len(header) == 5 and header[4] == MYSQL_HANDSHAKE
+
+
+def redis_probe(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Check that Redis answers ``PING``.
+
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        timeout: Socket timeout in seconds
+
+    Returns:
+        True if the server replied ``+PONG``, or asked for authentication
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(b"PING\r\n")
+        reply = sock.recv(64)
+        return reply.startswith((b"+PONG", b"-NOAUTH"))
+
+
+def redis_cluster_probe(host: str, port: int, timeout: float = 1.0) -> bool:
+    """Check that a Redis Cluster node reports every hash slot as served.
+
+    Args:
+        host: Host to connect to
+        port: Port of any cluster node
+        timeout: Socket timeout in seconds
+
+    Returns:
+        True if ``CLUSTER INFO`` reports ``cluster_state:ok``
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(b"CLUSTER INFO\r\n")
+        return b"cluster_state:ok" in sock.recv(4096)
+
+
+def redis_sentinel_probe(host: str, port: int, service: str, timeout: float = 1.0) -> bool:
+    """Check that a Redis Sentinel knows the address of a monitored master.
+
+    Args:
+        host: Host to connect to
+        port: Sentinel port
+        service: Name the master is monitored under
+        timeout: Socket timeout in seconds
+
+    Returns:
+        True if the Sentinel replied with the master's host and port
+    """
+    with socket.create_connection((host, port), timeout=timeout) as sock:
+        sock.sendall(f"SENTINEL get-master-addr-by-name {service}\r\n".encode())
+        return sock.recv(256).startswith(b"*2")
+
+
+class ProbeWaitStrategy(WaitStrategy):
+    """testcontainers wait strategy that polls a provider's readiness probe."""
+
+    def __init__(self, provider: "ContainerProvider", config: dict[str, Any], port: int):
+        """Initialize the wait strategy.
+
+        Args:
+            provider: Provider whose :meth:`probe_ready` is polled
+            config: Configuration dict from TESTCONTAINERS setting
+            port: Container port to probe
+        """
+        super().__init__()
+        self.provider = provider
+        self.config = config
+        self.port = port
+        self.waited: float | None = None
+
+    def wait_until_ready(self, container: WaitStrategyTarget) -> None:
+        """Wait until the probe passes or the startup timeout expires.
+
+        Args:
+            container: Started container
+
+        Raises:
+            TimeoutError: If the container was not ready in time
+        """
+        host = container.get_container_host_ip()
+        port = int(container.get_exposed_port(self.port))
+
+        self.waited = wait_until_ready(
+            lambda: self.provider.probe_ready(host, port, self.config),
+            deadline=self._startup_timeout,
+        )
@@ -0,0 +1,201 @@
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+import docker
+from docker.models.containers import Container
+from testcontainers.core.generic import DockerContainer
+
+from .cache import read_json, write_json
+
+LABEL_REUSE = "django-testcontainers-plus.reuse"
+LABEL_PROVIDER = "django-testcontainers-plus.provider"
+LABEL_CONFIG_HASH = "django-testcontainers-plus.config-hash"
+
+STATE_FILE = "reuse.json"
+
+# Config keys that control the manager rather than the container itself
+MANAGER_KEYS = frozenset(
+    {
+        "enabled",
+        "auto",
+        "reuse",
+        "update_settings",
+        "template",
+        "bake",
+        "pool_size",
+        "readiness_probe",
+        "ready_timeout",
+        "flush_between_tests",
+    }
+)
+
+
+@dataclass
+class ReusableContainer:
+    """A labelled container kept running between test sessions."""
+
+    id: str
+    name: str
+    provider: str
+    config_hash: str
+    image: str
+    status: str
+    created: float
+    last_used: float | None
+
+
+def config_hash(provider_name: str, config: dict[str, Any]) -> str:
+    """Hash the parts of a provider config that affect the container.
+
+    Args:
+        provider_name: Name of the provider
+        config: Effective provider configuration
+
+    Returns:
+        Short hex digest identifying containers started with this config
+    """
+    container_config = {k: v for k, v in config.items() if k not in MANAGER_KEYS}
+    payload = json.dumps(
+        {"provider": provider_name, "config": container_config}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def label_container(container: DockerContainer, provider_name: str, digest: str) -> None:
+    """Add reuse labels to a container that has not been started yet.
+
+    Args:
+        container: Container to label
+        provider_name: Name of the provider
+        digest: Config hash from :func:`config_hash`
+    """
+    kwargs = dict(container._kwargs)
+    kwargs["labels"] = {
+        **kwargs.get("labels", {}),
+        LABEL_REUSE: "true",
+        LABEL_PROVIDER: provider_name,
+        LABEL_CONFIG_HASH: digest,
+    }
+    container.with_kwargs(**kwargs)
+
+
+def find_reusable_container(client: docker.DockerClient, digest: str) -> Container | None:
+    """Find a running container started with the given config hash.
+
+    Args:
+        client: Docker client
+        digest: Config hash from :func:`config_hash`
+
+    Returns:
+        The running container, or None if there is none
+    """
+    containers = client.containers.list(
+        filters={"label": f"{LABEL_CONFIG_HASH}={digest}", "status": "running"}
+    )
+    return containers[0] if containers else None
+
+
+def attach_container(container: DockerContainer, existing: Container) -> None:
+    """Point an unstarted container wrapper at an already running container.
+
+    Args:
+        container: Wrapper returned by the provider's ``get_container``
+        existing: Running container found by :func:`find_reusable_container`
+    """
+    container._container = existing
+
+
+def mark_used(container_id: str) -> None:
+    """Record that a reusable container was used by this session.
+
+    Args:
+        container_id: Docker container id
+    """
+    state = read_json(STATE_FILE)
+    state[container_id] = time.time()
+    write_json(STATE_FILE, state)
+
+
+def list_reusable_containers(client: docker.DockerClient) -> list[ReusableContainer]:
+    """List all containers started in reuse mode.
+
+    Args:
+        client: Docker client
+
+    Returns:
+        Reusable containers, running or not
+    """
+    state = read_json(STATE_FILE)
+    result = []
+
+    for container in client.containers.list(all=True, filters={"label": LABEL_REUSE}):
+        labels = container.labels
+        created = (
+            datetime.fromisoformat(container.attrs["Created"][:19])
+            .replace(tzinfo=timezone.utc)
+            .timestamp()
+        )
+        result.append(
+            ReusableContainer(
+                id=container.id,
+                name=container.name,
+                provider=labels.get(LABEL_PROVIDER, ""),
+                config_hash=labels.get(LABEL_CONFIG_HASH, ""),
+                image=",".join(container.image.tags) or container.image.id,
+                status=container.status,
+                created=created,
+                last_used=state.get(container.id),
+            )
+        )
+
+    return result
+
+
+def prune_reusable_containers(
+    client: docker.DockerClient,
+    ttl: float | None = None,
+    idle_timeout: float | None = None,
+    prune_all: bool = False,
+) -> list[ReusableContainer]:
+    """Remove reusable containers that are stopped, too old or idle too long.
+
+    Args:
+        client: Docker client
+        ttl: Remove containers created more than this many seconds ago
+        idle_timeout: Remove containers not used for this many seconds
+        prune_all: Remove every reusable container
+
+    Returns:
+        The containers that were removed
+    """
+    now = time.time()
+    removed = []
+
+    for info in list_reusable_containers(client):
+        last_used = info.last_used if info.last_used is not None else info.created
+        expired = (
+            prune_all
+            or info.status != "running"
+            or (ttl is not None and now - info.created > ttl)
+            or (idle_timeout is not None and now - last_used > idle_timeout)
+        )
+        if not expired:
+            continue
+
+        try:
+            client.containers.get(info.id).remove(force=True, v=True)
+        except docker.errors.NotFound:
+            ...
+        removed.append(info)
+
+    if removed:
+        state = read_json(STATE_FILE)
+        for info in removed:
+            state.pop(info.id, None)
+        write_json(STATE_FILE, state)
+
+    return removed
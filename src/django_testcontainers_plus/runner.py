@@ -1,9 +1,15 @@
+from contextlib import ExitStack
 from typing import Any
 
 from django.conf import settings
 from django.test.runner import DiscoverRunner
 
+from .creation import concurrent_database_setup
+from .fixtures import fixture_snapshots
+from .lazy import lazy_caches, refresh_connection_handler
 from .manager import ContainerManager
+from .templates import database_templates
+from .timing import database_creation_timings
 
 
 class TestcontainersRunner(DiscoverRunner):
@@ -32,6 +38,7 @@ class TestcontainersRunner(DiscoverRunner):
         super().__init__(*args, **kwargs)
         self.container_manager: ContainerManager | None = None
         self.original_settings: dict[str, Any] = {}
+        self._lazy_stack = ExitStack()
 
     def setup_test_environment(self, **kwargs: Any) -> None:
         """Set up test environment and start containers."""
@@ -42,22 +49,68 @@ class TestcontainersRunner(DiscoverRunner):
         settings_updates = self.container_manager.start_containers()
 
         self._apply_settings_updates(settings_updates)
+        self._lazy_stack.enter_context(
+            lazy_caches(self.container_manager, self._apply_settings_updates)
+        )
+        self._lazy_stack.enter_context(fixture_snapshots(self.container_manager))
 
         if self.verbosity >= 1:
             for provider_name in self.container_manager.active_containers.keys():
                 print(f"Started {provider_name} container for testing")
 
+    def setup_databases(self, **kwargs: Any) -> list[Any]:
+        """Set up test databases, using template databases where enabled.
+
+        Independent container-backed databases are created concurrently. With
+        the ``lazy`` option, database containers are started here, and only
+        if the selected tests use a database.
+        """
+        if self.container_manager is None:
+            return super().setup_databases(**kwargs)
+
+        if kwargs.get("aliases", True) and "databases" in self.container_manager.pending_providers:
+            self._start_lazy_databases()
+
+        with (
+            database_templates(self.container_manager),
+            database_creation_timings(self.container_manager),
+            concurrent_database_setup(self.container_manager),
+        ):
+            return super().setup_databases(**kwargs)
+
     def teardown_test_environment(self, **kwargs: Any) -> None:
         """Tear down test environment and stop containers."""
+        self._lazy_stack.close()
         self._restore_settings()
 
         if self.container_manager:
+            if self.verbosity >= 2 and self.container_manager.timings.phases:
+                print(self.container_manager.timings.format_table())
+                for line in self.container_manager.memory_report():
+                    print(f"Container memory: {line}")
+            self.container_manager.save_timings()
             if self.verbosity >= 1:
                 print("Stopping test containers...")
             self.container_manager.stop_containers()
 
         super().teardown_test_environment(**kwargs)
 
+    def _start_lazy_databases(self) -> None:
+        """Start database containers deferred by the ``lazy`` option."""
+        from django.db import connections
+
+        if self.container_manager is None:
+            return
+
+        running = set(self.container_manager.active_containers)
+        updates = self.container_manager.start_lazy("databases")
+        self._apply_settings_updates(updates)
+        refresh_connection_handler(connections, updates.get("DATABASES", {}))
+
+        if self.verbosity >= 1:
+            for provider_name in self.container_manager.active_containers.keys() - running:
+                print(f"Started {provider_name} container for testing")
+
     def _apply_settings_updates(self, updates: dict[str, Any]) -> None:
         """Apply settings updates and save originals for restoration.
 
@@ -0,0 +1,126 @@
+import logging
+import subprocess
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+from docker.errors import NotFound
+from testcontainers.core.docker_client import DockerClient
+from testcontainers.core.exceptions import ContainerStartException
+from testcontainers.core.generic import DockerContainer
+
+from .cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Log file of the background teardown process, in the cache directory
+TEARDOWN_LOG = "teardown.log"
+
+
+def stop_concurrently(containers: dict[str, DockerContainer]) -> list[str]:
+    """Stop and remove containers concurrently, logging failures.
+
+    Args:
+        containers: Containers to stop, keyed by container name
+
+    Returns:
+        Names of the containers that could not be stopped
+    """
+    if not containers:
+        return []
+
+    failed = []
+    with ThreadPoolExecutor(
+        max_workers=len(containers), thread_name_prefix="testcontainers-stop"
+    ) as executor:
+        futures = {name: executor.submit(container.stop) for name, container in containers.items()}
+        for name, future in futures.items():
+            try:
+                future.result()
+            except Exception:
+                logger.warning("Could not stop %s container", name, exc_info=True)
+                failed.append(name)
+    return failed
+
+
+def remove_in_background(containers: dict[str, DockerContainer]) -> bool:
+    """Hand containers to a detached process that removes them.
+
+    The process outlives the test session, so the session can exit without
+    waiting for Docker. Its failures are logged to ``teardown.log`` in the
+    cache directory.
+
+    Args:
+        containers: Containers to remove, keyed by container name
+
+    Returns:
+        Whether the process was started, False if it could not be
+    """
+    container_ids = []
+    for container in containers.values():
+        try:
+            container_ids.append(container.get_container_id())
+        except ContainerStartException:
+            # Never started, nothing to remove
+            continue
+
+    if not container_ids:
+        return True
+
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "django_testcontainers_plus", "remove", "--log", *container_ids],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        logger.warning("Could not start the background teardown process", exc_info=True)
+        return False
+    return True
+
+
+def remove_containers(container_ids: Sequence[str]) -> list[str]:
+    """Remove containers and their volumes concurrently, logging failures.
+
+    Containers that are already gone, for example removed by the Ryuk
+    reaper, count as removed.
+
+    Args:
+        container_ids: Docker container ids
+
+    Returns:
+        Ids of the containers that could not be removed
+    """
+    client = DockerClient().client
+
+    def remove(container_id: str) -> None:
+        try:
+            client.containers.get(container_id).remove(force=True, v=True)
+        except NotFound:
+            pass
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, len(container_ids))) as executor:
+        futures = {
+            container_id: executor.submit(remove, container_id) for container_id in container_ids
+        }
+        for container_id, future in futures.items():
+            try:
+                future.result()
+            except Exception:
+                logger.warning("Could not remove container %s", container_id[:12], exc_info=True)
+                failed.append(container_id)
+            else:
+                logger.info("Removed container %s", container_id[:12])
+    return failed
+
+
+def log_to_file() -> None:
+    """Send this process's log records to ``teardown.log`` in the cache directory."""
+    logging.basicConfig(
+        filename=get_cache_dir() / TEARDOWN_LOG,
+        level=logging.INFO,
+        format="%(asctime)s %(process)d %(levelname)s %(message)s",
+    )
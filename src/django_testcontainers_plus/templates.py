@@ -0,0 +1,124 @@
+import hashlib
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+import django
+
+from .fingerprint import database_fingerprint
+from .providers import ContainerProvider
+from .reuse import config_hash
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+logger = logging.getLogger(__name__)
+
+
+def get_fixtures(config: dict[str, Any]) -> list[str]:
+    """Get the fixture files baked into a provider's template database.
+
+    Args:
+        config: Effective provider configuration
+
+    Returns:
+        Fixture paths from ``config['bake']['fixtures']``, empty if none
+    """
+    bake = config.get("bake")
+    if not isinstance(bake, dict):
+        return []
+    return list(bake.get("fixtures", []))
+
+
+def template_key(
+    provider: ContainerProvider, config: dict[str, Any], alias: str, fingerprint: str
+) -> str:
+    """Build the key identifying a template database.
+
+    Args:
+        provider: Provider serving the alias
+        config: Effective provider configuration
+        alias: DATABASES alias
+        fingerprint: Hash of the project's migration and fixture files
+
+    Returns:
+        Hex digest of everything that affects the migrated schema
+    """
+    payload = "\0".join(
+        [fingerprint, config_hash(provider.name, config), alias, django.get_version()]
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+@contextmanager
+def database_templates(manager: "ContainerManager") -> Iterator[None]:
+    """Build test databases from template databases while active.
+
+    For every alias whose provider has ``template`` enabled, the test database
+    is created from a template keyed by the migration files and provider
+    config. When no template exists yet, the database is migrated normally
+    and then saved as the template for later sessions.
+
+    Args:
+        manager: Manager with running containers
+    """
+    from django.db import connections
+
+    targets = {
+        alias: provider
+        for alias, provider in manager.get_database_providers().items()
+        if manager.provider_configs[provider.name].get("template", False)
+    }
+
+    if not targets:
+        yield
+        return
+
+    fingerprints: dict[str, str] = {}
+
+    for alias, provider in targets.items():
+        config = manager.provider_configs[provider.name]
+        if provider.name not in fingerprints:
+            fingerprints[provider.name] = database_fingerprint(get_fixtures(config))
+        fingerprint = fingerprints[provider.name]
+        creation = connections[alias].creation
+        creation.create_test_db = _templated_create_test_db(  # type: ignore[method-assign]
+            creation.create_test_db,
+            provider,
+            connections[alias],
+            config,
+            template_key(provider, config, alias, fingerprint),
+        )
+
+    try:
+        yield
+    finally:
+        for alias in targets:
+            del connections[alias].creation.create_test_db
+
+
+def _templated_create_test_db(
+    create_test_db: Callable[..., str],
+    provider: ContainerProvider,
+    connection: Any,
+    config: dict[str, Any],
+    key: str,
+) -> Callable[..., str]:
+    """Wrap a connection's ``create_test_db`` to restore from or save a template."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        if provider.restore_template_database(connection, config, key):
+            # The restored database already has every migration applied
+            kwargs["keepdb"] = True
+            return create_test_db(*args, **kwargs)
+
+        test_name = create_test_db(*args, **kwargs)
+        try:
+            provider.save_template_database(connection, config, key)
+        except Exception:
+            # Another process (e.g. an xdist worker) may be saving the same template
+            logger.warning("Could not save template database for %s", test_name, exc_info=True)
+        return test_name
+
+    return wrapper
@@ -0,0 +1,158 @@
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .manager import ContainerManager
+
+
+@dataclass
+class PhaseTiming:
+    """Duration of one startup phase of one container."""
+
+    container: str
+    phase: str
+    seconds: float
+
+
+@dataclass
+class StartupTimings:
+    """Per-container timings of every session setup phase.
+
+    Phases recorded by :class:`~django_testcontainers_plus.manager.ContainerManager`:
+
+    - ``pull``: pulling the image, when it was not available locally
+    - ``start``: ``container.start()``, including the wait until it is ready
+      unless the provider's readiness probe was used
+    - ``ready``: waiting for the provider's readiness probe to pass
+    - ``update_settings``: building the settings updates
+    - ``create_db[<alias>]``: Django creating (or restoring) the test database
+    - ``clone_db[<alias>]``: creating the test database's clones for ``--parallel``
+    """
+
+    phases: list[PhaseTiming] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @contextmanager
+    def record(self, container: str, phase: str) -> Iterator[None]:
+        """Time the body of the ``with`` block.
+
+        The phase is recorded even if the block raises. Safe to use from
+        several threads.
+
+        Args:
+            container: Container (or provider) name
+            phase: Phase name
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(container, phase, time.perf_counter() - started)
+
+    def add(self, container: str, phase: str, seconds: float) -> None:
+        """Record a phase duration.
+
+        Args:
+            container: Container (or provider) name
+            phase: Phase name
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self.phases.append(PhaseTiming(container, phase, seconds))
+
+    def totals(self) -> dict[str, float]:
+        """Sum the phase durations of each container.
+
+        Returns:
+            Dict of container name to seconds, in recording order
+        """
+        totals: dict[str, float] = {}
+        for timing in self.phases:
+            totals[timing.container] = totals.get(timing.container, 0.0) + timing.seconds
+        return totals
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the timings to plain data.
+
+        Returns:
+            Dict with a ``phases`` list and per-container ``totals``
+        """
+        return {
+            "phases": [asdict(timing) for timing in self.phases],
+            "totals": self.totals(),
+        }
+
+    def format_table(self) -> str:
+        """Format the timings as a text table.
+
+        Returns:
+            Table with one row per phase, empty if nothing was recorded
+        """
+        if not self.phases:
+            return ""
+
+        rows = [(t.container, t.phase, f"{t.seconds:.2f}s") for t in self.phases]
+        headers = ("Container", "Phase", "Time")
+        widths = [max(len(row[i]) for row in [headers, *rows]) for i in range(3)]
+
+        def line(row: tuple[str, str, str]) -> str:
+            return f"{row[0]:<{widths[0]}}  {row[1]:<{widths[1]}}  {row[2]:>{widths[2]}}"
+
+        return "\n".join([line(headers), *(line(row) for row in rows)])
+
+    def write_json(self, path: str | Path) -> None:
+        """Write the timings to a JSON file.
+
+        Args:
+            path: File to write, parent directories are created
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.as_dict(), indent=2))
+
+
+@contextmanager
+def database_creation_timings(manager: "ContainerManager") -> Iterator[None]:
+    """Record how long Django takes to create each container-backed test database.
+
+    Args:
+        manager: Manager with running containers, whose timings are updated
+    """
+    from django.db import connections
+
+    originals: dict[str, Any] = {}
+
+    for alias, provider in manager.get_database_providers().items():
+        creation = connections[alias].creation
+        originals[alias] = creation.__dict__.get("create_test_db")
+        creation.create_test_db = _timed(  # type: ignore[method-assign]
+            creation.create_test_db, manager.timings, provider.name, f"create_db[{alias}]"
+        )
+
+    try:
+        yield
+    finally:
+        for alias, original in originals.items():
+            creation = connections[alias].creation
+            if original is None:
+                del creation.create_test_db
+            else:
+                creation.create_test_db = original  # type: ignore[method-assign]
+
+
+def _timed(
+    func: Callable[..., Any], timings: StartupTimings, container: str, phase: str
+) -> Callable[..., Any]:
+    """Wrap a callable to record its duration as a phase."""
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with timings.record(container, phase):
+            return func(*args, **kwargs)
+
+    return wrapper
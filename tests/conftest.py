@@ -1,9 +1,17 @@
 import os
 
 import django
+import pytest
 
 
 def pytest_configure(config):
     """Configure Django settings for pytest."""
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
     django.setup()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep state written to the cache directory out of the user's real cache."""
+    monkeypatch.setenv("DJANGO_TESTCONTAINERS_CACHE_DIR", str(tmp_path))
+    return tmp_path
@@ -0,0 +1,102 @@
+"""Tests for the asyncio container manager API."""
+
+import asyncio
+import threading
+import time
+
+from django_testcontainers_plus import pytest_plugin
+from django_testcontainers_plus.async_manager import AsyncContainerManager
+from django_testcontainers_plus.manager import ContainerManager
+from tests.test_manager import MockProvider, MockSettings
+
+
+class SlowProvider(MockProvider):
+    """Provider whose containers take a while to start, recording the thread."""
+
+    def __init__(self):
+        super().__init__("slow")
+        self.threads = []
+
+    def get_container(self, config):
+        container = super().get_container(config)
+
+        def start():
+            self.threads.append(threading.current_thread())
+            time.sleep(0.2)
+
+        container.start.side_effect = start
+        return container
+
+
+def make_manager():
+    """Build an async manager with one slow provider."""
+    manager = AsyncContainerManager(MockSettings())
+    manager.manager.providers = [SlowProvider()]
+    return manager
+
+
+class TestAsyncContainerManager:
+    """Test AsyncContainerManager."""
+
+    def test_start_and_stop(self):
+        """Test containers are started and stopped through the sync manager."""
+        manager = make_manager()
+
+        async def run():
+            updates = await manager.start_containers()
+            container = manager.active_containers["slow"]
+            await manager.stop_containers()
+            return updates, container
+
+        updates, container = asyncio.run(run())
+
+        assert updates == {"TEST_CONFIG": {"slow": "updated"}}
+        assert manager.settings_updates == updates
+        assert container.stop.called
+        assert manager.active_containers == {}
+
+    def test_does_not_block_event_loop(self):
+        """Test other coroutines run while containers start in a worker thread."""
+        manager = make_manager()
+        ticks = []
+
+        async def run():
+            start = asyncio.create_task(manager.start_containers())
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks.append(start.done())
+            await start
+
+        asyncio.run(run())
+
+        assert manager.manager.providers[0].threads[0] is not threading.main_thread()
+        assert ticks == [False] * 5
+
+    def test_context_manager(self):
+        """Test async with starts the containers and stops them on exit."""
+        manager = make_manager()
+
+        async def run():
+            async with manager as entered:
+                assert entered.active_containers
+                return entered.active_containers["slow"]
+
+        container = asyncio.run(run())
+
+        assert container.stop.called
+
+    def test_wraps_existing_manager(self):
+        """Test an existing sync manager is driven rather than replaced."""
+        sync_manager = ContainerManager(MockSettings())
+
+        assert AsyncContainerManager(manager=sync_manager).manager is sync_manager
+
+    def test_fixture(self):
+        """Test the async fixture wraps the session manager."""
+        sync_manager = ContainerManager(MockSettings())
+        fixture = pytest_plugin.async_testcontainers_manager._get_wrapped_function()
+
+        manager = asyncio.run(fixture(sync_manager))
+
+        assert isinstance(manager, AsyncContainerManager)
+        assert manager.manager is sync_manager
@@ -0,0 +1,203 @@
+"""Tests for baking pre-migrated container images."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import docker
+import pytest
+
+from django_testcontainers_plus.bake import bake_images, bake_tag, baked_image_exists
+from django_testcontainers_plus.cli import main
+from django_testcontainers_plus.exceptions import DjangoTestcontainersError
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.providers.postgres import PostgresProvider
+from tests.test_manager import MockProvider, MockSettings
+
+
+class TestBakeTag:
+    """Test baked image tags."""
+
+    def test_format(self):
+        """Test tags live in the package's local repository."""
+        tag = bake_tag(MockProvider("postgres"), {"image": "postgres:16"}, "abc")
+
+        assert tag.startswith("django-testcontainers-plus/postgres:")
+
+    def test_changes_with_fingerprint(self):
+        """Test the tag changes when migrations or fixtures change."""
+        provider = MockProvider("postgres")
+
+        assert bake_tag(provider, {}, "a") != bake_tag(provider, {}, "b")
+
+    def test_changes_with_base_image(self):
+        """Test the tag changes with the base image."""
+        provider = MockProvider("postgres")
+
+        assert bake_tag(provider, {"image": "postgres:15"}, "a") != bake_tag(
+            provider, {"image": "postgres:16"}, "a"
+        )
+
+    def test_baked_image_exists(self):
+        """Test image lookup reports missing images."""
+        client = Mock()
+        client.images.get.side_effect = docker.errors.ImageNotFound("missing")
+
+        assert baked_image_exists(client, "tag") is False
+
+
+class TestPrepareForCommit:
+    """Test providers keep their data inside the container filesystem."""
+
+    def test_postgres_moves_pgdata(self):
+        """Test PGDATA is moved out of the image volume."""
+        container = Mock()
+
+        PostgresProvider().prepare_for_commit(container, {})
+
+        container.with_env.assert_called_once_with("PGDATA", PostgresProvider.BAKED_DATA_DIR)
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_postgres_baked_tmpfs(self, mock_postgres_container):
+        """Test a baked image on tmpfs copies its data onto the mount on start."""
+        container = Mock()
+        container.with_tmpfs_mount.return_value = container
+        container.with_command.return_value = container
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"baked": True, "profile": "fast"})
+
+        container.with_tmpfs_mount.assert_called_once_with(PostgresProvider.DATA_DIR, "rw")
+        container.with_env.assert_any_call("PGDATA", PostgresProvider.DATA_DIR)
+        container.with_env.assert_any_call(
+            "POSTGRES_BAKED_DATA_DIR", PostgresProvider.BAKED_DATA_DIR
+        )
+        command = container.with_command.call_args.args[0]
+        assert command[:2] == ["sh", "-c"]
+        assert command[3:6] == ["sh", "postgres", "-c"]
+        assert "fsync=off" in command
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_postgres_baked_tmpfs_replicas(self, mock_postgres_container):
+        """Test the copy runs before the replica script starts the primary."""
+        container = Mock()
+        container.with_tmpfs_mount.return_value = container
+        container.with_command.return_value = container
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"baked": True, "tmpfs": True, "replicas": 1})
+
+        command = container.with_command.call_args.args[0]
+        assert command[3:6] == ["sh", "sh", "-c"]
+        assert command[-2:] == ["sh", "postgres"]
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_postgres_baked_without_tmpfs(self, mock_postgres_container):
+        """Test a baked image without tmpfs runs from the baked data directory."""
+        container = Mock()
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"baked": True})
+
+        container.with_tmpfs_mount.assert_not_called()
+        container.with_env.assert_not_called()
+
+    def test_unsupported_provider(self):
+        """Test bake on a provider without baking support fails naming the provider."""
+        manager = ContainerManager(MockSettings(TESTCONTAINERS={"redis": {"bake": True}}))
+
+        with pytest.raises(DjangoTestcontainersError, match="redis provider does not support"):
+            manager.get_provider_config(MockProvider("redis"))
+
+    def test_unsupported_provider_command(self, capsys):
+        """Test the bake command reports the error instead of a traceback."""
+        manager = ContainerManager(MockSettings(TESTCONTAINERS={"redis": {"bake": True}}))
+        manager.providers = [MockProvider("redis")]
+
+        with (
+            patch("django_testcontainers_plus.cli._setup_django"),
+            patch("django_testcontainers_plus.manager.ContainerManager", return_value=manager),
+        ):
+            assert main(["bake"]) == 1
+
+        assert "redis provider does not support 'bake'" in capsys.readouterr().err
+
+
+class TestResolveBakedImage:
+    """Test ContainerManager picks up baked images."""
+
+    @pytest.fixture(autouse=True)
+    def docker_client(self):
+        """Avoid connecting to Docker."""
+        with (
+            patch("django_testcontainers_plus.manager.DockerClient"),
+            patch("django_testcontainers_plus.manager.database_fingerprint", return_value="abc"),
+        ):
+            yield
+
+    def test_uses_baked_image(self):
+        """Test the baked image replaces the base image and enables templates."""
+        manager = ContainerManager(MockSettings())
+        config = {"image": "postgres:16", "bake": True}
+
+        with patch("django_testcontainers_plus.manager.baked_image_exists", return_value=True):
+            resolved = manager._resolve_baked_image(MockProvider("postgres"), config)
+
+        assert resolved["image"].startswith("django-testcontainers-plus/postgres:")
+        assert resolved["baked"] is True
+        assert config["template"] is True
+        assert config["image"] == "postgres:16"
+
+    def test_falls_back_to_base_image(self):
+        """Test the base image is used when nothing was baked yet."""
+        manager = ContainerManager(MockSettings())
+        config = {"image": "postgres:16", "bake": True}
+
+        with patch("django_testcontainers_plus.manager.baked_image_exists", return_value=False):
+            resolved = manager._resolve_baked_image(MockProvider("postgres"), config)
+
+        assert resolved["image"] == "postgres:16"
+        assert "template" not in config
+
+
+class TestBakeImages:
+    """Test the bake workflow."""
+
+    def test_bake_commits_migrated_container(self):
+        """Test the container is migrated, templated, stopped and committed."""
+
+        class BakeProvider(MockProvider):
+            SUPPORTS_BAKE = True
+
+            def update_settings(self, container, settings, config):
+                return {"DATABASES": {"default": {"ENGINE": "x"}}}
+
+        container = Mock()
+        provider = BakeProvider("postgres")
+        provider.get_container = Mock(return_value=container)
+        provider.prepare_for_commit = Mock()
+        provider.save_template_database = Mock()
+        settings = MockSettings(
+            DATABASES={}, TESTCONTAINERS={"postgres": {"bake": {"fixtures": ["users.json"]}}}
+        )
+        manager = ContainerManager(settings)
+        manager.providers = [provider]
+        connection = MagicMock()
+
+        with (
+            patch("django.db.connections", {"default": connection}),
+            patch("django.core.management.call_command") as call_command,
+            patch("django_testcontainers_plus.bake.database_fingerprint", return_value="abc"),
+        ):
+            baked = bake_images(manager, verbosity=0)
+
+        repository, tag = baked["postgres"].rsplit(":", 1)
+        assert provider.prepare_for_commit.called
+        assert connection.creation.create_test_db.called
+        call_command.assert_called_once_with(
+            "loaddata", "users.json", database="default", verbosity=0
+        )
+        provider.save_template_database.assert_called_once()
+        assert settings.DATABASES == {"default": {"ENGINE": "x"}}
+        wrapped = container.get_wrapped_container.return_value
+        assert wrapped.stop.called
+        wrapped.commit.assert_called_once_with(repository=repository, tag=tag)
+        assert container.stop.called
@@ -0,0 +1,324 @@
+"""Tests for concurrent test database creation."""
+
+import time
+from unittest.mock import Mock, patch
+
+import django.test.runner
+import django.test.utils
+import pytest
+
+from django_testcontainers_plus.creation import (
+    PlannedDatabase,
+    clone_test_databases,
+    concurrent_database_setup,
+    create_databases_concurrently,
+    plan_concurrent_databases,
+)
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.providers.mysql import MySQLProvider
+from tests.test_manager import MockProvider, MockSettings
+
+
+class FakeConnections(dict):
+    """Stand-in for ``django.db.connections``."""
+
+    def close_all(self):
+        pass
+
+
+class FakeCreation:
+    """Stand-in for a DatabaseCreation that records when it ran."""
+
+    def __init__(self, alias, log, delay=0.05):
+        self.alias = alias
+        self.log = log
+        self.delay = delay
+
+    def create_test_db(self, **kwargs):
+        self.log.append(("start", self.alias))
+        time.sleep(self.delay)
+        self.log.append(("end", self.alias))
+        return f"test_{self.alias}"
+
+    def test_db_signature(self):
+        return (self.alias,)
+
+
+def make_connection(alias, log, port=5432, test=None):
+    """Build a fake connection for an alias on a server port."""
+    connection = Mock()
+    connection.settings_dict = {"HOST": "localhost", "PORT": port, "TEST": test or {}}
+    connection.creation = FakeCreation(alias, log)
+    return connection
+
+
+def make_manager(*aliases):
+    """Build a manager whose containers serve the given aliases."""
+    manager = ContainerManager(MockSettings())
+    manager.providers = [MockProvider("postgres")]
+    manager.provider_updates = {"postgres": {"DATABASES": {alias: {} for alias in aliases}}}
+    return manager
+
+
+def unique_databases(*groups):
+    """Build a get_unique_databases_and_mirrors result."""
+    return {(group[0],): (group[0], list(group)) for group in groups}, {}
+
+
+class TestPlanConcurrentDatabases:
+    """Test which databases are planned for concurrent creation."""
+
+    def plan(self, connections, groups, manager):
+        with (
+            patch("django.db.connections", connections),
+            patch(
+                "django.test.utils.get_unique_databases_and_mirrors",
+                return_value=unique_databases(*groups),
+            ),
+        ):
+            return plan_concurrent_databases(manager)
+
+    def test_default_dependency(self):
+        """Test other databases depend on default unless DEPENDENCIES is set."""
+        log = []
+        connections = FakeConnections(
+            default=make_connection("default", log),
+            analytics=make_connection("analytics", log, 5433),
+            events=make_connection("events", log, 5434, {"DEPENDENCIES": []}),
+        )
+
+        planned = self.plan(
+            connections, [["default"], ["analytics"], ["events"]], make_manager(*connections)
+        )
+
+        assert [(p.alias, p.dependencies) for p in planned] == [
+            ("default", set()),
+            ("analytics", {"default"}),
+            ("events", set()),
+        ]
+        assert planned[1].server == ("localhost", "5433")
+
+    def test_skips_non_container_databases(self):
+        """Test databases without a container, and their dependents, are left to Django."""
+        log = []
+        connections = FakeConnections(
+            default=make_connection("default", log),
+            analytics=make_connection("analytics", log, 5433),
+            events=make_connection("events", log, 5434, {"DEPENDENCIES": []}),
+        )
+
+        planned = self.plan(
+            connections,
+            [["default"], ["analytics"], ["events"]],
+            make_manager("analytics", "events"),
+        )
+
+        assert [p.alias for p in planned] == ["events"]
+
+
+class TestCreateDatabasesConcurrently:
+    """Test the concurrent creation of planned databases."""
+
+    def create(self, planned, connections):
+        with patch("django.db.connections", connections):
+            return create_databases_concurrently(planned, 0, False, False)
+
+    def test_independent_servers_overlap(self):
+        """Test databases on different servers are created at the same time."""
+        log = []
+        connections = FakeConnections(
+            default=make_connection("default", log),
+            analytics=make_connection("analytics", log, 5433),
+        )
+        planned = [
+            PlannedDatabase("default", ["default"], set(), ("localhost", "5432")),
+            PlannedDatabase("analytics", ["analytics"], set(), ("localhost", "5433")),
+        ]
+
+        names = self.create(planned, connections)
+
+        assert names == {"default": "test_default", "analytics": "test_analytics"}
+        assert [event for event, _ in log] == ["start", "start", "end", "end"]
+        connections["default"].inc_thread_sharing.assert_called_once()
+        connections["default"].dec_thread_sharing.assert_called_once()
+
+    def test_dependencies_and_shared_server(self):
+        """Test dependencies are waited for and one server creates one database at a time."""
+        log = []
+        connections = FakeConnections(
+            default=make_connection("default", log),
+            events=make_connection("events", log),
+            analytics=make_connection("analytics", log, 5433),
+        )
+        planned = [
+            PlannedDatabase("default", ["default"], set(), ("localhost", "5432")),
+            PlannedDatabase("events", ["events"], set(), ("localhost", "5432")),
+            PlannedDatabase("analytics", ["analytics"], {"events"}, ("localhost", "5433")),
+        ]
+
+        self.create(planned, connections)
+
+        def index(event, alias):
+            return log.index((event, alias))
+
+        assert index("start", "analytics") > index("end", "events")
+        first, second = sorted(["default", "events"], key=lambda a: index("start", a))
+        assert index("start", second) > index("end", first)
+
+    def test_error_raised(self):
+        """Test a failed creation is raised once all others finished."""
+        log = []
+        connections = FakeConnections(
+            default=make_connection("default", log),
+            analytics=make_connection("analytics", log, 5433),
+        )
+        connections["analytics"].creation.create_test_db = Mock(side_effect=RuntimeError("boom"))
+        planned = [
+            PlannedDatabase("default", ["default"], set(), ("localhost", "5432")),
+            PlannedDatabase("analytics", ["analytics"], set(), ("localhost", "5433")),
+        ]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            self.create(planned, connections)
+
+        assert ("end", "default") in log
+
+
+class TestConcurrentDatabaseSetup:
+    """Test the setup_databases replacement."""
+
+    def test_precreated_databases_skipped(self):
+        """Test Django's setup only gets the names of already created databases."""
+        log = []
+        connections = FakeConnections(
+            default=make_connection("default", log),
+            analytics=make_connection("analytics", log, 5433, {"DEPENDENCIES": []}),
+        )
+        calls = []
+
+        def setup_databases(verbosity, interactive, keepdb=False, aliases=None, **kwargs):
+            calls.append(
+                [connections[alias].creation.create_test_db() for alias in ("default", "analytics")]
+            )
+            return "old_config"
+
+        with (
+            patch("django.db.connections", connections),
+            patch(
+                "django.test.utils.get_unique_databases_and_mirrors",
+                return_value=unique_databases(["default"], ["analytics"]),
+            ),
+            patch("django.test.utils.setup_databases", setup_databases),
+            concurrent_database_setup(make_manager("default", "analytics")),
+        ):
+            assert django.test.runner._setup_databases is django.test.utils.setup_databases
+            assert django.test.utils.setup_databases(0, False, aliases=None) == "old_config"
+
+        assert calls == [["test_default", "test_analytics"]]
+        assert len([event for event in log if event[0] == "start"]) == 2
+        assert "create_test_db" not in vars(connections["default"].creation)
+
+    def test_parallel_clones_after_setup(self):
+        """Test clones are made by the wrapper instead of Django's setup."""
+        log = []
+        connections = FakeConnections(default=make_connection("default", log))
+        setup_databases = Mock(return_value="old_config")
+        manager = make_manager("default")
+
+        with (
+            patch("django.db.connections", connections),
+            patch(
+                "django.test.utils.get_unique_databases_and_mirrors",
+                return_value=unique_databases(["default"]),
+            ),
+            patch("django.test.utils.setup_databases", setup_databases),
+            patch("django_testcontainers_plus.creation.clone_test_databases") as clone,
+            concurrent_database_setup(manager),
+        ):
+            django.test.utils.setup_databases(0, False, parallel=3)
+
+        assert "parallel" not in setup_databases.call_args.kwargs
+        clone.assert_called_once_with(manager, ["default"], 3, 0, False)
+
+    def test_disabled(self):
+        """Test the concurrent_databases option turns the replacement off."""
+        original = django.test.utils.setup_databases
+        manager = ContainerManager(
+            MockSettings(TESTCONTAINERS_OPTIONS={"concurrent_databases": False})
+        )
+
+        with concurrent_database_setup(manager):
+            assert django.test.utils.setup_databases is original
+
+
+class TestCloneTestDatabases:
+    """Test creating the clones for Django's parallel runner."""
+
+    def test_provider_clones(self):
+        """Test a provider that clones is given every suffix at once."""
+        manager = make_manager("default")
+        provider = manager.providers[0]
+        provider.clone_test_databases = Mock(return_value=True)
+        manager.provider_configs = {"postgres": {}}
+        connection = Mock()
+
+        with patch("django.db.connections", {"default": connection}):
+            clone_test_databases(manager, ["default"], 2, 0, False)
+
+        assert provider.clone_test_databases.call_args.args[3] == ["1", "2"]
+        connection.creation.clone_test_db.assert_not_called()
+        assert [t.phase for t in manager.timings.phases] == ["clone_db[default]"]
+
+    def test_serial_fallback(self):
+        """Test Django clones databases the provider does not handle."""
+        manager = make_manager("default")
+        manager.provider_configs = {"postgres": {}}
+        connections = {"default": Mock(), "sqlite": Mock()}
+
+        with patch("django.db.connections", connections):
+            clone_test_databases(manager, ["default", "sqlite"], 2, 0, True)
+
+        for connection in connections.values():
+            assert [
+                c.kwargs["suffix"] for c in connection.creation.clone_test_db.call_args_list
+            ] == [
+                "1",
+                "2",
+            ]
+
+    def test_mysql_clones_inside_container(self):
+        """Test MySQL dumps and loads the clones inside the container."""
+        container = Mock()
+        container.exec.return_value = Mock(exit_code=0, output=b"")
+        connection = Mock()
+        connection.settings_dict = {"NAME": "test_app", "USER": "test"}
+        connection.creation.sql_table_creation_suffix.return_value = "CHARACTER SET utf8mb4"
+        connection.creation.get_test_db_clone_settings = lambda suffix: {
+            "NAME": f"test_app_{suffix}"
+        }
+
+        assert MySQLProvider().clone_test_databases(container, connection, {}, ["1", "2"], 0, True)
+
+        assert container.exec.call_args.args[0][4:] == [
+            "test_app",
+            "CHARACTER SET utf8mb4",
+            "test",
+            "1",
+            "test_app_1",
+            "test_app_2",
+        ]
+
+    def test_mysql_failure_raised(self):
+        """Test a failed in-container clone is raised."""
+        container = Mock()
+        container.exec.return_value = Mock(exit_code=1, output=b"access denied")
+        connection = Mock()
+        connection.settings_dict = {"NAME": "test_app", "USER": "test"}
+        connection.creation.get_test_db_clone_settings.return_value = {"NAME": "test_app_1"}
+
+        with pytest.raises(RuntimeError, match="access denied"):
+            MySQLProvider().clone_test_databases(container, connection, {}, ["1"], 0, False)
+
+    def test_mysql_without_container(self):
+        """Test MySQL leaves cloning to Django when it did not start the container."""
+        assert not MySQLProvider().clone_test_databases(None, Mock(), {}, ["1"], 0, False)
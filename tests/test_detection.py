@@ -0,0 +1,104 @@
+"""Tests for the settings detection index."""
+
+from collections import Counter
+
+from django_testcontainers_plus.detection import (
+    MYSQL_RULES,
+    POSTGRES_RULES,
+    REDIS_RULES,
+    SettingsIndex,
+)
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.providers import PostgresProvider
+from tests.test_manager import MockProvider, MockSettings
+
+RULES = POSTGRES_RULES + MYSQL_RULES + REDIS_RULES
+
+
+class CountingSettings(MockSettings):
+    """Settings that count how often each setting is read."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.reads = Counter()
+
+    def __getattribute__(self, name):
+        if name.isupper():
+            object.__getattribute__(self, "reads")[name] += 1
+        return object.__getattribute__(self, name)
+
+
+class TestSettingsIndex:
+    """Test building and querying the index."""
+
+    def test_matches_by_kind(self):
+        """Test entries are indexed under the kind whose rule matched them."""
+        settings = MockSettings(
+            DATABASES={
+                "default": {"ENGINE": "django.db.backends.postgresql"},
+                "legacy": {"ENGINE": "django.db.backends.mysql"},
+                "local": {"ENGINE": "django.db.backends.sqlite3"},
+            },
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}},
+            CELERY_BROKER_URL="REDIS://localhost:6379/0",
+        )
+
+        index = SettingsIndex(settings, RULES)
+
+        assert list(index.aliases("postgres", "DATABASES")) == ["default"]
+        assert list(index.aliases("mysql", "DATABASES")) == ["legacy"]
+        assert [m.path for m in index.matches("redis")] == [
+            "CACHES['default']['BACKEND']",
+            "CELERY_BROKER_URL",
+        ]
+        assert index.matches("redis", "CELERY_BROKER_URL")[0].alias is None
+
+    def test_single_pass(self):
+        """Test each setting is read once, however many rules look at it."""
+        settings = CountingSettings(
+            DATABASES={"default": {"ENGINE": "django.db.backends.postgresql"}},
+            CACHES={},
+        )
+
+        SettingsIndex(settings, RULES + RULES)
+
+        assert settings.reads == Counter(
+            {"DATABASES": 1, "CACHES": 1, "CELERY_BROKER_URL": 1, "SESSION_ENGINE": 1}
+        )
+
+    def test_ignores_malformed_entries(self):
+        """Test non-dict entries and missing fields do not match."""
+        settings = MockSettings(DATABASES={"default": "postgresql", "other": {}})
+
+        assert SettingsIndex(settings, RULES).matches("postgres") == []
+
+
+class TestProviderDetection:
+    """Test providers detecting themselves from the index."""
+
+    def test_rules(self):
+        """Test providers with rules are detected from the index."""
+        settings = MockSettings(DATABASES={"default": {"ENGINE": "django.db.backends.postgresql"}})
+        provider = PostgresProvider()
+
+        assert provider.detect(SettingsIndex(settings, RULES))
+        assert not provider.detect(SettingsIndex(MockSettings(), RULES))
+
+    def test_fallback_to_can_auto_detect(self):
+        """Test providers without rules use can_auto_detect."""
+        index = SettingsIndex(MockSettings(), RULES)
+
+        assert MockProvider(auto_detect=True).detect(index)
+        assert not MockProvider(auto_detect=False).detect(index)
+
+    def test_manager_builds_one_index(self):
+        """Test the manager indexes settings once for every provider."""
+        settings = CountingSettings(
+            DATABASES={"default": {"ENGINE": "django.db.backends.postgresql"}},
+        )
+        manager = ContainerManager(settings)
+
+        needed = manager.detect_needed_containers()
+
+        assert [provider.name for provider in needed] == ["postgres"]
+        assert settings.reads["DATABASES"] == 1
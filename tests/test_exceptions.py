@@ -1,14 +1,16 @@
 """Tests for exception handling and helpful error messages."""
 
-from unittest.mock import patch
+from dataclasses import replace
 
 import pytest
 
 from django_testcontainers_plus.exceptions import (
     DjangoTestcontainersError,
+    ImageUnavailableError,
     MissingDependencyError,
 )
 from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.providers import BUILTIN_PROVIDERS, ProviderRegistry
 
 
 class MockSettings:
@@ -71,115 +73,107 @@ class TestMissingDependencyError:
         assert error.original_error == original
 
 
+def unavailable(*names):
+    """Build a provider registry whose given providers fail to import."""
+    specs = [
+        replace(spec, target="tests.missing_provider:Provider") if spec.name in names else spec
+        for spec in BUILTIN_PROVIDERS
+    ]
+    return ProviderRegistry(specs, entry_point_group=None)
+
+
 class TestContainerManagerErrorHandling:
     """Test ContainerManager raises helpful errors for unavailable providers."""
 
-    @patch("django_testcontainers_plus.manager.UNAVAILABLE_PROVIDERS")
-    def test_mysql_detection_raises_error(self, mock_unavailable):
-        """Test MySQL detection raises helpful error when deps missing."""
-        mock_unavailable.__bool__ = lambda self: True
-        mock_unavailable.items = lambda: [
-            ("mysql", ("mysql", ImportError("No module named 'MySQLdb'")))
-        ]
+    def detect(self, settings, *names):
+        manager = ContainerManager(settings)
+        manager.registry = unavailable(*names)
+        return manager.detect_needed_containers()
 
+    def test_mysql_detection_raises_error(self):
+        """Test MySQL detection raises helpful error when deps missing."""
         settings = MockSettings(DATABASES={"default": {"ENGINE": "django.db.backends.mysql"}})
-        manager = ContainerManager(settings)
 
         with pytest.raises(MissingDependencyError) as exc_info:
-            manager.detect_needed_containers()
+            self.detect(settings, "mysql")
 
         error = exc_info.value
         assert "MYSQL" in str(error)
         assert "pip install django-testcontainers-plus[mysql]" in str(error)
         assert "DATABASES['default']['ENGINE']" in str(error)
+        assert isinstance(error.original_error, ImportError)
 
-    @patch("django_testcontainers_plus.manager.UNAVAILABLE_PROVIDERS")
-    def test_redis_cache_detection_raises_error(self, mock_unavailable):
+    def test_redis_cache_detection_raises_error(self):
         """Test Redis cache detection raises helpful error."""
-        mock_unavailable.__bool__ = lambda self: True
-        mock_unavailable.items = lambda: [
-            ("redis", ("redis", ImportError("No module named 'redis'")))
-        ]
-
         settings = MockSettings(
             CACHES={"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
         )
-        manager = ContainerManager(settings)
 
         with pytest.raises(MissingDependencyError) as exc_info:
-            manager.detect_needed_containers()
+            self.detect(settings, "redis")
 
         error = exc_info.value
         assert "Redis" in str(error)
         assert "pip install django-testcontainers-plus[redis]" in str(error)
         assert "CACHES['default']['BACKEND']" in str(error)
 
-    @patch("django_testcontainers_plus.manager.UNAVAILABLE_PROVIDERS")
-    def test_redis_celery_detection_raises_error(self, mock_unavailable):
+    def test_redis_celery_detection_raises_error(self):
         """Test Redis Celery detection raises helpful error."""
-        mock_unavailable.__bool__ = lambda self: True
-        mock_unavailable.items = lambda: [
-            ("redis", ("redis", ImportError("No module named 'redis'")))
-        ]
-
         settings = MockSettings(CELERY_BROKER_URL="redis://localhost:6379/0")
-        manager = ContainerManager(settings)
 
         with pytest.raises(MissingDependencyError) as exc_info:
-            manager.detect_needed_containers()
+            self.detect(settings, "redis")
 
         error = exc_info.value
         assert "Redis" in str(error)
         assert "CELERY_BROKER_URL" in str(error)
 
-    @patch("django_testcontainers_plus.manager.UNAVAILABLE_PROVIDERS")
-    def test_explicitly_enabled_provider_raises_error(self, mock_unavailable):
+    def test_explicitly_enabled_provider_raises_error(self):
         """Test explicitly enabled unavailable provider raises error."""
-        mock_unavailable.__bool__ = lambda self: True
-        mock_unavailable.items = lambda: [
-            ("redis", ("redis", ImportError("No module named 'redis'")))
-        ]
-
         settings = MockSettings(TESTCONTAINERS={"redis": {"enabled": True}})
-        manager = ContainerManager(settings)
 
         with pytest.raises(MissingDependencyError) as exc_info:
-            manager.detect_needed_containers()
+            self.detect(settings, "redis")
 
         error = exc_info.value
         assert "Redis" in str(error)
         assert "TESTCONTAINERS['redis']" in str(error)
 
-    @patch("django_testcontainers_plus.manager.UNAVAILABLE_PROVIDERS")
-    def test_no_error_when_provider_not_detected(self, mock_unavailable):
+    def test_no_error_when_provider_not_detected(self):
         """Test no error when unavailable provider is not needed."""
-        mock_unavailable.__bool__ = lambda self: True
-        mock_unavailable.items = lambda: [
-            ("mysql", ("mysql", ImportError("No module named 'MySQLdb'")))
-        ]
-
         # PostgreSQL settings, MySQL not needed
         settings = MockSettings(DATABASES={"default": {"ENGINE": "django.db.backends.postgresql"}})
-        manager = ContainerManager(settings)
 
-        # Should not raise
-        providers = manager.detect_needed_containers()
-        assert len(providers) >= 0  # May have PostgreSQL
+        providers = self.detect(settings, "mysql")
 
-    @patch("django_testcontainers_plus.manager.UNAVAILABLE_PROVIDERS")
-    def test_no_error_when_auto_disabled(self, mock_unavailable):
-        """Test no error when auto-detection is disabled for unavailable provider."""
-        mock_unavailable.__bool__ = lambda self: True
-        mock_unavailable.items = lambda: [
-            ("mysql", ("mysql", ImportError("No module named 'MySQLdb'")))
-        ]
+        assert [provider.name for provider in providers] == ["postgres"]
 
+    def test_no_error_when_auto_disabled(self):
+        """Test no error when auto-detection is disabled for unavailable provider."""
         settings = MockSettings(
             DATABASES={"default": {"ENGINE": "django.db.backends.mysql"}},
             TESTCONTAINERS={"mysql": {"auto": False, "enabled": False}},
         )
-        manager = ContainerManager(settings)
 
         # Should not raise because auto-detection is disabled
-        providers = manager.detect_needed_containers()
-        assert len(providers) >= 0
+        assert self.detect(settings, "mysql") == []
+
+
+class TestImageUnavailableError:
+    """Test ImageUnavailableError exception."""
+
+    def test_lists_images(self):
+        """Test every unavailable image is listed."""
+        error = ImageUnavailableError(["postgres:16", "redis:7"])
+        message = str(error)
+
+        assert isinstance(error, DjangoTestcontainersError)
+        assert "→ postgres:16" in message
+        assert "→ redis:7" in message
+        assert "image_dir" in message
+
+    def test_mentions_image_dir(self):
+        """Test the searched image directory is named."""
+        message = str(ImageUnavailableError(["postgres:16"], "/images"))
+
+        assert "/images" in message
@@ -0,0 +1,132 @@
+"""Tests for fixture snapshots."""
+
+import inspect
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from django.contrib.auth.models import Group, Permission
+from django.test import TransactionTestCase
+
+from django_testcontainers_plus.fixtures import (
+    FixtureSnapshotMixin,
+    _snapshot_call_command,
+    fixture_snapshots,
+    load_fixtures,
+)
+from django_testcontainers_plus.manager import ContainerManager
+from tests.test_manager import MockProvider, MockSettings
+
+
+def make_manager(*aliases):
+    """Build a manager whose container serves the given aliases."""
+    manager = ContainerManager(MockSettings())
+    manager.providers = [MockProvider("postgres")]
+    manager.provider_updates = {"postgres": {"DATABASES": {alias: {} for alias in aliases}}}
+    return manager
+
+
+@pytest.fixture
+def groups_fixture(tmp_path):
+    """Write a fixture file with two groups."""
+    path = tmp_path / "groups.json"
+    path.write_text(
+        json.dumps(
+            [
+                {"model": "auth.group", "pk": 1, "fields": {"name": "editors"}},
+                {"model": "auth.group", "pk": 2, "fields": {"name": "readers"}},
+            ]
+        )
+    )
+    return str(path)
+
+
+@pytest.mark.django_db
+class TestFixtureSnapshots:
+    """Test loading fixtures through snapshots."""
+
+    def test_second_load_restores_snapshot(self, groups_fixture):
+        """Test a fixture set loaded before is restored without loaddata."""
+        with fixture_snapshots(make_manager("default")):
+            load_fixtures(groups_fixture)
+            Group.objects.all().delete()
+            Group.objects.create(name="leftover")
+
+            with patch("django.core.management.call_command") as call_command:
+                load_fixtures(groups_fixture)
+
+        assert not call_command.called
+        assert list(Group.objects.order_by("pk").values_list("pk", "name")) == [
+            (1, "editors"),
+            (2, "readers"),
+        ]
+
+    def test_restores_many_to_many(self, tmp_path):
+        """Test rows of auto-created many-to-many tables are restored with the model."""
+        permission = Permission.objects.get(codename="add_group")
+        path = tmp_path / "editors.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {
+                        "model": "auth.group",
+                        "pk": 1,
+                        "fields": {"name": "editors", "permissions": [permission.pk]},
+                    }
+                ]
+            )
+        )
+
+        with fixture_snapshots(make_manager("default")):
+            load_fixtures(str(path))
+            Group.objects.get(pk=1).permissions.clear()
+
+            with patch("django.core.management.call_command") as call_command:
+                load_fixtures(str(path))
+
+        assert not call_command.called
+        assert list(Group.objects.get(pk=1).permissions.all()) == [permission]
+
+    def test_database_without_container(self, groups_fixture):
+        """Test databases not served by a container are loaded with loaddata every time."""
+        with fixture_snapshots(make_manager("other")):
+            load_fixtures(groups_fixture)
+            Group.objects.all().delete()
+
+            with patch("django.core.management.call_command") as call_command:
+                load_fixtures(groups_fixture)
+
+        call_command.assert_called_once_with(
+            "loaddata", groups_fixture, verbosity=0, database="default"
+        )
+
+
+class TestSnapshotCallCommand:
+    """Test the call_command replacement used by FixtureSnapshotMixin."""
+
+    def test_loaddata_routed(self):
+        """Test Django's plain loaddata calls load from snapshots."""
+        original = Mock()
+
+        with patch("django_testcontainers_plus.fixtures.load_fixtures") as load:
+            _snapshot_call_command(original)("loaddata", "a.json", verbosity=0, database="other")
+
+        load.assert_called_once_with("a.json", database="other")
+        assert not original.called
+
+    def test_other_commands_untouched(self):
+        """Test other commands, and loaddata with extra options, run as before."""
+        original = Mock()
+        call_command = _snapshot_call_command(original)
+
+        call_command("flush", verbosity=0, database="default")
+        call_command("loaddata", "a.json", app_label="auth")
+
+        assert [c.args[0] for c in original.call_args_list] == ["flush", "loaddata"]
+
+    def test_fixture_setup_binding(self):
+        """Test the mixin's _fixture_setup is bound like the installed Django's."""
+        expected = inspect.getattr_static(TransactionTestCase, "_fixture_setup")
+        actual = inspect.getattr_static(FixtureSnapshotMixin, "_fixture_setup")
+
+        assert isinstance(actual, classmethod) == isinstance(expected, classmethod)
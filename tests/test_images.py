@@ -0,0 +1,183 @@
+"""Tests for image pre-pulling."""
+
+from unittest.mock import Mock, patch
+
+import docker
+import pytest
+from testcontainers.core.generic import DockerContainer
+
+from django_testcontainers_plus.exceptions import ImageUnavailableError
+from django_testcontainers_plus.images import (
+    check_offline_images,
+    find_image_tarball,
+    image_tarball_name,
+    needed_images,
+    prefetch_images,
+    save_images,
+)
+from django_testcontainers_plus.manager import ContainerManager
+from tests.test_manager import MockProvider, MockSettings
+
+
+def make_image(image_id):
+    """Build a mock docker SDK image."""
+    image = Mock()
+    image.id = image_id
+    image.attrs = {"RepoDigests": [f"repo@{image_id}"]}
+    return image
+
+
+def make_client(local):
+    """Build a mock docker client with some images present locally."""
+    client = Mock()
+
+    def get(name):
+        if name not in local:
+            raise docker.errors.ImageNotFound(name)
+        return make_image(local[name])
+
+    client.images.get.side_effect = get
+    client.images.pull.side_effect = lambda name: make_image(f"sha256:{name}")
+    return client
+
+
+def write_tarball(image_dir, image):
+    """Create an image tarball in an image directory."""
+    path = image_dir / image_tarball_name(image)
+    path.write_bytes(b"tarball")
+    return path
+
+
+class TestPrefetchImages:
+    """Test prefetch_images."""
+
+    def test_pulls_only_missing_images(self):
+        """Test local images are used without pulling."""
+        client = make_client({"redis:7-alpine": "sha256:redis"})
+
+        resolved = prefetch_images(client, ["postgres:16", "redis:7-alpine", "postgres:16"])
+
+        assert list(resolved) == ["postgres:16", "redis:7-alpine"]
+        assert resolved["postgres:16"].pulled is True
+        assert resolved["redis:7-alpine"].pulled is False
+        client.images.pull.assert_called_once_with("postgres:16")
+
+    def test_refresh_pulls_everything(self):
+        """Test refresh pulls images even when present."""
+        client = make_client({"redis:7-alpine": "sha256:redis"})
+
+        resolved = prefetch_images(client, ["redis:7-alpine"], refresh=True)
+
+        assert resolved["redis:7-alpine"].pulled is True
+
+    def test_no_images(self):
+        """Test nothing happens without images."""
+        client = Mock()
+
+        assert prefetch_images(client, []) == {}
+        assert not client.images.get.called
+
+
+class TestOfflineImages:
+    """Test offline mode with image tarballs."""
+
+    def test_tarball_name(self):
+        """Test tarball names are safe file names."""
+        assert image_tarball_name("postgres:16") == "postgres_16.tar"
+        assert image_tarball_name("ghcr.io/org/img:1") == "ghcr.io_org_img_1.tar"
+
+    def test_find_gzipped_tarball(self, tmp_path):
+        """Test gzipped tarballs are found too."""
+        (tmp_path / "redis_7.tar.gz").write_bytes(b"")
+
+        assert find_image_tarball(tmp_path, "redis:7") == tmp_path / "redis_7.tar.gz"
+        assert find_image_tarball(tmp_path, "postgres:16") is None
+
+    def test_preflight_fails_fast(self, tmp_path):
+        """Test missing images are reported together, without pulling."""
+        client = make_client({"redis:7": "sha256:redis"})
+        write_tarball(tmp_path, "mysql:8")
+
+        with pytest.raises(ImageUnavailableError) as exc_info:
+            check_offline_images(client, ["postgres:16", "redis:7", "mysql:8", "minio"], tmp_path)
+
+        assert exc_info.value.images == ["postgres:16", "minio"]
+        assert "django-testcontainers save" in str(exc_info.value)
+        assert not client.images.pull.called
+
+    def test_offline_loads_tarballs(self, tmp_path):
+        """Test missing images are streamed from their tarballs, never pulled."""
+        client = make_client({})
+        write_tarball(tmp_path, "postgres:16")
+
+        def load(f):
+            assert f.read() == b"tarball"
+            client.images.get.side_effect = lambda name: make_image("sha256:loaded")
+
+        client.images.load.side_effect = load
+
+        resolved = prefetch_images(client, ["postgres:16"], image_dir=tmp_path, offline=True)
+
+        assert resolved["postgres:16"].source == "tarball"
+        assert resolved["postgres:16"].id == "sha256:loaded"
+        assert not client.images.pull.called
+
+    def test_offline_missing_image(self, tmp_path):
+        """Test offline prefetching raises before fetching anything."""
+        client = make_client({})
+
+        with pytest.raises(ImageUnavailableError):
+            prefetch_images(client, ["postgres:16"], image_dir=tmp_path, offline=True)
+
+        assert not client.images.load.called
+
+    def test_save_images(self, tmp_path):
+        """Test images are saved under their tarball names."""
+        client = Mock()
+        client.images.get.return_value.save.return_value = [b"a", b"b"]
+
+        saved = save_images(client, ["postgres:16"], tmp_path)
+
+        assert saved == {"postgres:16": tmp_path / "postgres_16.tar"}
+        assert saved["postgres:16"].read_bytes() == b"ab"
+
+
+class TestNeededImages:
+    """Test resolving images from settings."""
+
+    def test_images_from_config(self):
+        """Test each needed provider's configured image is used."""
+
+        class ImageProvider(MockProvider):
+            def get_default_config(self):
+                return {"image": f"{self.name}:latest"}
+
+        settings = MockSettings(TESTCONTAINERS={"redis": {"image": "redis:6"}})
+        manager = ContainerManager(settings)
+        manager.providers = [ImageProvider("postgres"), ImageProvider("redis")]
+
+        assert needed_images(manager) == {"postgres": "postgres:latest", "redis": "redis:6"}
+
+
+class TestManagerPrefetch:
+    """Test ContainerManager pulls images before starting containers."""
+
+    def test_pull_recorded_in_timings(self):
+        """Test pulled images are recorded as a pull phase."""
+        container = Mock(spec=DockerContainer)
+        container.image = "postgres:16"
+        container.get_docker_client.return_value.client = make_client({})
+        manager = ContainerManager(MockSettings())
+
+        manager._prefetch_images({"postgres": container})
+
+        assert [(t.container, t.phase) for t in manager.timings.phases] == [("postgres", "pull")]
+
+    def test_mock_containers_skipped(self):
+        """Test containers that are not DockerContainers are left alone."""
+        manager = ContainerManager(MockSettings())
+
+        with patch("django_testcontainers_plus.manager.prefetch_images") as prefetch:
+            manager._prefetch_images({"postgres": Mock()})
+
+        assert not prefetch.called
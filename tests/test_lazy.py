@@ -0,0 +1,123 @@
+"""Tests for lazy container startup."""
+
+from unittest.mock import Mock, patch
+
+from django.core.cache import CacheHandler
+
+from django_testcontainers_plus.lazy import lazy_caches, refresh_connection_handler
+from django_testcontainers_plus.manager import ContainerManager
+from tests.test_manager import MockProvider, MockSettings
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class LazyProvider(MockProvider):
+    """Mock provider started on first use of a resource."""
+
+    def __init__(self, name: str, resource: str):
+        super().__init__(name)
+        self.resource = resource
+
+    def get_lazy_resource(self, settings):
+        return self.resource
+
+
+def make_manager(**options):
+    """Build a lazy manager with a database and a cache provider."""
+    manager = ContainerManager(MockSettings(TESTCONTAINERS_OPTIONS={"lazy": True, **options}))
+    manager.providers = [
+        LazyProvider("postgres", "databases"),
+        LazyProvider("redis", "caches"),
+        MockProvider("minio"),
+    ]
+    return manager
+
+
+class TestLazyStartup:
+    """Test ContainerManager in lazy mode."""
+
+    def test_only_eager_providers_start(self):
+        """Test providers with a lazy resource are deferred."""
+        manager = make_manager()
+
+        updates = manager.start_containers()
+
+        assert list(manager.active_containers) == ["minio"]
+        assert updates == {"TEST_CONFIG": {"minio": "updated"}}
+        assert set(manager.pending_providers) == {"databases", "caches"}
+
+    def test_start_lazy(self):
+        """Test deferred providers start once, on their resource's first use."""
+        manager = make_manager()
+        manager.start_containers()
+
+        updates = manager.start_lazy("databases")
+
+        assert updates == {"TEST_CONFIG": {"postgres": "updated"}}
+        assert "postgres" in manager.active_containers
+        assert manager.start_lazy("databases") == {}
+        assert manager.settings_updates["TEST_CONFIG"] == {
+            "minio": "updated",
+            "postgres": "updated",
+        }
+
+    def test_lazy_override(self):
+        """Test lazy=False starts everything regardless of the option."""
+        manager = make_manager()
+
+        manager.start_containers(lazy=False)
+
+        assert list(manager.active_containers) == ["postgres", "redis", "minio"]
+        assert manager.pending_providers == {}
+
+    def test_stop_clears_pending(self):
+        """Test pending providers are forgotten when the session ends."""
+        manager = make_manager()
+        manager.start_containers()
+
+        manager.stop_containers()
+
+        assert manager.pending_providers == {}
+
+
+class TestLazyCaches:
+    """Test cache containers start on the first cache connection."""
+
+    def test_first_cache_connection_starts_container(self):
+        """Test the first cache access starts Redis and applies its settings."""
+        manager = make_manager()
+        manager.start_containers()
+        apply_updates = Mock()
+        caches = CacheHandler(LOCMEM)
+
+        with patch("django.core.cache.caches", caches), lazy_caches(manager, apply_updates):
+            assert not apply_updates.called
+            caches["default"]
+            caches["default"]
+
+        apply_updates.assert_called_once_with({"TEST_CONFIG": {"redis": "updated"}})
+        assert "redis" in manager.active_containers
+        assert "create_connection" not in vars(caches)
+
+    def test_nothing_pending(self):
+        """Test caches are left alone when no container waits for them."""
+        manager = ContainerManager(MockSettings())
+        caches = CacheHandler(LOCMEM)
+
+        with patch("django.core.cache.caches", caches), lazy_caches(manager, Mock()):
+            assert "create_connection" not in vars(caches)
+
+
+class TestRefreshConnectionHandler:
+    """Test connection handlers re-read their settings."""
+
+    def test_refresh(self):
+        """Test cached settings and open connections are dropped."""
+        caches = CacheHandler(LOCMEM)
+        caches["default"]
+        assert "settings" in vars(caches)
+
+        refresh_connection_handler(caches, ["default"])
+
+        assert "settings" not in vars(caches)
+        assert not hasattr(caches._connections, "default")
@@ -1,8 +1,12 @@
 """Tests for ContainerManager."""
 
+import threading
+import time
 from unittest.mock import Mock
 
-from django_testcontainers_plus.manager import ContainerManager
+import pytest
+
+from django_testcontainers_plus.manager import ContainerManager, consistent_hash
 from django_testcontainers_plus.providers.base import ContainerProvider
 
 
@@ -252,3 +256,278 @@ class TestContainerManager:
         assert "redis" in manager.active_containers
         assert updates["TEST_CONFIG"]["postgres"] == "updated"
         assert updates["TEST_CONFIG"]["redis"] == "updated"
+
+    def test_get_options_defaults(self):
+        """Test options default to parallel startup."""
+        manager = ContainerManager(MockSettings())
+
+        assert manager.get_options()["parallel"] is True
+
+    def test_get_options_override(self):
+        """Test TESTCONTAINERS_OPTIONS overrides defaults."""
+        manager = ContainerManager(MockSettings(TESTCONTAINERS_OPTIONS={"parallel": False}))
+
+        assert manager.get_options()["parallel"] is False
+
+    def test_start_containers_parallel(self):
+        """Test containers are started concurrently."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        class BarrierProvider(MockProvider):
+            def get_container(self, config):
+                container = Mock()
+                container.start = Mock(side_effect=barrier.wait)
+                return container
+
+        manager = ContainerManager(MockSettings())
+        manager.providers = [BarrierProvider("postgres"), BarrierProvider("redis")]
+
+        manager.start_containers()
+
+        assert list(manager.active_containers) == ["postgres", "redis"]
+
+    def test_start_containers_parallel_deterministic_merge(self):
+        """Test updates merge in provider order regardless of finish order."""
+
+        class SlowProvider(MockProvider):
+            def __init__(self, name, delay):
+                super().__init__(name)
+                self.delay = delay
+
+            def get_container(self, config):
+                container = Mock()
+                container.start = Mock(side_effect=lambda: time.sleep(self.delay))
+                return container
+
+            def update_settings(self, container, settings, config):
+                return {"WINNER": self.name}
+
+        manager = ContainerManager(MockSettings())
+        manager.providers = [SlowProvider("postgres", 0.05), SlowProvider("redis", 0)]
+
+        updates = manager.start_containers()
+
+        assert updates["WINNER"] == "redis"
+
+    def test_start_containers_parallel_failure_stops_started(self):
+        """Test a failed start stops the containers that did start."""
+
+        class FailingProvider(MockProvider):
+            def get_container(self, config):
+                container = Mock()
+                container.start = Mock(side_effect=RuntimeError("boom"))
+                return container
+
+        ok_provider = MockProvider("postgres")
+        manager = ContainerManager(MockSettings())
+        manager.providers = [ok_provider, FailingProvider("redis")]
+
+        with pytest.raises(RuntimeError, match="boom"):
+            manager.start_containers()
+
+        assert manager.active_containers == {}
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_failed_start_removes_created_container(self, parallel):
+        """Test a container created by Docker but never ready is removed, even in reuse mode."""
+        failed = Mock()
+        failed.start = Mock(side_effect=TimeoutError("not ready"))
+        unstarted = Mock(_container=None)
+        unstarted.start = Mock(side_effect=RuntimeError("never created"))
+        manager = ContainerManager(MockSettings())
+        manager.reused_containers = {"postgres"}
+        start = manager._start_parallel if parallel else manager._start_serial
+
+        with pytest.raises(TimeoutError):
+            start({"postgres": failed, "redis": unstarted})
+
+        assert failed.stop.called
+        assert not unstarted.stop.called
+
+    def test_start_containers_serial(self):
+        """Test containers start in order when parallel is disabled."""
+        started = []
+
+        class RecordingProvider(MockProvider):
+            def get_container(self, config):
+                container = Mock()
+                container.start = Mock(side_effect=lambda: started.append(self.name))
+                return container
+
+        manager = ContainerManager(MockSettings(TESTCONTAINERS_OPTIONS={"parallel": False}))
+        manager.providers = [RecordingProvider("postgres"), RecordingProvider("redis")]
+
+        manager.start_containers()
+
+        assert started == ["postgres", "redis"]
+
+    def test_export_state(self):
+        """Test exported state carries provider configs and updates."""
+        manager = ContainerManager(MockSettings())
+        manager.providers = [MockProvider("postgres")]
+        manager.start_containers()
+
+        state = manager.export_state()
+
+        assert state["configs"]["postgres"] == {"default": True}
+        assert state["updates"]["postgres"] == {"TEST_CONFIG": {"postgres": "updated"}}
+
+    def test_attach_shared_containers(self):
+        """Test a worker applies shared updates without starting containers."""
+
+        class WorkerProvider(MockProvider):
+            def get_worker_updates(self, updates, config, worker_index):
+                return {"WORKER": worker_index}
+
+        manager = ContainerManager(MockSettings())
+        manager.providers = [WorkerProvider("redis")]
+        state = {"configs": {"redis": {}}, "updates": {"redis": {"WORKER": None}}}
+
+        updates = manager.attach_shared_containers(state, 3)
+
+        assert updates == {"WORKER": 3}
+        assert manager.active_containers == {}
+        assert manager.provider_updates["redis"] == {"WORKER": 3}
+
+    def test_start_containers_pool(self):
+        """Test pool_size starts several containers for one provider."""
+
+        class PoolProvider(MockProvider):
+            def update_settings(self, container, settings, config):
+                return {"HOST": id(container)}
+
+        settings = MockSettings(TESTCONTAINERS={"postgres": {"pool_size": 3}})
+        manager = ContainerManager(settings)
+        manager.providers = [PoolProvider("postgres")]
+
+        updates = manager.start_containers()
+
+        assert list(manager.active_containers) == ["postgres", "postgres-1", "postgres-2"]
+        assert updates == {"HOST": id(manager.active_containers["postgres"])}
+        assert len({u["HOST"] for u in manager.pool_updates["postgres"]}) == 3
+        assert manager.export_state()["pools"] == manager.pool_updates
+
+    def test_start_containers_parts(self):
+        """Test extra parts get their own container and their updates are merged."""
+
+        class PartsProvider(MockProvider):
+            def get_container_configs(self, settings, config):
+                return {"": config, "analytics": {**config, "container": "analytics"}}
+
+            def update_settings(self, container, settings, config):
+                alias = config.get("container", "default")
+                return {"DATABASES": {alias: {"HOST": id(container)}}}
+
+        settings = MockSettings(TESTCONTAINERS={"postgres": {"pool_size": 2}})
+        manager = ContainerManager(settings)
+        manager.providers = [PartsProvider("postgres")]
+
+        updates = manager.start_containers()
+
+        assert list(manager.active_containers) == ["postgres", "postgres-1", "postgres-analytics"]
+        analytics = {"HOST": id(manager.active_containers["postgres-analytics"])}
+        assert updates["DATABASES"]["analytics"] == analytics
+        assert [u["DATABASES"]["analytics"] for u in manager.pool_updates["postgres"]] == [
+            analytics,
+            analytics,
+        ]
+        assert manager.pool_updates["postgres"][1]["DATABASES"]["default"] == {
+            "HOST": id(manager.active_containers["postgres-1"])
+        }
+        assert manager.get_database_container("default") is manager.active_containers["postgres"]
+        assert (
+            manager.get_database_container("analytics")
+            is manager.active_containers["postgres-analytics"]
+        )
+        assert manager.get_database_container("other") is None
+
+    def test_attach_shared_containers_pool(self):
+        """Test workers are spread over pool members by consistent hashing."""
+        manager = ContainerManager(MockSettings())
+        manager.providers = [MockProvider("postgres")]
+        pool = [{"HOST": i} for i in range(4)]
+        state = {
+            "configs": {"postgres": {}},
+            "updates": {"postgres": pool[0]},
+            "pools": {"postgres": pool},
+        }
+
+        hosts = {manager.attach_shared_containers(state, i)["HOST"] for i in range(64)}
+
+        assert hosts == {0, 1, 2, 3}
+        assert manager.attach_shared_containers(state, 5)["HOST"] == consistent_hash("5", 4)
+
+    def test_memory_report(self):
+        """Test memory use is reported per container, skipping failures."""
+        manager = ContainerManager(MockSettings())
+        postgres, redis = Mock(), Mock()
+        postgres.get_wrapped_container.return_value.stats.return_value = {
+            "memory_stats": {"usage": 3 * 2**20}
+        }
+        redis.get_wrapped_container.side_effect = RuntimeError("gone")
+        manager.active_containers = {"postgres": postgres, "redis": redis}
+
+        assert manager.memory_report() == ["postgres: 3.0 MiB"]
+
+    def test_tmpfs_without_data_dir(self):
+        """Test tmpfs is rejected for providers without a data directory."""
+        provider = MockProvider("redis")
+
+        with pytest.raises(ValueError, match="no data directory"):
+            provider.apply_tmpfs(Mock(), {"tmpfs": True})
+
+        container = Mock()
+        assert provider.apply_tmpfs(container, {"profile": "fast"}) is container
+
+    def test_reset_between_tests(self):
+        """Test providers are asked to reset with their own updates and config."""
+        provider = MockProvider("redis")
+        provider.reset_between_tests = Mock()
+        manager = ContainerManager(MockSettings())
+        manager.providers = [provider]
+        manager.start_containers()
+
+        manager.reset_between_tests()
+
+        provider.reset_between_tests.assert_called_once_with(
+            {"TEST_CONFIG": {"redis": "updated"}}, {"default": True}
+        )
+
+
+class TestConsistentHash:
+    """Test worker to pool member assignment."""
+
+    def test_in_range_and_stable(self):
+        """Test buckets are in range and repeatable."""
+        assert all(0 <= consistent_hash(str(i), 3) < 3 for i in range(100))
+        assert consistent_hash("gw7", 3) == consistent_hash("gw7", 3)
+
+    def test_growing_pool_moves_few_keys(self):
+        """Test adding a member only moves keys onto the new member."""
+        keys = [str(i) for i in range(200)]
+        before = {k: consistent_hash(k, 4) for k in keys}
+        after = {k: consistent_hash(k, 5) for k in keys}
+
+        moved = [k for k in keys if before[k] != after[k]]
+
+        assert all(after[k] == 4 for k in moved)
+        assert len(moved) < len(keys) / 2
+
+
+class TestMergeIsolation:
+    """Test merged updates do not leak between providers."""
+
+    def test_provider_updates_unchanged_by_merge(self):
+        """Test each provider keeps only its own database aliases."""
+
+        class DatabaseProvider(MockProvider):
+            def update_settings(self, container, settings, config):
+                return {"DATABASES": {self.name: {"HOST": self.name}}}
+
+        manager = ContainerManager(MockSettings())
+        manager.providers = [DatabaseProvider("postgres"), DatabaseProvider("mysql")]
+
+        updates = manager.start_containers()
+
+        assert set(updates["DATABASES"]) == {"postgres", "mysql"}
+        assert set(manager.provider_updates["postgres"]["DATABASES"]) == {"postgres"}
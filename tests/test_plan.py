@@ -0,0 +1,197 @@
+"""Tests for the cached startup plan."""
+
+from unittest.mock import Mock, patch
+
+from django_testcontainers_plus.cli import main
+from django_testcontainers_plus.detection import POSTGRES_RULES
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.plan import StartupPlan, load_plan, plan_key, save_plan
+from tests.test_manager import MockProvider, MockSettings
+
+DATABASES = {"default": {"ENGINE": "django.db.backends.postgresql"}}
+
+
+class PlannedProvider(MockProvider):
+    """Provider detected by rules, whose containers have stable ids."""
+
+    DETECTION_RULES = POSTGRES_RULES
+
+    def __init__(self):
+        super().__init__("postgres")
+        self.update_calls = 0
+
+    def get_container(self, config):
+        container = super().get_container(config)
+        container.get_container_id.return_value = "container-id"
+        return container
+
+    def update_settings(self, container, settings, config):
+        self.update_calls += 1
+        return {"DATABASES": {"default": {"PORT": "5432"}}}
+
+
+def make_manager(**options):
+    """Build a manager for postgres settings with the plan cache enabled."""
+    settings = MockSettings(
+        DATABASES=DATABASES, TESTCONTAINERS_OPTIONS={"plan_cache": True, **options}
+    )
+    manager = ContainerManager(settings)
+    manager.providers = [PlannedProvider()]
+    return manager
+
+
+class TestPlanKey:
+    """Test plan_key."""
+
+    def test_stable(self):
+        """Test the same settings give the same key."""
+        assert plan_key(make_manager()) == plan_key(make_manager())
+
+    def test_differs_by_settings(self):
+        """Test changing a detected setting or option changes the key."""
+        manager = make_manager()
+        key = plan_key(manager)
+
+        manager.settings.DATABASES = {"default": {"ENGINE": "django.db.backends.sqlite3"}}
+        assert plan_key(manager) != key
+
+        assert plan_key(make_manager(lazy=True)) != key
+
+    def test_none_without_rules(self):
+        """Test providers detecting themselves without rules make plans uncacheable."""
+        manager = make_manager()
+        manager.providers = [MockProvider()]
+
+        assert plan_key(manager) is None
+
+
+class TestPlanCache:
+    """Test saving and loading plans."""
+
+    def test_round_trip(self):
+        """Test a saved plan loads back equal and marked as cached."""
+        plan = make_manager().build_plan()
+
+        save_plan(plan)
+        cached = load_plan(plan.key)
+
+        assert cached.cached
+        assert cached.as_dict() == plan.as_dict()
+        assert cached.providers[0].config == {"default": True}
+
+    def test_uncacheable_config(self):
+        """Test plans whose config is not plain data are not saved."""
+        plan = make_manager().build_plan()
+        plan.providers[0].config["hook"] = print
+
+        save_plan(plan)
+
+        assert load_plan(plan.key) is None
+
+    def test_oldest_dropped(self):
+        """Test the cache keeps only the most recent plans."""
+        with patch("django_testcontainers_plus.plan.MAX_CACHED_PLANS", 2):
+            for key in ("a", "b", "c"):
+                save_plan(StartupPlan(key, []))
+
+        assert load_plan("a") is None
+        assert load_plan("c") is not None
+
+
+class TestManagerPlan:
+    """Test ContainerManager using the startup plan."""
+
+    def test_cached_plan_skips_detection(self):
+        """Test a repeat run starts from the cached plan without detecting."""
+        make_manager().start_containers()
+        manager = make_manager()
+
+        with patch.object(manager, "detect_needed_containers") as detect:
+            manager.start_containers()
+
+        detect.assert_not_called()
+        assert manager.plan.cached
+        assert list(manager.active_containers) == ["postgres"]
+
+    def test_lazy_resource_from_plan(self):
+        """Test lazy mode defers the providers the plan names a resource for."""
+        make_manager().start_containers()
+        manager = make_manager()
+        manager.plan = load_plan(plan_key(manager))
+        manager.plan.providers[0].lazy_resource = "databases"
+
+        with patch.object(manager, "get_plan", return_value=manager.plan):
+            assert manager.start_containers(lazy=True) == {}
+
+        assert list(manager.pending_providers) == ["databases"]
+
+    def test_reused_container_updates_recorded(self):
+        """Test reattaching to the same container reuses its recorded updates."""
+        with (
+            patch("django_testcontainers_plus.manager.prune_reusable_containers"),
+            patch("django_testcontainers_plus.manager.mark_used"),
+            patch("django_testcontainers_plus.manager.testcontainers_config"),
+            patch(
+                "django_testcontainers_plus.manager.find_reusable_container",
+                return_value=Mock(id="container-id"),
+            ),
+        ):
+            first = make_manager(reuse=True)
+            first.start_containers()
+            second = make_manager(reuse=True)
+            updates = second.start_containers()
+
+        assert first.providers[0].update_calls == 1
+        assert second.providers[0].update_calls == 0
+        assert updates == {"DATABASES": {"default": {"PORT": "5432"}}}
+        assert second.database_containers == {"default": "postgres"}
+
+    def test_runtime_config_changes_not_cached(self):
+        """Test templates enabled for a baked image are not saved into the plan."""
+
+        class BakedProvider(PlannedProvider):
+            SUPPORTS_BAKE = True
+
+        manager = make_manager()
+        manager.settings.TESTCONTAINERS = {"postgres": {"bake": True}}
+        manager.providers = [BakedProvider()]
+
+        with (
+            patch("django_testcontainers_plus.manager.DockerClient"),
+            patch("django_testcontainers_plus.manager.baked_image_exists", return_value=True),
+        ):
+            manager.start_containers()
+
+        assert manager.provider_configs["postgres"]["template"] is True
+        assert "template" not in manager.plan.providers[0].config
+        assert "template" not in load_plan(manager.plan.key).providers[0].config
+
+    def test_disabled_by_default(self):
+        """Test nothing is cached without the plan_cache option."""
+        manager = ContainerManager(MockSettings(DATABASES=DATABASES))
+        manager.providers = [PlannedProvider()]
+
+        manager.start_containers()
+
+        assert load_plan(plan_key(manager)) is None
+
+
+class TestPlanCommand:
+    """Test the plan command."""
+
+    def test_prints_plan(self, capsys):
+        """Test the plan is printed as a table."""
+        plan = make_manager().build_plan()
+
+        with (
+            patch("django_testcontainers_plus.cli._setup_django"),
+            patch(
+                "django_testcontainers_plus.manager.ContainerManager.get_plan", return_value=plan
+            ),
+        ):
+            assert main(["plan"]) == 0
+
+        out = capsys.readouterr().out
+        assert "built from settings" in out
+        assert "postgres" in out
+        assert "eager" in out
@@ -1,6 +1,8 @@
 """Tests for PostgresProvider."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
+
+import pytest
 
 from django_testcontainers_plus.providers.postgres import PostgresProvider
 
@@ -257,3 +259,354 @@ class TestPostgresProvider:
             "password": "test",
             "dbname": "test",
         }
+
+    def _mock_connection(self, template_exists):
+        """Build a mock Django connection whose cursor reports template existence."""
+        cursor = MagicMock()
+        cursor.fetchone.return_value = (1,) if template_exists else None
+        connection = MagicMock()
+        connection._nodb_cursor.return_value.__enter__.return_value = cursor
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        connection.creation._get_test_db_name.return_value = "test_app"
+        connection.settings_dict = {"NAME": "test_app"}
+        return connection, cursor
+
+    def test_restore_template_database_missing(self):
+        """Test restoring reports False when no template exists."""
+        connection, cursor = self._mock_connection(template_exists=False)
+
+        assert PostgresProvider().restore_template_database(connection, {}, "abc") is False
+        assert cursor.execute.call_count == 1
+
+    def test_restore_template_database(self):
+        """Test the test database is created from the template."""
+        connection, cursor = self._mock_connection(template_exists=True)
+
+        assert PostgresProvider().restore_template_database(connection, {}, "abc") is True
+        assert cursor.execute.call_args.args[0] == (
+            'CREATE DATABASE "test_app" TEMPLATE "dtcp_template_abc"'
+        )
+
+    def test_save_template_database(self):
+        """Test the migrated test database is copied into the template."""
+        connection, cursor = self._mock_connection(template_exists=False)
+
+        PostgresProvider().save_template_database(connection, {}, "abc")
+
+        assert connection.close.called
+        assert cursor.execute.call_args.args[0] == (
+            'CREATE DATABASE "dtcp_template_abc" TEMPLATE "test_app"'
+        )
+
+
+class TestPostgresProfiles:
+    """Test server profiles for PostgresProvider."""
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_fast_profile(self, mock_postgres_container):
+        """Test the fast profile disables durability and uses tmpfs."""
+        container = Mock()
+        container.with_command = Mock(return_value=container)
+        container.with_tmpfs_mount = Mock(return_value=container)
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"profile": "fast"})
+
+        command = container.with_command.call_args.args[0]
+        assert command[0] == "postgres"
+        assert "fsync=off" in command
+        assert "synchronous_commit=off" in command
+        assert "full_page_writes=off" in command
+        container.with_tmpfs_mount.assert_called_once_with(PostgresProvider.DATA_DIR, "rw")
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_no_profile(self, mock_postgres_container):
+        """Test the stock server configuration is used by default."""
+        container = Mock()
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({})
+
+        assert not container.with_command.called
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_unknown_profile(self, mock_postgres_container):
+        """Test unknown profiles are rejected."""
+        with pytest.raises(ValueError, match="Unknown profile 'turbo'"):
+            PostgresProvider().get_container({"profile": "turbo"})
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_tmpfs_size(self, mock_postgres_container):
+        """Test tmpfs can be size-limited without a profile."""
+        container = Mock()
+        container.with_tmpfs_mount = Mock(return_value=container)
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"tmpfs": "512m"})
+
+        container.with_tmpfs_mount.assert_called_once_with(
+            PostgresProvider.DATA_DIR, "rw,size=512m"
+        )
+        assert not container.with_command.called
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_fast_profile_without_tmpfs(self, mock_postgres_container):
+        """Test the fast profile can keep its data on disk."""
+        container = Mock()
+        container.with_command = Mock(return_value=container)
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"profile": "fast", "tmpfs": False})
+
+        assert container.with_command.called
+        assert not container.with_tmpfs_mount.called
+
+
+class TestPostgresReplicas:
+    """Test streaming read replicas for PostgresProvider."""
+
+    DATABASES = {
+        "default": {"ENGINE": "django.db.backends.postgresql"},
+        "replica": {"ENGINE": "django.db.backends.postgresql", "TEST": {"MIRROR": "default"}},
+        "reporting": {"ENGINE": "django.db.backends.postgresql"},
+    }
+
+    def started_container(self):
+        """Mock a started container publishing each port on port + 10000."""
+        container = Mock()
+        container.get_container_host_ip.return_value = "localhost"
+        container.get_exposed_port.side_effect = lambda port: port + 10000
+        return container
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_get_container(self, mock_postgres_container):
+        """Test replicas run next to the primary with the same profile."""
+        container = Mock()
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"replicas": 2, "profile": "fast", "tmpfs": False})
+
+        container.with_env.assert_any_call("POSTGRES_REPLICAS", "2")
+        container.with_env.assert_any_call("POSTGRES_REPLICA_DIR", PostgresProvider.REPLICA_DIR)
+        container.with_exposed_ports.assert_called_once_with(5433, 5434)
+        command = container.with_command.call_args.args[0]
+        assert command[:2] == ["sh", "-c"]
+        assert 'postgres -D "$dir" -p "$port" "$@"' in command[2]
+        assert command[3:5] == ["sh", "postgres"]
+        assert "fsync=off" in command
+        container.with_tmpfs_mount.assert_not_called()
+        strategy = container.waiting_for.call_args.args[0]
+        assert strategy.port == 5434
+
+    @patch("django_testcontainers_plus.providers.postgres.PostgresContainer")
+    def test_tmpfs(self, mock_postgres_container):
+        """Test the replicas' data directories are mounted as tmpfs too."""
+        container = Mock()
+        container.with_tmpfs_mount.return_value = container
+        mock_postgres_container.return_value = container
+
+        PostgresProvider().get_container({"replicas": 1, "profile": "fast"})
+
+        assert container.with_tmpfs_mount.call_args_list == [
+            call(PostgresProvider.DATA_DIR, "rw"),
+            call(PostgresProvider.REPLICA_DIR, "rw"),
+        ]
+
+    def test_mirrors_spread_over_replicas(self):
+        """Test mirror aliases are assigned to replicas in order."""
+        databases = {
+            **self.DATABASES,
+            "replica2": {"ENGINE": "django.db.backends.postgresql", "TEST": {"MIRROR": "default"}},
+        }
+
+        aliases = PostgresProvider().get_replica_aliases(databases, {"replicas": 2})
+
+        assert aliases == {"replica": 1, "replica2": 2}
+
+    def test_no_replicas(self):
+        """Test mirrors stay on the primary without replicas."""
+        assert PostgresProvider().get_replica_aliases(self.DATABASES, {}) == {}
+
+    def test_unknown_replica(self):
+        """Test aliases cannot be mapped to replicas that are not started."""
+        with pytest.raises(ValueError, match="only 1 replicas are configured"):
+            PostgresProvider().get_replica_aliases(
+                self.DATABASES, {"replicas": 1, "replica_aliases": {"reporting": 2}}
+            )
+
+    def test_update_settings(self):
+        """Test replica aliases point at their replica and mirror the primary."""
+        settings = MockSettings(DATABASES=self.DATABASES)
+        config = {"replicas": 2, "replica_aliases": {"reporting": 2}}
+
+        updates = PostgresProvider().update_settings(self.started_container(), settings, config)
+
+        databases = updates["DATABASES"]
+        assert databases["default"]["PORT"] == 15432
+        assert "TEST" not in databases["default"]
+        assert databases["replica"]["PORT"] == 15433
+        assert databases["replica"]["TEST"] == {"MIRROR": "default"}
+        assert databases["reporting"]["PORT"] == 15434
+        assert databases["reporting"]["TEST"] == {"MIRROR": "default"}
+        assert databases["reporting"]["NAME"] == "test"
+
+    def test_update_settings_without_primary(self):
+        """Test some alias must stay on the primary for the replicas to mirror."""
+        settings = MockSettings(DATABASES=self.DATABASES)
+        config = {"replicas": 2, "replica_aliases": {"default": 1, "reporting": 2}}
+
+        with pytest.raises(ValueError, match="Every database alias on this container"):
+            PostgresProvider().update_settings(self.started_container(), settings, config)
+
+
+class TestPostgresPlacement:
+    """Test per-alias placement for PostgresProvider."""
+
+    DATABASES = {
+        "default": {"ENGINE": "django.db.backends.postgresql"},
+        "analytics": {"ENGINE": "django.db.backends.postgresql"},
+        "events": {"ENGINE": "django.db.backends.postgresql"},
+    }
+
+    CONFIG = {
+        "replicas": 1,
+        "databases": {
+            "analytics": {"container": "analytics"},
+            "events": {"dbname": "events"},
+        },
+    }
+
+    def started_container(self, port):
+        """Mock a started container published on the given port."""
+        container = Mock()
+        container.get_container_host_ip.return_value = "localhost"
+        container.get_exposed_port.return_value = port
+        return container
+
+    def test_get_container_configs(self):
+        """Test each named container gets a part without replicas."""
+        configs = PostgresProvider().get_container_configs(MockSettings(), self.CONFIG)
+
+        assert configs[""] is self.CONFIG
+        assert configs["analytics"] == {
+            "databases": self.CONFIG["databases"],
+            "container": "analytics",
+        }
+
+    def test_update_settings_shared_container(self):
+        """Test the main container serves the other aliases, each with its dbname."""
+        settings = MockSettings(DATABASES=self.DATABASES)
+
+        updates = PostgresProvider().update_settings(
+            self.started_container(5432), settings, self.CONFIG
+        )
+
+        assert list(updates["DATABASES"]) == ["default", "events"]
+        assert updates["DATABASES"]["default"]["NAME"] == "test"
+        assert updates["DATABASES"]["events"]["NAME"] == "events"
+
+    def test_update_settings_own_container(self):
+        """Test a named container only serves the aliases placed on it."""
+        settings = MockSettings(DATABASES=self.DATABASES)
+        config = PostgresProvider().get_container_configs(settings, self.CONFIG)["analytics"]
+
+        updates = PostgresProvider().update_settings(self.started_container(6543), settings, config)
+
+        assert updates == {
+            "DATABASES": {
+                "analytics": {
+                    "ENGINE": "django.db.backends.postgresql",
+                    "HOST": "localhost",
+                    "PORT": 6543,
+                    "USER": "test",
+                    "PASSWORD": "test",
+                    "NAME": "test",
+                }
+            }
+        }
+
+
+class TestPostgresClones:
+    """Test cloning test databases for the parallel runner."""
+
+    def make_connection(self, existing=()):
+        connection = MagicMock()
+        connection.settings_dict = {"NAME": "test_app"}
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        connection.creation.get_test_db_clone_settings = lambda suffix: {
+            "NAME": f"test_app_{suffix}"
+        }
+        statements = []
+
+        def nodb_cursor():
+            cursor = MagicMock()
+            cursor.execute = lambda sql, params=None: statements.append((sql, params))
+            cursor.fetchone = lambda: (1,) if statements[-1][1][0] in existing else None
+            context = MagicMock()
+            context.__enter__.return_value = cursor
+            return context
+
+        connection._nodb_cursor = nodb_cursor
+        return connection, statements
+
+    def test_clones_from_template(self):
+        """Test each clone is created from the test database after closing connections."""
+        connection, statements = self.make_connection()
+
+        assert PostgresProvider().clone_test_databases(None, connection, {}, ["1", "2"], 0, False)
+
+        connection.close.assert_called_once()
+        assert sorted(sql for sql, _ in statements) == [
+            'CREATE DATABASE "test_app_1" TEMPLATE "test_app"',
+            'CREATE DATABASE "test_app_2" TEMPLATE "test_app"',
+            'DROP DATABASE IF EXISTS "test_app_1"',
+            'DROP DATABASE IF EXISTS "test_app_2"',
+        ]
+
+    def test_keepdb_keeps_existing_clones(self):
+        """Test existing clones are kept with keepdb."""
+        connection, statements = self.make_connection(existing={"test_app_1"})
+
+        PostgresProvider().clone_test_databases(None, connection, {}, ["1", "2"], 0, True)
+
+        assert [sql for sql, _ in statements if sql.startswith("CREATE")] == [
+            'CREATE DATABASE "test_app_2" TEMPLATE "test_app"'
+        ]
+
+
+class TestPostgresFixtureData:
+    """Test binary COPY snapshots of fixture tables."""
+
+    def make_connection(self, raw):
+        connection = MagicMock()
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        connection.cursor.return_value.__enter__.return_value.cursor = raw
+        return connection
+
+    def test_copy_round_trip(self):
+        """Test tables are dumped and restored with binary COPY."""
+        raw = MagicMock()
+        copy = raw.copy.return_value.__enter__.return_value
+        copy.__iter__.return_value = [b"PGCOPY", memoryview(b"rows")]
+        connection = self.make_connection(raw)
+        provider = PostgresProvider()
+
+        data = provider.dump_table_data(connection, ["auth_group"])
+        provider.load_table_data(connection, data)
+
+        assert data == {"auth_group": b"PGCOPYrows"}
+        assert [c.args[0] for c in raw.copy.call_args_list] == [
+            'COPY "auth_group" TO STDOUT (FORMAT binary)',
+            'COPY "auth_group" FROM STDIN (FORMAT binary)',
+        ]
+        copy.write.assert_called_once_with(b"PGCOPYrows")
+
+    def test_copy_expert_fallback(self):
+        """Test psycopg2 cursors use copy_expert."""
+        raw = Mock(spec=["copy_expert"])
+        raw.copy_expert.side_effect = lambda sql, buffer: buffer.write(b"rows")
+        connection = self.make_connection(raw)
+
+        data = PostgresProvider().dump_table_data(connection, ["auth_group"])
+
+        assert data == {"auth_group": b"rows"}
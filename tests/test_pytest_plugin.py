@@ -125,3 +125,35 @@ class TestPytestPlugin:
         assert django_settings.SETTING_TWO == "value_two"
         assert django_settings.SETTING_THREE == {"nested": "value"}
         assert len(pytest_plugin._original_settings) == 3
+
+    def test_configure_node_shares_state(self):
+        """Test xdist workers receive the controller's container state."""
+        shared_manager = Mock()
+        shared_manager.export_state.return_value = {"configs": {}, "updates": {}}
+        node = Mock(workerinput={})
+
+        original = pytest_plugin._shared_manager
+        pytest_plugin._shared_manager = shared_manager
+        try:
+            pytest_plugin.pytest_configure_node(node)
+        finally:
+            pytest_plugin._shared_manager = original
+
+        assert node.workerinput[pytest_plugin.WORKERINPUT_KEY] == {"configs": {}, "updates": {}}
+
+    def test_configure_node_without_shared_manager(self):
+        """Test nothing is shared when the controller started no containers."""
+        node = Mock(workerinput={})
+
+        pytest_plugin.pytest_configure_node(node)
+
+        assert node.workerinput == {}
+
+    def test_sessionstart_skipped_outside_xdist_controller(self):
+        """Test containers are not started by the sessionstart hook without xdist."""
+        session = Mock()
+        session.config.pluginmanager.hasplugin.return_value = False
+
+        pytest_plugin.pytest_sessionstart(session)
+
+        assert pytest_plugin._shared_manager is None
@@ -0,0 +1,203 @@
+"""Tests for readiness probes."""
+
+import socket
+import struct
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.readiness import (
+    POSTGRES_PROTOCOL,
+    ProbeWaitStrategy,
+    mysql_probe,
+    postgres_probe,
+    redis_cluster_probe,
+    redis_probe,
+    redis_sentinel_probe,
+    tcp_probe,
+    wait_until_ready,
+)
+from tests.test_manager import MockProvider, MockSettings
+
+
+@pytest.fixture
+def server():
+    """Start a one-connection TCP server that answers with a canned reply."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    received = []
+
+    def serve(reply, read=0):
+        def run():
+            conn, _ = listener.accept()
+            with conn:
+                if read:
+                    received.append(conn.recv(read))
+                conn.sendall(reply)
+
+        threading.Thread(target=run, daemon=True).start()
+        return listener.getsockname()[1]
+
+    serve.received = received
+    yield serve
+    listener.close()
+
+
+class TestWaitUntilReady:
+    """Test the backoff loop."""
+
+    def test_retries_until_ready(self):
+        """Test failures and connection errors are retried."""
+        results = iter([False, OSError("refused"), True])
+
+        def check():
+            result = next(results)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        waited = wait_until_ready(check, deadline=5, initial_delay=0.001)
+
+        assert waited >= 0
+
+    def test_deadline(self):
+        """Test a check that never passes times out."""
+        with pytest.raises(TimeoutError):
+            wait_until_ready(lambda: False, deadline=0.05, initial_delay=0.001)
+
+
+class TestProbes:
+    """Test the protocol probes against fake servers."""
+
+    def test_tcp_probe_refused(self):
+        """Test a closed port raises a connection error."""
+        with socket.create_server(("127.0.0.1", 0)) as listener:
+            port = listener.getsockname()[1]
+
+        with pytest.raises(ConnectionRefusedError):
+            tcp_probe("127.0.0.1", port)
+
+    def test_postgres_ready(self, server):
+        """Test an authentication request means ready."""
+        port = server(b"R\x00\x00\x00\x08\x00\x00\x00\x05", read=64)
+
+        assert postgres_probe("127.0.0.1", port, "test", "db") is True
+
+        length, protocol = struct.unpack("!ii", server.received[0][:8])
+        assert length == len(server.received[0])
+        assert protocol == POSTGRES_PROTOCOL
+        assert b"user\x00test\x00database\x00db\x00" in server.received[0]
+
+    def test_postgres_starting_up(self, server):
+        """Test an error response means not ready."""
+        port = server(b"E\x00\x00\x00\x40SFATAL\x00C57P03\x00", read=64)
+
+        assert postgres_probe("127.0.0.1", port, "test", "db") is False
+
+    def test_mysql_ready(self, server):
+        """Test a protocol 10 handshake means ready."""
+        port = server(b"\x4a\x00\x00\x00\x0a8.0.36\x00")
+
+        assert mysql_probe("127.0.0.1", port) is True
+
+    def test_mysql_closed(self, server):
+        """Test a connection closed by the port proxy means not ready."""
+        port = server(b"")
+
+        assert mysql_probe("127.0.0.1", port) is False
+
+    def test_redis_ready(self, server):
+        """Test PONG means ready."""
+        port = server(b"+PONG\r\n", read=6)
+
+        assert redis_probe("127.0.0.1", port) is True
+        assert server.received == [b"PING\r\n"]
+
+    def test_redis_loading(self, server):
+        """Test Redis loading its dataset is not ready."""
+        port = server(b"-LOADING Redis is loading the dataset in memory\r\n", read=6)
+
+        assert redis_probe("127.0.0.1", port) is False
+
+    def test_redis_cluster_ok(self, server):
+        """Test a cluster serving every slot is ready."""
+        port = server(b"$40\r\ncluster_state:ok\r\ncluster_slots_assigned:16384\r\n", read=14)
+
+        assert redis_cluster_probe("127.0.0.1", port) is True
+        assert server.received == [b"CLUSTER INFO\r\n"]
+
+    def test_redis_cluster_forming(self, server):
+        """Test a cluster with unassigned slots is not ready."""
+        port = server(b"$40\r\ncluster_state:fail\r\ncluster_slots_assigned:0\r\n", read=14)
+
+        assert redis_cluster_probe("127.0.0.1", port) is False
+
+    def test_redis_sentinel_ready(self, server):
+        """Test a Sentinel that knows the master address is ready."""
+        port = server(b"*2\r\n$9\r\n127.0.0.1\r\n$4\r\n6379\r\n", read=64)
+
+        assert redis_sentinel_probe("127.0.0.1", port, "mymaster") is True
+        assert server.received == [b"SENTINEL get-master-addr-by-name mymaster\r\n"]
+
+    def test_redis_sentinel_unknown_master(self, server):
+        """Test a Sentinel without the master is not ready."""
+        port = server(b"*-1\r\n", read=64)
+
+        assert redis_sentinel_probe("127.0.0.1", port, "mymaster") is False
+
+
+class TestProviderReadiness:
+    """Test providers install their probe."""
+
+    def test_probe_installed(self):
+        """Test the probe replaces testcontainers' waits."""
+        provider = MockProvider("postgres")
+        provider.PORT = 5432
+        container = Mock()
+
+        provider.configure_container(container, {"ready_timeout": 5})
+
+        strategy = container.waiting_for.call_args.args[0]
+        assert isinstance(strategy, ProbeWaitStrategy)
+        assert strategy._startup_timeout == 5
+        assert container._connect() is None
+
+    def test_probe_disabled(self):
+        """Test readiness_probe: False keeps testcontainers' waits."""
+        provider = MockProvider("postgres")
+        provider.PORT = 5432
+        container = Mock()
+
+        provider.configure_container(container, {"readiness_probe": False})
+
+        assert not container.waiting_for.called
+
+    def test_wait_strategy_records_wait(self):
+        """Test the strategy probes the published port and records the wait."""
+        provider = MockProvider("postgres")
+        provider.probe_ready = Mock(side_effect=[False, True])
+        container = Mock()
+        container.get_container_host_ip.return_value = "127.0.0.1"
+        container.get_exposed_port.return_value = "49153"
+        strategy = ProbeWaitStrategy(provider, {}, 5432)
+
+        strategy.wait_until_ready(container)
+
+        container.get_exposed_port.assert_called_once_with(5432)
+        provider.probe_ready.assert_called_with("127.0.0.1", 49153, {})
+        assert strategy.waited is not None
+
+    def test_ready_phase_recorded(self):
+        """Test the probe wait is reported separately from the start."""
+        strategy = ProbeWaitStrategy(MockProvider("postgres"), {}, 5432)
+        strategy.waited = 0.5
+        container = Mock()
+        container._wait_strategy = strategy
+        manager = ContainerManager(MockSettings())
+
+        manager._start_container("postgres", container)
+
+        phases = {t.phase: t.seconds for t in manager.timings.phases}
+        assert phases["ready"] == 0.5
+        assert set(phases) == {"start", "ready"}
@@ -0,0 +1,333 @@
+"""Tests for RedisProvider."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from django.core.cache import CacheHandler
+from django.test import override_settings
+from docker.errors import APIError
+from redis.sentinel import SentinelConnectionPool
+from testcontainers.core.container import DockerContainer
+
+from django_testcontainers_plus.providers.redis import RedisProvider
+from tests.test_manager import MockSettings
+
+
+class TestRedisProvider:
+    """Test RedisProvider class."""
+
+    def test_get_worker_updates(self):
+        """Test each worker gets its own database index."""
+        updates = {
+            "CACHES": {"default": {"LOCATION": "redis://localhost:6379/0"}},
+            "CELERY_BROKER_URL": "redis://localhost:6379/0",
+            "CELERY_RESULT_BACKEND": "redis://localhost:6379/0",
+        }
+
+        worker_updates = RedisProvider().get_worker_updates(updates, {}, 3)
+
+        assert worker_updates["CACHES"]["default"]["LOCATION"] == "redis://localhost:6379/3"
+        assert worker_updates["CELERY_BROKER_URL"] == "redis://localhost:6379/3"
+        assert worker_updates["CELERY_RESULT_BACKEND"] == "redis://localhost:6379/3"
+        assert updates["CACHES"]["default"]["LOCATION"] == "redis://localhost:6379/0"
+
+    def test_get_worker_updates_out_of_databases(self):
+        """Test workers past the last database index are rejected rather than sharing one."""
+        updates = {"CACHES": {"default": {"LOCATION": "redis://localhost:6379/0"}}}
+
+        with pytest.raises(ValueError, match="gw16"):
+            RedisProvider().get_worker_updates(updates, {}, 16)
+
+        worker_updates = RedisProvider().get_worker_updates(updates, {"databases": 32}, 16)
+        assert worker_updates["CACHES"]["default"]["LOCATION"] == "redis://localhost:6379/16"
+
+    def test_database_count(self):
+        """Test the databases option is passed to the server."""
+        with patch("django_testcontainers_plus.providers.redis.RedisContainer") as container_cls:
+            RedisProvider().get_container({"databases": 32})
+
+        container_cls.return_value.with_command.assert_called_once_with(
+            ["redis-server", "--databases", "32"]
+        )
+
+    def test_get_worker_updates_custom_settings(self):
+        """Test custom update_settings are passed through unchanged."""
+        updates = {"MY_REDIS": "redis://localhost:6379/0"}
+
+        assert RedisProvider().get_worker_updates(updates, {"update_settings": updates}, 2) == (
+            updates
+        )
+
+    def test_lazy_resource(self):
+        """Test Redis starts on first cache use unless Celery needs it."""
+        provider = RedisProvider()
+
+        assert provider.get_lazy_resource(MockSettings()) == "caches"
+        assert (
+            provider.get_lazy_resource(MockSettings(CELERY_BROKER_URL="redis://localhost/0"))
+            is None
+        )
+
+
+class TestRedisFlush:
+    """Test flushing Redis databases between tests."""
+
+    UPDATES = {
+        "CACHES": {
+            "default": {"LOCATION": "redis://localhost:6379/3"},
+            "sessions": {"LOCATION": "redis://localhost:6379/3"},
+        },
+        "CELERY_BROKER_URL": "redis://localhost:6379/4",
+        "CELERY_RESULT_BACKEND": "redis://localhost:6379/4",
+    }
+
+    def test_disabled_by_default(self):
+        """Test nothing is flushed unless flush_between_tests is set."""
+        with patch("django_testcontainers_plus.providers.redis.redis.Redis") as redis_cls:
+            RedisProvider().reset_between_tests(self.UPDATES, {})
+
+        assert not redis_cls.called
+
+    def test_flushes_only_used_databases(self):
+        """Test each used index is flushed asynchronously in one pipeline."""
+        with patch("django_testcontainers_plus.providers.redis.redis.Redis") as redis_cls:
+            client = MagicMock()
+            redis_cls.return_value.__enter__.return_value = client
+
+            RedisProvider().reset_between_tests(self.UPDATES, {"flush_between_tests": True})
+
+        redis_cls.assert_called_once_with(host="localhost", port=6379)
+        pipe = client.pipeline.return_value
+        client.pipeline.assert_called_once_with(transaction=False)
+        selected = [c.args for c in pipe.execute_command.call_args_list]
+        assert selected == [("SELECT", 3), ("SELECT", 4)]
+        assert pipe.flushdb.call_count == 2
+        pipe.flushdb.assert_called_with(asynchronous=True)
+        pipe.execute.assert_called_once()
+
+
+def started_container(env):
+    """Mock a started topology container with the given environment."""
+    container = MagicMock()
+    container.get_container_host_ip.return_value = "127.0.0.1"
+    container.get_wrapped_container.return_value.attrs = {
+        "Config": {"Env": [f"{key}={value}" for key, value in env.items()]}
+    }
+    return container
+
+
+class TestRedisTopologies:
+    """Test the cluster and sentinel modes."""
+
+    SETTINGS = MockSettings(
+        CACHES={
+            "default": {"BACKEND": "django_redis.cache.RedisCache", "TIMEOUT": 60},
+            "local": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+        },
+        CELERY_BROKER_URL="redis://localhost:6379/0",
+    )
+
+    def test_unknown_mode(self):
+        """Test an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown Redis mode 'replicated'"):
+            RedisProvider().get_container({"mode": "replicated"})
+
+    @pytest.fixture
+    def docker_client(self):
+        """Create containers without a Docker daemon, on a Docker host at localhost."""
+        with patch("testcontainers.core.container.DockerClient") as client_cls:
+            client_cls.return_value.host.return_value = "localhost"
+            yield client_cls.return_value
+
+    def test_cluster_container(self, docker_client):
+        """Test cluster nodes and bus ports are published on the same port numbers."""
+        container = RedisProvider().get_container({"mode": "cluster", "ready_timeout": 5})
+
+        with patch(
+            "django_testcontainers_plus.providers.redis._free_ports",
+            return_value=[7000, 7001, 7002, 17000, 17001, 17002],
+        ):
+            container._configure()
+
+        assert container.env["REDIS_NODE_PORTS"] == "7000:17000 7001:17001 7002:17002"
+        assert container.env["REDIS_ANNOUNCE_IP"] == "127.0.0.1"
+        assert container.ports == {
+            str(port): port for port in (7000, 7001, 7002, 17000, 17001, 17002)
+        }
+        assert container._command[:2] == ["sh", "-c"]
+        assert container._wait_strategy.port == 7000
+
+    def test_cluster_needs_three_nodes(self, docker_client):
+        """Test clusters smaller than Redis accepts are rejected."""
+        with pytest.raises(ValueError, match="at least 3 nodes"):
+            RedisProvider().get_container({"mode": "cluster", "cluster_nodes": 2})
+
+    def test_retries_taken_ports(self, docker_client):
+        """Test a port taken on the Docker host is retried with new ports."""
+        container = RedisProvider().get_container({"mode": "sentinel"})
+        created = Mock()
+        attempts = []
+
+        def start(self):
+            self._configure()
+            attempts.append(self.env["REDIS_MASTER_PORT"])
+            if len(attempts) == 1:
+                self._container = created
+                raise APIError("Bind for 0.0.0.0:7100 failed: port is already allocated")
+            return self
+
+        with (
+            patch(
+                "django_testcontainers_plus.providers.redis._free_ports",
+                side_effect=[[7100, 7101], [7200, 7201]],
+            ),
+            patch.object(DockerContainer, "start", autospec=True, side_effect=start),
+        ):
+            container.start()
+
+        assert attempts == ["7100", "7200"]
+        assert container._wait_strategy.port == 7201
+        created.remove.assert_called_once_with(force=True)
+
+    def test_other_start_errors_not_retried(self, docker_client):
+        """Test Docker errors other than a taken port fail right away."""
+        container = RedisProvider().get_container({"mode": "sentinel"})
+
+        with (
+            patch.object(DockerContainer, "start", side_effect=APIError("no such image")) as start,
+            pytest.raises(APIError),
+        ):
+            container.start()
+
+        assert start.call_count == 1
+
+    def test_cluster_updates(self):
+        """Test caches get every node in LOCATION and Celery is left alone."""
+        container = started_container({"REDIS_NODE_PORTS": "7000:17000 7001:17001 7002:17002"})
+        settings = MockSettings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django_redis.cache.RedisCache",
+                    "OPTIONS": {"CLIENT_CLASS": "myproject.cache.RedisClusterClient"},
+                },
+            },
+            CELERY_BROKER_URL="redis://localhost:6379/0",
+        )
+
+        updates = RedisProvider().update_settings(container, settings, {"mode": "cluster"})
+
+        assert updates == {
+            "CACHES": {
+                "default": {
+                    **settings.CACHES["default"],
+                    "LOCATION": [
+                        "redis://127.0.0.1:7000",
+                        "redis://127.0.0.1:7001",
+                        "redis://127.0.0.1:7002",
+                    ],
+                }
+            }
+        }
+
+    @pytest.mark.parametrize(
+        "cache_config",
+        [
+            {"BACKEND": "django.core.cache.backends.redis.RedisCache"},
+            {"BACKEND": "django_redis.cache.RedisCache"},
+        ],
+    )
+    def test_cluster_rejects_single_node_backends(self, cache_config):
+        """Test backends that would treat the nodes as replicas are rejected."""
+        container = started_container({"REDIS_NODE_PORTS": "7000:17000 7001:17001 7002:17002"})
+        settings = MockSettings(CACHES={"default": cache_config})
+
+        with pytest.raises(ValueError, match="Cache 'default' uses"):
+            RedisProvider().update_settings(container, settings, {"mode": "cluster"})
+
+    def test_cluster_worker_key_prefix(self):
+        """Test workers share cluster database 0 under their own key prefix."""
+        updates = {"CACHES": {"default": {"LOCATION": ["redis://127.0.0.1:7000"]}}}
+
+        worker_updates = RedisProvider().get_worker_updates(updates, {"mode": "cluster"}, 2)
+
+        assert worker_updates["CACHES"]["default"] == {
+            "LOCATION": ["redis://127.0.0.1:7000"],
+            "KEY_PREFIX": "gw2",
+        }
+
+    def test_sentinel_updates(self):
+        """Test caches and Celery reach the master through the Sentinel."""
+        container = started_container(
+            {"REDIS_MASTER_PORT": "7100", "REDIS_SENTINEL_PORT": "7101", "REDIS_SERVICE": "main"}
+        )
+
+        updates = RedisProvider().update_settings(container, self.SETTINGS, {"mode": "sentinel"})
+
+        assert updates["CACHES"]["default"]["LOCATION"] == "redis://main/0"
+        assert updates["CACHES"]["default"]["OPTIONS"] == {
+            "CLIENT_CLASS": "django_redis.client.SentinelClient",
+            "CONNECTION_FACTORY": "django_redis.pool.SentinelConnectionFactory",
+            "SENTINELS": [("127.0.0.1", 7101)],
+        }
+        assert updates["CELERY_BROKER_URL"] == "sentinel://127.0.0.1:7101/0"
+        assert updates["CELERY_BROKER_TRANSPORT_OPTIONS"] == {"master_name": "main"}
+        assert updates["CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS"] == {"master_name": "main"}
+
+    def test_sentinel_cache_connects_through_sentinel(self):
+        """Test a cache built from the updated settings asks the Sentinel for the master."""
+        container = started_container(
+            {"REDIS_MASTER_PORT": "7100", "REDIS_SENTINEL_PORT": "7101", "REDIS_SERVICE": "main"}
+        )
+        updates = RedisProvider().update_settings(container, self.SETTINGS, {"mode": "sentinel"})
+
+        with override_settings(CACHES=updates["CACHES"]):
+            client = CacheHandler().create_connection("default").client.get_client(write=True)
+
+        pool = client.connection_pool
+        assert isinstance(pool, SentinelConnectionPool)
+        assert pool.service_name == "main"
+        sentinel = pool.sentinel_manager.sentinels[0].connection_pool.connection_kwargs
+        assert (sentinel["host"], sentinel["port"]) == ("127.0.0.1", 7101)
+
+    def test_sentinel_keeps_custom_client(self):
+        """Test a Sentinel-capable client configured by the project is kept."""
+        container = started_container(
+            {"REDIS_MASTER_PORT": "7100", "REDIS_SENTINEL_PORT": "7101", "REDIS_SERVICE": "main"}
+        )
+        settings = MockSettings(
+            CACHES={
+                "default": {
+                    "BACKEND": "django_redis.cache.RedisCache",
+                    "OPTIONS": {"CLIENT_CLASS": "myproject.cache.SentinelClient"},
+                }
+            }
+        )
+
+        updates = RedisProvider().update_settings(container, settings, {"mode": "sentinel"})
+
+        options = updates["CACHES"]["default"]["OPTIONS"]
+        assert options["CLIENT_CLASS"] == "myproject.cache.SentinelClient"
+
+    def test_sentinel_rejects_other_backends(self):
+        """Test caches that cannot connect through a Sentinel are rejected."""
+        container = started_container(
+            {"REDIS_MASTER_PORT": "7100", "REDIS_SENTINEL_PORT": "7101", "REDIS_SERVICE": "main"}
+        )
+        settings = MockSettings(
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}}
+        )
+
+        with pytest.raises(ValueError, match="cannot connect through a Redis Sentinel"):
+            RedisProvider().update_settings(container, settings, {"mode": "sentinel"})
+
+    def test_sentinel_worker_updates(self):
+        """Test workers get their own database index behind the Sentinel."""
+        updates = {
+            "CACHES": {"default": {"LOCATION": "redis://main/0"}},
+            "CELERY_BROKER_URL": "sentinel://127.0.0.1:7101/0",
+        }
+
+        worker_updates = RedisProvider().get_worker_updates(updates, {"mode": "sentinel"}, 3)
+
+        assert worker_updates["CACHES"]["default"]["LOCATION"] == "redis://main/3"
+        assert worker_updates["CELERY_BROKER_URL"] == "sentinel://127.0.0.1:7101/3"
@@ -0,0 +1,96 @@
+"""Tests for the lazy provider registry."""
+
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+from django_testcontainers_plus.detection import REDIS_RULES, DetectionRule
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.providers import BUILTIN_PROVIDERS, ProviderRegistry, ProviderSpec
+from tests.test_manager import MockProvider, MockSettings
+
+MINIO_SPEC = ProviderSpec(
+    "minio",
+    "tests.test_manager:MockProvider",
+    (DetectionRule("minio", "STORAGES", "BACKEND", ("s3",)),),
+)
+
+
+def entry_point(name, target):
+    """Build a fake entry point that loads to a target."""
+    point = Mock(value=f"plugin:{name}", load=Mock(return_value=target))
+    point.name = name
+    return point
+
+
+class TestProviderRegistry:
+    """Test ProviderRegistry."""
+
+    def test_package_import_is_lazy(self):
+        """Test importing the package imports no provider module."""
+        code = (
+            "import sys, django_testcontainers_plus; "
+            "print([m for m in sys.modules if m.startswith('django_testcontainers_plus.providers.')"
+            " and m.rsplit('.', 1)[1] in ('postgres', 'mysql', 'redis')])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_get_imports_once(self):
+        """Test a provider is imported on first use and then reused."""
+        registry = ProviderRegistry(BUILTIN_PROVIDERS, entry_point_group=None)
+
+        assert registry.loaded() == []
+        provider = registry.get("postgres")
+
+        assert provider.name == "postgres"
+        assert registry.get("postgres") is provider
+        assert registry.loaded() == [provider]
+        assert registry.get("unknown") is None
+
+    def test_entry_points(self):
+        """Test entry points may name a spec or a provider class."""
+
+        class PluginProvider(MockProvider):
+            DETECTION_RULES = REDIS_RULES
+
+            def __init__(self):
+                super().__init__("plugin")
+
+        points = [
+            entry_point("minio", MINIO_SPEC),
+            entry_point("plugin", PluginProvider),
+            entry_point("broken", object()),
+            entry_point("postgres", MINIO_SPEC),
+        ]
+
+        with patch(
+            "django_testcontainers_plus.providers.registry.entry_points", return_value=points
+        ):
+            registry = ProviderRegistry(BUILTIN_PROVIDERS)
+            specs = registry.specs()
+
+        assert [spec.name for spec in specs] == ["postgres", "mysql", "redis", "minio", "plugin"]
+        assert specs[-1].detection_rules == REDIS_RULES
+        assert [provider.name for provider in registry.loaded()] == ["plugin"]
+        points[-1].load.assert_not_called()
+
+
+class TestManagerRegistry:
+    """Test ContainerManager only imports the providers it needs."""
+
+    def test_only_needed_providers_loaded(self):
+        """Test detection runs on specs and imports the needed provider only."""
+        settings = MockSettings(STORAGES={"default": {"BACKEND": "storages.backends.s3.S3Storage"}})
+        manager = ContainerManager(settings)
+        manager.registry = ProviderRegistry(
+            [*BUILTIN_PROVIDERS, MINIO_SPEC], entry_point_group=None
+        )
+
+        needed = manager.detect_needed_containers()
+
+        assert [provider.name for provider in needed] == ["mock"]
+        assert manager.providers == needed
@@ -0,0 +1,196 @@
+"""Tests for container reuse between test sessions."""
+
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from django_testcontainers_plus import reuse
+from django_testcontainers_plus.manager import ContainerManager
+from tests.test_manager import MockProvider, MockSettings
+
+
+def make_docker_container(container_id, status="running", created="2024-01-01T00:00:00.0Z"):
+    """Build a mock docker SDK container with reuse labels."""
+    container = Mock()
+    container.id = container_id
+    container.name = f"name-{container_id}"
+    container.status = status
+    container.labels = {
+        reuse.LABEL_REUSE: "true",
+        reuse.LABEL_PROVIDER: "postgres",
+        reuse.LABEL_CONFIG_HASH: "abc",
+    }
+    container.attrs = {"Created": created}
+    container.image.tags = ["postgres:16"]
+    return container
+
+
+class TestConfigHash:
+    """Test config hashing."""
+
+    def test_stable(self):
+        """Test the hash does not depend on key order."""
+        assert reuse.config_hash("postgres", {"a": 1, "b": 2}) == reuse.config_hash(
+            "postgres", {"b": 2, "a": 1}
+        )
+
+    def test_ignores_manager_keys(self):
+        """Test keys that do not affect the container are ignored."""
+        assert reuse.config_hash("postgres", {"image": "x"}) == reuse.config_hash(
+            "postgres", {"image": "x", "reuse": True, "enabled": True}
+        )
+
+    def test_differs_by_config(self):
+        """Test different images give different hashes."""
+        assert reuse.config_hash("postgres", {"image": "postgres:15"}) != reuse.config_hash(
+            "postgres", {"image": "postgres:16"}
+        )
+
+
+class TestReuseHelpers:
+    """Test labelling, listing and pruning reusable containers."""
+
+    def test_label_container_keeps_existing_kwargs(self):
+        """Test labels are added without dropping other create kwargs."""
+        container = Mock()
+        container._kwargs = {"platform": "linux/amd64", "labels": {"team": "core"}}
+
+        reuse.label_container(container, "postgres", "abc")
+
+        kwargs = container.with_kwargs.call_args.kwargs
+        assert kwargs["platform"] == "linux/amd64"
+        assert kwargs["labels"]["team"] == "core"
+        assert kwargs["labels"][reuse.LABEL_CONFIG_HASH] == "abc"
+
+    def test_list_includes_last_used(self):
+        """Test listing reports when a container was last used."""
+        client = Mock()
+        client.containers.list.return_value = [make_docker_container("c1")]
+        reuse.mark_used("c1")
+
+        (info,) = reuse.list_reusable_containers(client)
+
+        assert info.provider == "postgres"
+        assert info.image == "postgres:16"
+        assert info.last_used is not None
+
+    def test_prune_idle(self):
+        """Test idle containers are removed and fresh ones kept."""
+        client = Mock()
+        client.containers.list.return_value = [
+            make_docker_container("old"),
+            make_docker_container("fresh"),
+        ]
+        reuse.write_json(reuse.STATE_FILE, {"old": time.time() - 100, "fresh": time.time()})
+
+        removed = reuse.prune_reusable_containers(client, idle_timeout=50)
+
+        assert [c.id for c in removed] == ["old"]
+        assert "old" not in reuse.read_json(reuse.STATE_FILE)
+
+    def test_prune_stopped(self):
+        """Test stopped containers are always removed."""
+        client = Mock()
+        client.containers.list.return_value = [make_docker_container("c1", status="exited")]
+        reuse.mark_used("c1")
+
+        removed = reuse.prune_reusable_containers(client)
+
+        assert len(removed) == 1
+
+
+class TestManagerReuse:
+    """Test ContainerManager in reuse mode."""
+
+    @pytest.fixture(autouse=True)
+    def docker_calls(self):
+        """Patch out pruning, usage tracking and the global Ryuk switch."""
+        with (
+            patch("django_testcontainers_plus.manager.prune_reusable_containers"),
+            patch("django_testcontainers_plus.manager.mark_used"),
+            patch("django_testcontainers_plus.manager.testcontainers_config"),
+        ):
+            yield
+
+    def test_attaches_to_running_container(self):
+        """Test a matching running container is attached instead of started."""
+        manager = ContainerManager(MockSettings(TESTCONTAINERS_OPTIONS={"reuse": True}))
+        manager.providers = [MockProvider("postgres")]
+        existing = Mock(id="existing-id")
+
+        with patch(
+            "django_testcontainers_plus.manager.find_reusable_container", return_value=existing
+        ):
+            manager.start_containers()
+
+        container = manager.active_containers["postgres"]
+        assert not container.start.called
+        assert container._container is existing
+
+    def test_starts_labelled_container_when_none_running(self):
+        """Test a new container is labelled and started when none matches."""
+        manager = ContainerManager(MockSettings(TESTCONTAINERS={"postgres": {"reuse": True}}))
+        manager.providers = [MockProvider("postgres")]
+
+        with (
+            patch("django_testcontainers_plus.manager.find_reusable_container", return_value=None),
+            patch("django_testcontainers_plus.manager.label_container") as label_container,
+        ):
+            manager.start_containers()
+
+        container = manager.active_containers["postgres"]
+        assert container.start.called
+        label_container.assert_called_once()
+        assert label_container.call_args.args[:2] == (container, "postgres")
+
+    def test_ryuk_disabled_before_eager_start(self):
+        """Test reuse by a lazy provider disables Ryuk before eager containers start."""
+        settings = MockSettings(
+            TESTCONTAINERS={"postgres": {"reuse": True}, "redis": {}},
+            TESTCONTAINERS_OPTIONS={"lazy": True},
+        )
+        manager = ContainerManager(settings)
+
+        class LazyProvider(MockProvider):
+            def get_lazy_resource(self, settings):
+                return "databases"
+
+        manager.providers = [LazyProvider("postgres"), MockProvider("redis")]
+
+        with patch("django_testcontainers_plus.manager.testcontainers_config") as config:
+            config.ryuk_disabled = False
+            manager.start_containers()
+
+        assert config.ryuk_disabled is True
+        assert list(manager.active_containers) == ["redis"]
+
+    def test_running_reaper_prevents_new_reusable_containers(self, caplog):
+        """Test new containers are not labelled for reuse while Ryuk already runs."""
+        manager = ContainerManager(MockSettings(TESTCONTAINERS_OPTIONS={"reuse": True}))
+        manager.providers = [MockProvider("postgres")]
+
+        with (
+            patch("django_testcontainers_plus.manager.Reaper._instance", Mock()),
+            patch("django_testcontainers_plus.manager.find_reusable_container", return_value=None),
+            patch("django_testcontainers_plus.manager.label_container") as label_container,
+        ):
+            manager.start_containers()
+
+        label_container.assert_not_called()
+        assert manager.reused_containers == set()
+        assert "Ryuk reaper is already running" in caplog.text
+
+    def test_reused_containers_left_running(self):
+        """Test reused containers are not stopped at teardown."""
+        manager = ContainerManager(MockSettings())
+        reused = Mock()
+        other = Mock()
+        manager.active_containers = {"postgres": reused, "redis": other}
+        manager.reused_containers = {"postgres"}
+
+        manager.stop_containers()
+
+        assert not reused.stop.called
+        assert other.stop.called
+        assert manager.reused_containers == set()
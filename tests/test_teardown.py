@@ -0,0 +1,166 @@
+"""Tests for container teardown."""
+
+import logging
+import sys
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from docker.errors import NotFound
+from testcontainers.core.exceptions import ContainerStartException
+
+from django_testcontainers_plus.cli import main
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.teardown import (
+    remove_containers,
+    remove_in_background,
+    stop_concurrently,
+)
+from tests.test_manager import MockSettings
+
+
+def make_container(container_id="abc123", stop=None):
+    """Build a mock container with an id."""
+    container = Mock()
+    container.get_container_id.return_value = container_id
+    if stop is not None:
+        container.stop.side_effect = stop
+    return container
+
+
+class TestStopConcurrently:
+    """Test stop_concurrently."""
+
+    def test_stops_in_parallel(self):
+        """Test containers are stopped at the same time rather than one by one."""
+        barrier = threading.Barrier(3, timeout=5)
+        containers = {name: make_container(stop=barrier.wait) for name in ("a", "b", "c")}
+
+        assert stop_concurrently(containers) == []
+        assert all(container.stop.called for container in containers.values())
+
+    def test_logs_failures(self, caplog):
+        """Test a failing container is logged and the others are still stopped."""
+        broken = make_container(stop=RuntimeError("gone"))
+        other = make_container()
+
+        with caplog.at_level(logging.WARNING):
+            failed = stop_concurrently({"postgres": broken, "redis": other})
+
+        assert failed == ["postgres"]
+        assert other.stop.called
+        assert "Could not stop postgres container" in caplog.text
+
+
+class TestRemoveInBackground:
+    """Test handing containers to the background teardown process."""
+
+    def test_spawns_detached_process(self):
+        """Test the started containers' ids are passed to a detached process."""
+        unstarted = Mock()
+        unstarted.get_container_id.side_effect = ContainerStartException("not started")
+
+        with patch("django_testcontainers_plus.teardown.subprocess.Popen") as popen:
+            assert remove_in_background({"postgres": make_container(), "redis": unstarted})
+
+        args, kwargs = popen.call_args
+        assert args[0] == [
+            sys.executable,
+            "-m",
+            "django_testcontainers_plus",
+            "remove",
+            "--log",
+            "abc123",
+        ]
+        assert kwargs["start_new_session"] is True
+
+    def test_spawn_failure(self):
+        """Test False is returned when the process cannot be started."""
+        with patch(
+            "django_testcontainers_plus.teardown.subprocess.Popen", side_effect=OSError("no fork")
+        ):
+            assert not remove_in_background({"postgres": make_container()})
+
+    def test_remove_containers(self):
+        """Test containers already gone count as removed, other failures do not."""
+        client = Mock()
+        gone = Mock()
+        gone.remove.side_effect = NotFound("gone")
+        broken = Mock()
+        broken.remove.side_effect = RuntimeError("daemon error")
+        client.containers.get.side_effect = {"ok": Mock(), "gone": gone, "broken": broken}.get
+
+        with patch("django_testcontainers_plus.teardown.DockerClient") as docker_client:
+            docker_client.return_value.client = client
+            assert remove_containers(["ok", "gone", "broken"]) == ["broken"]
+
+    def test_remove_command(self, capsys):
+        """Test the remove command reports failures in its exit code."""
+        with patch(
+            "django_testcontainers_plus.teardown.remove_containers", return_value=["abc123"]
+        ):
+            assert main(["remove", "abc123"]) == 1
+
+        assert "Could not remove container abc123" in capsys.readouterr().out
+
+
+class TestManagerTeardown:
+    """Test ContainerManager.stop_containers teardown modes."""
+
+    def test_concurrent_by_default(self):
+        """Test containers are stopped concurrently and the manager waits for them."""
+        manager = ContainerManager(MockSettings())
+        for name in ("a", "b"):
+            manager.active_containers[name] = make_container(stop=lambda: time.sleep(0.2))
+
+        start = time.monotonic()
+        manager.stop_containers()
+
+        assert time.monotonic() - start < 0.35
+        assert manager.active_containers == {}
+
+    def test_background(self):
+        """Test the background option hands containers off without stopping them."""
+        manager = ContainerManager(
+            MockSettings(TESTCONTAINERS_OPTIONS={"background_teardown": True})
+        )
+        container = make_container()
+        reused = make_container("reused")
+        manager.active_containers = {"postgres": container, "redis": reused}
+        manager.reused_containers = {"redis"}
+
+        with patch(
+            "django_testcontainers_plus.manager.remove_in_background", return_value=True
+        ) as remove:
+            manager.stop_containers()
+
+        assert list(remove.call_args.args[0]) == ["postgres"]
+        assert not container.stop.called
+        assert manager.active_containers == {}
+
+    def test_background_falls_back_to_waiting(self):
+        """Test containers are stopped in process when the handoff fails."""
+        manager = ContainerManager(
+            MockSettings(TESTCONTAINERS_OPTIONS={"background_teardown": True})
+        )
+        container = make_container()
+        manager.active_containers["postgres"] = container
+
+        with patch("django_testcontainers_plus.manager.remove_in_background", return_value=False):
+            manager.stop_containers()
+
+        assert container.stop.called
+
+    def test_wait_overrides_option(self):
+        """Test wait=True stops containers in process despite the option."""
+        manager = ContainerManager(
+            MockSettings(TESTCONTAINERS_OPTIONS={"background_teardown": True})
+        )
+        container = make_container()
+        manager.active_containers["postgres"] = container
+
+        with patch("django_testcontainers_plus.manager.remove_in_background") as remove:
+            manager.stop_containers(wait=True)
+
+        remove.assert_not_called()
+        assert container.stop.called
@@ -0,0 +1,84 @@
+"""Tests for template database snapshots."""
+
+from unittest.mock import Mock, patch
+
+from django_testcontainers_plus.fingerprint import migrations_fingerprint
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.templates import database_templates, template_key
+from tests.test_manager import MockProvider, MockSettings
+
+
+def make_manager(provider, config):
+    """Build a manager that serves the 'default' alias from a provider."""
+    manager = ContainerManager(MockSettings())
+    manager.providers = [provider]
+    manager.provider_configs = {provider.name: config}
+    manager.provider_updates = {provider.name: {"DATABASES": {"default": {}}}}
+    return manager
+
+
+class TestTemplateKey:
+    """Test template key computation."""
+
+    def test_migrations_fingerprint_stable(self):
+        """Test the migrations fingerprint is stable between calls."""
+        assert migrations_fingerprint() == migrations_fingerprint()
+
+    def test_key_changes_with_migrations(self):
+        """Test the key changes when migrations change."""
+        provider = MockProvider("postgres")
+        assert template_key(provider, {}, "default", "a") != template_key(
+            provider, {}, "default", "b"
+        )
+
+    def test_key_changes_with_config(self):
+        """Test the key changes when the provider config changes."""
+        provider = MockProvider("postgres")
+        assert template_key(provider, {"image": "postgres:15"}, "default", "a") != template_key(
+            provider, {"image": "postgres:16"}, "default", "a"
+        )
+
+
+class TestDatabaseTemplates:
+    """Test the database_templates context manager."""
+
+    def test_disabled_without_template_config(self):
+        """Test nothing is wrapped when templates are not enabled."""
+        manager = make_manager(MockProvider("postgres"), {})
+        connections = {"default": Mock()}
+        original = connections["default"].creation.create_test_db
+
+        with patch("django.db.connections", connections), database_templates(manager):
+            assert connections["default"].creation.create_test_db is original
+
+    def test_restored_database_is_kept(self):
+        """Test a restored database is not recreated."""
+        provider = MockProvider("postgres")
+        provider.restore_template_database = Mock(return_value=True)
+        provider.save_template_database = Mock()
+        manager = make_manager(provider, {"template": True})
+        connection = Mock()
+        create_test_db = Mock(return_value="test_default")
+        connection.creation.create_test_db = create_test_db
+
+        with patch("django.db.connections", {"default": connection}), database_templates(manager):
+            connection.creation.create_test_db(verbosity=0, keepdb=False)
+
+        assert create_test_db.call_args.kwargs["keepdb"] is True
+        assert not provider.save_template_database.called
+
+    def test_new_database_is_saved(self):
+        """Test a freshly migrated database is saved as a template."""
+        provider = MockProvider("postgres")
+        provider.restore_template_database = Mock(return_value=False)
+        provider.save_template_database = Mock()
+        manager = make_manager(provider, {"template": True})
+        connection = Mock()
+        create_test_db = Mock(return_value="test_default")
+        connection.creation.create_test_db = create_test_db
+
+        with patch("django.db.connections", {"default": connection}), database_templates(manager):
+            connection.creation.create_test_db(verbosity=0, keepdb=False)
+
+        assert create_test_db.call_args.kwargs["keepdb"] is False
+        provider.save_template_database.assert_called_once()
@@ -0,0 +1,119 @@
+"""Tests for startup timing instrumentation."""
+
+import json
+from unittest.mock import Mock, patch
+
+from django_testcontainers_plus.manager import ContainerManager
+from django_testcontainers_plus.timing import StartupTimings, database_creation_timings
+from tests.test_manager import MockProvider, MockSettings
+
+
+class FakeCreation:
+    """Stand-in for a Django DatabaseCreation object."""
+
+    def create_test_db(self, **kwargs):
+        return "test_default"
+
+
+class TestStartupTimings:
+    """Test StartupTimings."""
+
+    def test_record(self):
+        """Test phases are recorded in order, even when they raise."""
+        timings = StartupTimings()
+
+        with timings.record("postgres", "start"):
+            pass
+        try:
+            with timings.record("postgres", "update_settings"):
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert [t.phase for t in timings.phases] == ["start", "update_settings"]
+        assert all(t.seconds >= 0 for t in timings.phases)
+
+    def test_totals(self):
+        """Test durations are summed per container."""
+        timings = StartupTimings()
+        timings.add("postgres", "pull", 2.0)
+        timings.add("postgres", "start", 1.5)
+        timings.add("redis", "start", 0.5)
+
+        assert timings.totals() == {"postgres": 3.5, "redis": 0.5}
+
+    def test_format_table(self):
+        """Test the summary table has a header and one row per phase."""
+        timings = StartupTimings()
+        timings.add("postgres", "start", 1.234)
+
+        lines = timings.format_table().splitlines()
+
+        assert lines[0].split() == ["Container", "Phase", "Time"]
+        assert lines[1].split() == ["postgres", "start", "1.23s"]
+        assert StartupTimings().format_table() == ""
+
+    def test_write_json(self, tmp_path):
+        """Test timings are written as JSON."""
+        timings = StartupTimings()
+        timings.add("redis", "start", 0.5)
+
+        timings.write_json(tmp_path / "out" / "timings.json")
+
+        data = json.loads((tmp_path / "out" / "timings.json").read_text())
+        assert data["phases"] == [{"container": "redis", "phase": "start", "seconds": 0.5}]
+        assert data["totals"] == {"redis": 0.5}
+
+
+class TestManagerTimings:
+    """Test ContainerManager records its phases."""
+
+    def test_start_containers_records_phases(self):
+        """Test start and update_settings are recorded per container."""
+        manager = ContainerManager(MockSettings())
+        manager.providers = [MockProvider("postgres")]
+
+        manager.start_containers()
+
+        assert [(t.container, t.phase) for t in manager.timings.phases] == [
+            ("postgres", "start"),
+            ("postgres", "update_settings"),
+        ]
+
+    def test_save_timings(self, tmp_path):
+        """Test timings are written to the timings_file option with a suffix."""
+        path = tmp_path / "timings.json"
+        manager = ContainerManager(MockSettings(TESTCONTAINERS_OPTIONS={"timings_file": path}))
+        manager.timings.add("postgres", "start", 1.0)
+
+        manager.save_timings(".gw0")
+
+        assert (tmp_path / "timings.gw0.json").exists()
+
+    def test_save_timings_disabled(self, tmp_path):
+        """Test nothing is written without the timings_file option."""
+        manager = ContainerManager(MockSettings())
+
+        with patch.object(StartupTimings, "write_json") as write_json:
+            manager.save_timings()
+
+        assert not write_json.called
+
+    def test_database_creation_timings(self):
+        """Test test database creation is timed and the method restored."""
+        manager = ContainerManager(MockSettings())
+        manager.providers = [MockProvider("postgres")]
+        manager.provider_updates = {"postgres": {"DATABASES": {"default": {}}}}
+        connection = Mock()
+        connection.creation = FakeCreation()
+
+        with (
+            patch("django.db.connections", {"default": connection}),
+            database_creation_timings(manager),
+        ):
+            assert connection.creation.create_test_db(verbosity=0) == "test_default"
+
+        assert [(t.container, t.phase) for t in manager.timings.phases] == [
+            ("postgres", "create_db[default]")
+        ]
+        assert "create_test_db" not in vars(connection.creation)